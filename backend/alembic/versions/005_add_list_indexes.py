@@ -0,0 +1,66 @@
+"""Add composite indexes for the crud list queries
+
+Revision ID: 005_add_list_indexes
+Revises: 004_add_pms_tables
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_add_list_indexes'
+down_revision: Union[str, None] = '004_add_pms_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, columns) for every filter the crud list functions apply, each
+# followed by the (created_at, id) keyset ordering
+LIST_INDEXES = [
+    ('application', ['created_at', 'id']),
+    ('contact', ['created_at', 'id']),
+    ('contact', ['status', 'created_at', 'id']),
+    ('coursepurchase', ['created_at', 'id']),
+    ('coursepurchase', ['status', 'created_at', 'id']),
+    ('productinquiry', ['created_at', 'id']),
+    ('productinquiry', ['status', 'created_at', 'id']),
+    ('payment', ['created_at', 'id']),
+    ('payment', ['user_email', 'created_at', 'id']),
+    ('payment', ['status', 'created_at', 'id']),
+    ('notification', ['created_at', 'id']),
+    ('notification', ['recipient_email', 'created_at', 'id']),
+    ('notification', ['is_sent', 'created_at', 'id']),
+    ('projectrequest', ['created_at', 'id']),
+    ('projectrequest', ['status', 'created_at', 'id']),
+    ('projectrequest', ['email', 'created_at', 'id']),
+]
+
+
+def index_name(table: str, columns: list) -> str:
+    return f"ix_{table}_{'_'.join(columns)}"
+
+
+def upgrade() -> None:
+    # Some tables are created by SQLModel.metadata.create_all rather than a
+    # migration, so only index tables that exist and skip indexes already there
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for table, columns in LIST_INDEXES:
+        if table not in tables:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if index_name(table, columns) not in existing:
+            op.create_index(index_name(table, columns), table, columns, unique=False)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for table, columns in reversed(LIST_INDEXES):
+        if table not in tables:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if index_name(table, columns) in existing:
+            op.drop_index(index_name(table, columns), table_name=table)
@@ -0,0 +1,76 @@
+"""Store catalog list/dict fields in native JSON columns
+
+Revision ID: 006_json_columns
+Revises: 005_add_list_indexes
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = '006_json_columns'
+down_revision: Union[str, None] = '005_add_list_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, empty value) for every field that used to hold json.dumps text
+JSON_COLUMNS = [
+    ('project', 'tags', '[]'),
+    ('project', 'features', '[]'),
+    ('product', 'features', '[]'),
+    ('product', 'specs', '{}'),
+    ('projecttemplate', 'tech_stack', '[]'),
+    ('projecttemplate', 'demo_images', '[]'),
+]
+
+TECH_STACK_INDEX = 'ix_projecttemplate_tech_stack_gin'
+
+
+def existing_columns(inspector, tables):
+    return [
+        (table, column, empty) for table, column, empty in JSON_COLUMNS
+        if table in tables and column in {c['name'] for c in inspector.get_columns(table)}
+    ]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+    columns = existing_columns(inspector, tables)
+
+    if bind.dialect.name == 'postgresql':
+        for table, column, empty in columns:
+            # Blank or malformed text would make the cast fail
+            op.execute(
+                f"UPDATE {table} SET {column} = '{empty}' "
+                f"WHERE {column} IS NULL OR {column} = '' OR {column} !~ '^\\s*[\\[{{]'"
+            )
+            op.alter_column(table, column, type_=JSONB(), postgresql_using=f"{column}::jsonb",
+                            server_default=sa.text(f"'{empty}'::jsonb"))
+        if 'projecttemplate' in tables:
+            op.create_index(TECH_STACK_INDEX, 'projecttemplate', ['tech_stack'], postgresql_using='gin')
+        return
+
+    # SQLite stores JSON as TEXT already; only normalise values json_each() can't read
+    for table, column, empty in columns:
+        op.execute(f"UPDATE {table} SET {column} = '{empty}' WHERE {column} IS NULL OR json_valid({column}) = 0")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+    if 'projecttemplate' in tables:
+        existing = {index['name'] for index in inspector.get_indexes('projecttemplate')}
+        if TECH_STACK_INDEX in existing:
+            op.drop_index(TECH_STACK_INDEX, table_name='projecttemplate')
+    for table, column, _ in reversed(existing_columns(inspector, tables)):
+        op.alter_column(table, column, type_=sa.String(), postgresql_using=f"{column}::text",
+                        server_default=None)
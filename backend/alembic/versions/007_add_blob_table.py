@@ -0,0 +1,37 @@
+"""Add blob table for content-addressed uploads
+
+Revision ID: 007_add_blob_table
+Revises: 006_json_columns
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007_add_blob_table'
+down_revision: Union[str, None] = '006_json_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'blob',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('sha256', sa.String(), nullable=False),
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('path')
+    )
+    op.create_index('ix_blob_sha256', 'blob', ['sha256'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blob_sha256', table_name='blob')
+    op.drop_table('blob')
@@ -0,0 +1,24 @@
+"""Store blob paths as storage keys (blobs/...) instead of uploads/blobs/...
+
+Revision ID: 008_blob_storage_keys
+Revises: 007_add_blob_table
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008_blob_storage_keys'
+down_revision: Union[str, None] = '007_add_blob_table'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE blob SET path = substr(path, 9) WHERE path LIKE 'uploads/blobs/%'")
+
+
+def downgrade() -> None:
+    op.execute("UPDATE blob SET path = 'uploads/' || path WHERE path LIKE 'blobs/%'")
@@ -0,0 +1,39 @@
+"""Record image variants on blobs and srcsets on products and templates
+
+Revision ID: 009_image_variants
+Revises: 008_blob_storage_keys
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = '009_image_variants'
+down_revision: Union[str, None] = '008_blob_storage_keys'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, empty value)
+COLUMNS = [
+    ('blob', 'variants', '[]'),
+    ('product', 'image_srcset', '{}'),
+    ('projecttemplate', 'demo_image_srcsets', '{}'),
+]
+
+
+def upgrade() -> None:
+    postgresql = op.get_bind().dialect.name == 'postgresql'
+    json_type = sa.JSON().with_variant(JSONB(), 'postgresql')
+    for table, column, empty in COLUMNS:
+        default = sa.text(f"'{empty}'::jsonb") if postgresql else sa.text(f"'{empty}'")
+        op.add_column(table, sa.Column(column, json_type, nullable=False, server_default=default))
+
+
+def downgrade() -> None:
+    for table, column, _ in reversed(COLUMNS):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column(column)
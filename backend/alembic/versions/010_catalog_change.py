@@ -0,0 +1,30 @@
+"""Add catalogchange table holding the Last-Modified floor per catalog namespace
+
+Revision ID: 010_catalog_change
+Revises: 009_image_variants
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010_catalog_change'
+down_revision: Union[str, None] = '009_image_variants'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'catalogchange',
+        sa.Column('namespace', sa.String(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('namespace')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('catalogchange')
@@ -1,8 +1,20 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request, Response, status, UploadFile, File, Form
 from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
 from sqlmodel import Session
-from app.deps import get_db, get_current_admin
+from app.deps import get_db, get_current_admin, engine, async_engine, read_engine
+from app.codec import schema_response
+from app.pool import pool_status
+from app.pagination import CountMode, set_cursor_headers, set_total_count
+from app import blobs, cache, images, resumable
+from app.blobs import save_blob
+from app.materialized import refresh
+from app.storage import get_storage
+from app.uploads import ALLOWED_IMAGE_EXTENSIONS, ALLOWED_SOURCE_EXTENSIONS, ALLOWED_VIDEO_EXTENSIONS, file_too_large
+from app.snapshot import SnapshotInProgress, current_version, export_snapshot, list_versions
+from app.models import Application, ProjectRequest, Contact, CoursePurchase, ProductInquiry, Payment, Notification
 from app.auth import verify_password, create_access_token, get_password_hash
 from app.crud import (
     get_admin_by_username, get_applications, get_application_by_id, update_application,
@@ -20,7 +32,8 @@ from app.crud import (
     get_course_purchases, get_course_purchase_by_id, update_course_purchase,
     get_product_inquiries, get_product_inquiry_by_id, update_product_inquiry,
     get_payments, get_payment_by_id, update_payment,
-    create_notification, get_notifications, mark_notification_sent
+    create_notification, get_notifications, mark_notification_sent,
+    bulk_update_status, bulk_delete, get_application_resume_paths, delete_request_files
 )
 from app.schemas import (
     Token, ProjectCreate, ProjectRead, CourseCreate, CourseRead, InternshipCreate, InternshipRead,
@@ -29,13 +42,13 @@ from app.schemas import (
     ProjectTemplateCreate, ProjectTemplateRead, ProjectTemplateUpdate,
     ProjectRequestRead, ProjectRequestUpdate, ProjectFileCreate, ProjectFileRead,
     ContactRead, CoursePurchaseRead, CoursePurchaseUpdate, ProductInquiryRead, ProductInquiryUpdate,
-    PaymentRead, PaymentUpdate, NotificationCreate, NotificationRead
+    PaymentRead, PaymentUpdate, NotificationCreate, NotificationRead,
+    ApplicationBulkStatusUpdate, ProjectRequestBulkStatusUpdate, ContactBulkStatusUpdate,
+    CoursePurchaseBulkStatusUpdate, ProductInquiryBulkStatusUpdate, BulkDelete, BulkResult, UploadSessionCreate, UploadSessionRead,
+    DirectUploadCreate, DirectUploadRead, DirectUploadComplete
 )
 from app.config import settings
 from datetime import timedelta, datetime
-import json
-import os
-import aiofiles
 from pathlib import Path
 
 router = APIRouter()
@@ -58,12 +71,39 @@ def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db:
 # Applications endpoints
 @router.get("/applications", response_model=List[ApplicationRead])
 def read_applications(
+    response: Response,
     skip: int = 0, 
     limit: int = 100, 
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    return get_applications(db, skip=skip, limit=limit)
+    applications = get_applications(db, skip=skip, limit=limit, cursor=cursor)
+    set_cursor_headers(response, applications, limit, cursor, skip)
+    set_total_count(response, db, Application, count)
+    return schema_response(List[ApplicationRead], applications, response)
+
+@router.patch("/applications/bulk", response_model=BulkResult)
+def bulk_update_admin_applications(
+    bulk: ApplicationBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Set the status of many applications in one statement"""
+    return {"affected": bulk_update_status(db, Application, bulk.ids, bulk.status)}
+
+@router.post("/applications/bulk-delete", response_model=BulkResult)
+def bulk_delete_admin_applications(
+    bulk: BulkDelete,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Delete many applications in one statement"""
+    resumes = get_application_resume_paths(db, bulk.ids)
+    affected = bulk_delete(db, Application, bulk.ids)
+    blobs.release(db, *resumes)
+    return {"affected": affected}
 
 @router.get("/applications/{id}", response_model=ApplicationRead)
 def read_application(
@@ -96,16 +136,7 @@ def read_admin_projects(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    import json
-    projects = get_projects(db, skip=skip, limit=limit)
-    # Convert JSON strings to lists for proper Pydantic serialization
-    result = []
-    for project in projects:
-        project_dict = project.model_dump()
-        project_dict['tags'] = json.loads(project.tags) if isinstance(project.tags, str) else project.tags
-        project_dict['features'] = json.loads(project.features) if isinstance(project.features, str) else project.features
-        result.append(project_dict)
-    return result
+    return schema_response(List[ProjectRead], get_projects(db, skip=skip, limit=limit))
 
 @router.get("/projects/{id}", response_model=ProjectRead)
 def read_admin_project(
@@ -113,14 +144,10 @@ def read_admin_project(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    import json
     project = get_project_by_id(db, id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    project_dict = project.model_dump()
-    project_dict['tags'] = json.loads(project.tags) if isinstance(project.tags, str) else project.tags
-    project_dict['features'] = json.loads(project.features) if isinstance(project.features, str) else project.features
-    return project_dict
+    return project
 
 @router.post("/projects", response_model=ProjectRead)
 def create_new_project(
@@ -128,12 +155,9 @@ def create_new_project(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    import json
     db_project = create_project(db, project)
-    project_dict = db_project.model_dump()
-    project_dict['tags'] = json.loads(db_project.tags) if isinstance(db_project.tags, str) else db_project.tags
-    project_dict['features'] = json.loads(db_project.features) if isinstance(db_project.features, str) else db_project.features
-    return project_dict
+    refresh(db, cache.PROJECTS)
+    return db_project
 
 @router.put("/projects/{id}", response_model=ProjectRead)
 def update_existing_project(
@@ -145,10 +169,8 @@ def update_existing_project(
     db_project = update_project(db, id, project)
     if not db_project:
         raise HTTPException(status_code=404, detail="Project not found")
-    project_dict = db_project.model_dump()
-    project_dict['tags'] = json.loads(db_project.tags) if isinstance(db_project.tags, str) else db_project.tags
-    project_dict['features'] = json.loads(db_project.features) if isinstance(db_project.features, str) else db_project.features
-    return project_dict
+    refresh(db, cache.PROJECTS)
+    return db_project
 
 @router.delete("/projects/{id}")
 def delete_existing_project(
@@ -159,6 +181,7 @@ def delete_existing_project(
     success = delete_project(db, id)
     if not success:
         raise HTTPException(status_code=404, detail="Project not found")
+    refresh(db, cache.PROJECTS)
     return {"message": "Project deleted successfully"}
 
 # Courses endpoints
@@ -169,7 +192,7 @@ def read_admin_courses(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    return get_courses(db, skip=skip, limit=limit)
+    return schema_response(List[CourseRead], get_courses(db, skip=skip, limit=limit))
 
 @router.get("/courses/{id}", response_model=CourseRead)
 def read_admin_course(
@@ -188,7 +211,9 @@ def create_new_course(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    return create_course(db, course)
+    db_course = create_course(db, course)
+    refresh(db, cache.COURSES)
+    return db_course
 
 @router.put("/courses/{id}", response_model=CourseRead)
 def update_existing_course(
@@ -200,6 +225,7 @@ def update_existing_course(
     db_course = update_course(db, id, course)
     if not db_course:
         raise HTTPException(status_code=404, detail="Course not found")
+    refresh(db, cache.COURSES)
     return db_course
 
 @router.delete("/courses/{id}")
@@ -211,6 +237,7 @@ def delete_existing_course(
     success = delete_course(db, id)
     if not success:
         raise HTTPException(status_code=404, detail="Course not found")
+    refresh(db, cache.COURSES)
     return {"message": "Course deleted successfully"}
 
 # Internships endpoints
@@ -221,7 +248,7 @@ def read_admin_internships(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    return get_internships(db, skip=skip, limit=limit)
+    return schema_response(List[InternshipRead], get_internships(db, skip=skip, limit=limit))
 
 @router.post("/internships", response_model=InternshipRead)
 def create_new_internship(
@@ -229,7 +256,9 @@ def create_new_internship(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    return create_internship(db, internship)
+    db_internship = create_internship(db, internship)
+    refresh(db, cache.INTERNSHIPS)
+    return db_internship
 
 @router.put("/internships/{id}", response_model=InternshipRead)
 def update_existing_internship(
@@ -241,6 +270,7 @@ def update_existing_internship(
     db_internship = update_internship(db, id, internship)
     if not db_internship:
         raise HTTPException(status_code=404, detail="Internship not found")
+    refresh(db, cache.INTERNSHIPS)
     return db_internship
 
 @router.delete("/internships/{id}")
@@ -252,6 +282,7 @@ def delete_existing_internship(
     success = delete_internship(db, id)
     if not success:
         raise HTTPException(status_code=404, detail="Internship not found")
+    refresh(db, cache.INTERNSHIPS)
     return {"message": "Internship deleted successfully"}
 
 # Products endpoints
@@ -263,10 +294,7 @@ def read_admin_product(
     product = get_product(db)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    product_dict = product.model_dump()
-    product_dict['features'] = json.loads(product.features) if isinstance(product.features, str) else product.features
-    product_dict['specs'] = json.loads(product.specs) if isinstance(product.specs, str) else product.specs
-    return product_dict
+    return product
 
 @router.put("/product", response_model=ProductRead)
 def update_existing_product(
@@ -274,14 +302,16 @@ def update_existing_product(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    db_product = update_product(db, product)
-    product_dict = db_product.model_dump()
-    product_dict['features'] = json.loads(db_product.features) if isinstance(db_product.features, str) else db_product.features
-    product_dict['specs'] = json.loads(db_product.specs) if isinstance(db_product.specs, str) else db_product.specs
-    return product_dict
+    previous = get_product(db)
+    previous_media = {previous.image, previous.brochure} if previous else set()
+    db_product = images.with_srcsets(db, update_product(db, product))
+    refresh(db, cache.PRODUCT)
+    blobs.release(db, *(previous_media - {db_product.image, db_product.brochure}))
+    return db_product
 
 @router.post("/product/upload-image")
 async def upload_product_image(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
@@ -292,19 +322,10 @@ async def upload_product_image(
         raise HTTPException(status_code=400, detail="Invalid file type. Allowed: JPG, PNG, WEBP")
     
     MAX_FILE_SIZE = 10 * 1024 * 1024
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="File too large (max 10MB)")
-    
-    upload_dir = Path("uploads/examples")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_path = upload_dir / f"product_{int(os.times().elapsed)}{file_ext}"
-    
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        await out_file.write(content)
     
-    return {"url": f"/uploads/examples/{file_path.name}"}
+    key = await save_blob(db, file, MAX_FILE_SIZE, file_ext)
+    background_tasks.add_task(images.generate_variants, db.get_bind(), key)
+    return {"url": blobs.url(key)}
 
 @router.post("/product/upload-brochure")
 async def upload_product_brochure(
@@ -318,19 +339,9 @@ async def upload_product_brochure(
         raise HTTPException(status_code=400, detail="Invalid file type. Allowed: PDF")
     
     MAX_FILE_SIZE = 20 * 1024 * 1024
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="File too large (max 20MB)")
     
-    upload_dir = Path("uploads")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_path = upload_dir / f"product_brochure_{int(os.times().elapsed)}{file_ext}"
-    
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        await out_file.write(content)
-    
-    return {"url": f"/uploads/{file_path.name}"}
+    key = await save_blob(db, file, MAX_FILE_SIZE, file_ext)
+    return {"url": blobs.url(key)}
 
 # Mission endpoints
 @router.get("/mission", response_model=MissionRead)
@@ -349,7 +360,9 @@ def update_admin_mission(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    return update_mission(db, mission)
+    db_mission = update_mission(db, mission)
+    refresh(db, cache.MISSION)
+    return db_mission
 
 # Content endpoints
 @router.get("/content", response_model=ContentRead)
@@ -378,7 +391,9 @@ def update_admin_content(
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
-    return update_content(db, content)
+    db_content = update_content(db, content)
+    refresh(db, cache.CONTENT)
+    return db_content
 
 # Logs endpoint
 @router.get("/logs")
@@ -441,6 +456,126 @@ def read_admin_logs(
         "health": health
     }
 
+# Database pool statistics
+@router.get("/database/pool")
+def read_pool_status(current_admin = Depends(get_current_admin)):
+    """Checked-out, idle and overflow connections and checkout wait times"""
+    pools = {"primary": pool_status(engine)}
+    if async_engine is not None:
+        pools["primary_async"] = pool_status(async_engine.sync_engine)
+    if read_engine is not engine:
+        pools["replica"] = pool_status(read_engine)
+    return pools
+
+# Resumable uploads (tus-style): create, PATCH chunks at Upload-Offset, HEAD for the offset, finalize
+OFFSET_CONTENT_TYPES = ("application/offset+octet-stream", "application/octet-stream")
+
+def upload_headers(session: dict) -> dict:
+    return {
+        "Tus-Resumable": resumable.TUS_VERSION,
+        "Upload-Offset": str(session["offset"]),
+        "Upload-Length": str(session["length"]),
+    }
+
+@router.post("/uploads", response_model=UploadSessionRead, status_code=status.HTTP_201_CREATED)
+def create_upload(
+    upload: UploadSessionCreate,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Start a resumable upload of length bytes for a template video or a project file"""
+    if upload.target == "template-video" and not get_project_template_by_id(db, upload.target_id):
+        raise HTTPException(status_code=404, detail="Project template not found")
+    if upload.target == "project-file" and not get_project_request_by_id(db, upload.target_id):
+        raise HTTPException(status_code=404, detail="Project request not found")
+    session = resumable.create(**upload.model_dump())
+    response.headers.update(upload_headers(session))
+    response.headers["Location"] = f"/api/admin/uploads/{session['id']}"
+    return session
+
+@router.get("/uploads/{upload_id}", response_model=UploadSessionRead)
+def read_upload(upload_id: str, response: Response, current_admin = Depends(get_current_admin)):
+    session = resumable.get(upload_id)
+    response.headers.update(upload_headers(session))
+    return session
+
+@router.head("/uploads/{upload_id}")
+def read_upload_offset(upload_id: str, current_admin = Depends(get_current_admin)):
+    """Where to resume: the Upload-Offset header"""
+    return Response(status_code=200, headers=upload_headers(resumable.get(upload_id)))
+
+@router.patch("/uploads/{upload_id}")
+async def append_upload(
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(..., alias="Upload-Offset"),
+    current_admin = Depends(get_current_admin)
+):
+    """Append the request body at Upload-Offset; bytes received before a disconnect are kept"""
+    if request.headers.get("content-type", "").split(";")[0].strip() not in OFFSET_CONTENT_TYPES:
+        raise HTTPException(status_code=415, detail="Content-Type must be application/offset+octet-stream")
+    try:
+        offset = await resumable.append(upload_id, upload_offset, request.stream())
+    except ClientDisconnect:
+        # The part file is closed by now, so its size is what was kept
+        offset = resumable.get(upload_id)["offset"]
+    return Response(status_code=204, headers={"Tus-Resumable": resumable.TUS_VERSION, "Upload-Offset": str(offset)})
+
+@router.post("/uploads/{upload_id}/finalize")
+def finalize_upload(
+    upload_id: str,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Move a complete upload into place and attach it to its template or project request"""
+    session = resumable.get(upload_id)
+    if session["target"] == "template-video":
+        template_id = session["target_id"]
+        template = get_project_template_by_id(db, template_id)
+        if not template:
+            raise HTTPException(status_code=404, detail="Project template not found")
+        previous_video = template.demo_video
+        key, _, _ = resumable.finish(db, upload_id)
+        url = blobs.url(key)
+        update_project_template(db, template_id, ProjectTemplateUpdate(demo_video=url))
+        blobs.release(db, previous_video)
+        refresh(db, cache.PROJECT_TEMPLATES)
+        return {"url": url}
+
+    request_id = session["target_id"]
+    if not get_project_request_by_id(db, request_id):
+        raise HTTPException(status_code=404, detail="Project request not found")
+    key, _, _ = resumable.finish(db, upload_id)
+    db_file = create_project_file(db, ProjectFileCreate(
+        request_id=request_id,
+        file_url=blobs.file_url(key),
+        file_type=session["file_type"],
+        description=session.get("description")
+    ))
+    return {"url": db_file.file_url, "file": db_file.model_dump()}
+
+@router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_upload(upload_id: str, current_admin = Depends(get_current_admin)):
+    resumable.delete(upload_id)
+
+# Static catalog snapshots
+@router.get("/snapshots")
+def read_snapshots(current_admin = Depends(get_current_admin)):
+    return {"current": current_version(), "versions": list_versions()}
+
+@router.post("/snapshots", status_code=status.HTTP_201_CREATED)
+async def create_snapshot(
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Export every public catalog response to a new snapshot version and make it current"""
+    try:
+        manifest = await run_in_threadpool(export_snapshot, db)
+    except SnapshotInProgress:
+        raise HTTPException(status_code=409, detail="A snapshot export is already running")
+    return {"version": manifest["version"], "created_at": manifest["created_at"], "files": len(manifest["files"])}
+
 # Settings endpoint
 @router.put("/settings/password")
 def change_admin_password(
@@ -468,19 +603,12 @@ def read_admin_templates(
     skip: int = 0,
     limit: int = 100,
     category: Optional[str] = None,
+    tech: Optional[str] = None,
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
     """Get all project templates (admin)"""
-    import json
-    templates = get_project_templates(db, skip=skip, limit=limit, category=category, is_active=None)
-    result = []
-    for template in templates:
-        template_dict = template.model_dump()
-        template_dict['tech_stack'] = json.loads(template.tech_stack) if isinstance(template.tech_stack, str) else template.tech_stack
-        template_dict['demo_images'] = json.loads(template.demo_images) if isinstance(template.demo_images, str) else template.demo_images
-        result.append(template_dict)
-    return result
+    return schema_response(List[ProjectTemplateRead], get_project_templates(db, skip=skip, limit=limit, category=category, is_active=None, tech=tech))
 
 @router.get("/project-templates/{template_id}", response_model=ProjectTemplateRead)
 def read_admin_template(
@@ -489,14 +617,10 @@ def read_admin_template(
     current_admin = Depends(get_current_admin)
 ):
     """Get a specific project template (admin)"""
-    import json
     template = get_project_template_by_id(db, template_id)
     if not template:
         raise HTTPException(status_code=404, detail="Project template not found")
-    template_dict = template.model_dump()
-    template_dict['tech_stack'] = json.loads(template.tech_stack) if isinstance(template.tech_stack, str) else template.tech_stack
-    template_dict['demo_images'] = json.loads(template.demo_images) if isinstance(template.demo_images, str) else template.demo_images
-    return template_dict
+    return template
 
 @router.post("/project-templates", response_model=ProjectTemplateRead)
 def create_admin_template(
@@ -505,12 +629,13 @@ def create_admin_template(
     current_admin = Depends(get_current_admin)
 ):
     """Create a new project template"""
-    import json
-    db_template = create_project_template(db, template)
-    template_dict = db_template.model_dump()
-    template_dict['tech_stack'] = json.loads(db_template.tech_stack) if isinstance(db_template.tech_stack, str) else db_template.tech_stack
-    template_dict['demo_images'] = json.loads(db_template.demo_images) if isinstance(db_template.demo_images, str) else db_template.demo_images
-    return template_dict
+    db_template = images.with_srcsets(db, create_project_template(db, template))
+    refresh(db, cache.PROJECT_TEMPLATES)
+    return db_template
+
+def template_media(template) -> set:
+    """Uploaded files a template points at, released when it stops using them"""
+    return {path for path in [template.demo_video, *template.demo_images] if path}
 
 @router.put("/project-templates/{template_id}", response_model=ProjectTemplateRead)
 def update_admin_template(
@@ -520,14 +645,14 @@ def update_admin_template(
     current_admin = Depends(get_current_admin)
 ):
     """Update a project template"""
-    import json
-    db_template = update_project_template(db, template_id, template)
+    previous = get_project_template_by_id(db, template_id)
+    previous_media = template_media(previous) if previous else set()
+    db_template = images.with_srcsets(db, update_project_template(db, template_id, template))
     if not db_template:
         raise HTTPException(status_code=404, detail="Project template not found")
-    template_dict = db_template.model_dump()
-    template_dict['tech_stack'] = json.loads(db_template.tech_stack) if isinstance(db_template.tech_stack, str) else db_template.tech_stack
-    template_dict['demo_images'] = json.loads(db_template.demo_images) if isinstance(db_template.demo_images, str) else db_template.demo_images
-    return template_dict
+    refresh(db, cache.PROJECT_TEMPLATES)
+    blobs.release(db, *(previous_media - template_media(db_template)))
+    return db_template
 
 @router.delete("/project-templates/{template_id}")
 def delete_admin_template(
@@ -536,19 +661,18 @@ def delete_admin_template(
     current_admin = Depends(get_current_admin)
 ):
     """Delete a project template"""
-    success = delete_project_template(db, template_id)
-    if not success:
+    deleted = delete_project_template(db, template_id)
+    if not deleted:
         raise HTTPException(status_code=404, detail="Project template not found")
+    refresh(db, cache.PROJECT_TEMPLATES)
+    blobs.release(db, *template_media(deleted))
     return {"message": "Project template deleted successfully"}
 
 # Project Template File Uploads
-ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif'}
-ALLOWED_VIDEO_EXTENSIONS = {'.mp4', '.webm', '.ogg', '.mov'}
-ALLOWED_SOURCE_EXTENSIONS = {'.zip', '.rar', '.7z', '.tar', '.gz'}
-
 @router.post("/project-templates/{template_id}/upload-image")
 async def upload_template_image(
     template_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
@@ -564,19 +688,11 @@ async def upload_template_image(
         raise HTTPException(status_code=400, detail="Invalid file type. Allowed: JPG, PNG, WEBP, GIF")
     
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="File too large (max 10MB)")
-    
-    upload_dir = Path("uploads/project-templates/images")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_path = upload_dir / f"template_{template_id}_{int(os.times().elapsed)}{file_ext}"
-    
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        await out_file.write(content)
     
-    return {"url": f"/uploads/project-templates/images/{file_path.name}"}
+    key = await save_blob(db, file, MAX_FILE_SIZE, file_ext)
+    if file_ext != ".gif":  # variants would drop the animation
+        background_tasks.add_task(images.generate_variants, db.get_bind(), key)
+    return {"url": blobs.url(key)}
 
 @router.post("/project-templates/{template_id}/upload-video")
 async def upload_template_video(
@@ -596,19 +712,9 @@ async def upload_template_video(
         raise HTTPException(status_code=400, detail="Invalid file type. Allowed: MP4, WEBM, OGG, MOV")
     
     MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="File too large (max 100MB)")
     
-    upload_dir = Path("uploads/project-templates/videos")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_path = upload_dir / f"template_{template_id}_{int(os.times().elapsed)}{file_ext}"
-    
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        await out_file.write(content)
-    
-    return {"url": f"/uploads/project-templates/videos/{file_path.name}"}
+    key = await save_blob(db, file, MAX_FILE_SIZE, file_ext)
+    return {"url": blobs.url(key)}
 
 @router.post("/project-templates/{template_id}/upload-source")
 async def upload_template_source(
@@ -628,32 +734,48 @@ async def upload_template_source(
         raise HTTPException(status_code=400, detail="Invalid file type. Allowed: ZIP, RAR, 7Z, TAR, GZ")
     
     MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="File too large (max 50MB)")
-    
-    upload_dir = Path("uploads/project-templates/source")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_path = upload_dir / f"template_{template_id}_{int(os.times().elapsed)}{file_ext}"
     
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        await out_file.write(content)
-    
-    return {"url": f"/uploads/project-templates/source/{file_path.name}"}
+    key = await save_blob(db, file, MAX_FILE_SIZE, file_ext)
+    return {"url": blobs.url(key)}
 
 # Project Requests Management
 @router.get("/project-requests", response_model=List[ProjectRequestRead])
 def read_admin_requests(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
     status: Optional[str] = None,
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
     """Get all project requests (admin)"""
-    requests = get_project_requests(db, skip=skip, limit=limit, status=status)
-    return [req.model_dump() for req in requests]
+    requests = get_project_requests(db, skip=skip, limit=limit, status=status, cursor=cursor)
+    set_cursor_headers(response, requests, limit, cursor, skip)
+    set_total_count(response, db, ProjectRequest, count, status=status)
+    return schema_response(List[ProjectRequestRead], requests, response)
+
+@router.patch("/project-requests/bulk", response_model=BulkResult)
+def bulk_update_admin_project_requests(
+    bulk: ProjectRequestBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Set the status of many project requests in one statement"""
+    return {"affected": bulk_update_status(db, ProjectRequest, bulk.ids, bulk.status)}
+
+@router.post("/project-requests/bulk-delete", response_model=BulkResult)
+def bulk_delete_admin_project_requests(
+    bulk: BulkDelete,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Delete many project requests and their files"""
+    file_urls = delete_request_files(db, bulk.ids)
+    affected = bulk_delete(db, ProjectRequest, bulk.ids)
+    blobs.release(db, *file_urls)
+    return {"affected": affected}
 
 @router.get("/project-requests/{request_id}", response_model=ProjectRequestRead)
 def read_admin_request(
@@ -701,7 +823,7 @@ def read_admin_request_files(
 ):
     """Get all files for a project request"""
     files = get_project_files(db, request_id)
-    return [file.model_dump() for file in files]
+    return schema_response(List[ProjectFileRead], files)
 
 @router.post("/project-requests/{request_id}/files")
 async def upload_request_file(
@@ -718,29 +840,14 @@ async def upload_request_file(
     if not request:
         raise HTTPException(status_code=404, detail="Project request not found")
     
-    # Validate file
     MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB limit
-    file.file.seek(0, 2)
-    size = file.file.tell()
-    file.file.seek(0)
-    
-    if size > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="File too large (max 50MB)")
     
-    # Save file
-    upload_dir = Path("uploads/project-files")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_path = upload_dir / f"{request_id}_{int(os.times().elapsed)}_{file.filename}"
-    
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        content = await file.read()
-        await out_file.write(content)
+    key = await save_blob(db, file, MAX_FILE_SIZE, Path(file.filename).suffix)
     
     # Create file record
     file_data = ProjectFileCreate(
         request_id=request_id,
-        file_url=str(file_path),
+        file_url=blobs.file_url(key),
         file_type=file_type,
         description=description
     )
@@ -748,6 +855,56 @@ async def upload_request_file(
     db_file = create_project_file(db, file_data)
     return db_file.model_dump()
 
+# Direct-to-storage uploads: the browser PUTs the bytes to a presigned URL, the API only records them
+PROJECT_FILE_MAX_SIZE = resumable.TARGETS["project-file"].max_size
+
+@router.post("/project-requests/{request_id}/files/presign", response_model=DirectUploadRead)
+def presign_request_file(
+    request_id: int,
+    upload: DirectUploadCreate,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Where to PUT a file for a project request; no upload is needed if the bytes are stored already"""
+    if not get_project_request_by_id(db, request_id):
+        raise HTTPException(status_code=404, detail="Project request not found")
+    if upload.size > PROJECT_FILE_MAX_SIZE:
+        raise file_too_large(PROJECT_FILE_MAX_SIZE)
+    storage = get_storage()
+    key = blobs.blob_key(upload.sha256, Path(upload.filename).suffix)
+    expires = settings.STORAGE_PRESIGN_EXPIRES
+    if storage.exists(key):
+        return {"key": key, "exists": True, "expires_in": expires}
+    presigned = storage.presigned_put(key, upload.sha256, upload.size, upload.content_type, expires)
+    return {"key": key, "exists": False, "upload": presigned, "expires_in": expires}
+
+@router.post("/project-requests/{request_id}/files/complete")
+def complete_request_file(
+    request_id: int,
+    upload: DirectUploadComplete,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Record a file uploaded to a presigned URL"""
+    if not get_project_request_by_id(db, request_id):
+        raise HTTPException(status_code=404, detail="Project request not found")
+    digest = blobs.parse_key(upload.key)
+    if digest is None:
+        raise HTTPException(status_code=400, detail="Not an upload key")
+    size = get_storage().size(upload.key)
+    if size is None:
+        raise HTTPException(status_code=409, detail="Nothing has been uploaded to this key")
+    if size > PROJECT_FILE_MAX_SIZE:
+        raise file_too_large(PROJECT_FILE_MAX_SIZE)
+    blobs.reference_stored(db, upload.key, size)
+    db_file = create_project_file(db, ProjectFileCreate(
+        request_id=request_id,
+        file_url=blobs.file_url(upload.key),
+        file_type=upload.file_type,
+        description=upload.description
+    ))
+    return db_file.model_dump()
+
 @router.delete("/project-files/{file_id}")
 def delete_admin_file(
     file_id: int,
@@ -755,9 +912,10 @@ def delete_admin_file(
     current_admin = Depends(get_current_admin)
 ):
     """Delete a project file"""
-    success = delete_project_file(db, file_id)
-    if not success:
+    deleted = delete_project_file(db, file_id)
+    if not deleted:
         raise HTTPException(status_code=404, detail="Project file not found")
+    blobs.release(db, deleted.file_url)
     return {"message": "Project file deleted successfully"}
 
 # ============================================
@@ -766,15 +924,38 @@ def delete_admin_file(
 
 @router.get("/contacts", response_model=List[ContactRead])
 def read_admin_contacts(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
     status: Optional[str] = None,
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
     """Get all contact submissions"""
-    contacts = get_contacts(db, skip=skip, limit=limit, status=status)
-    return [contact.model_dump() for contact in contacts]
+    contacts = get_contacts(db, skip=skip, limit=limit, status=status, cursor=cursor)
+    set_cursor_headers(response, contacts, limit, cursor, skip)
+    set_total_count(response, db, Contact, count, status=status)
+    return schema_response(List[ContactRead], contacts, response)
+
+@router.patch("/contacts/bulk", response_model=BulkResult)
+def bulk_update_admin_contacts(
+    bulk: ContactBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Set the status of many contact submissions in one statement"""
+    return {"affected": bulk_update_status(db, Contact, bulk.ids, bulk.status)}
+
+@router.post("/contacts/bulk-delete", response_model=BulkResult)
+def bulk_delete_admin_contacts(
+    bulk: BulkDelete,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Delete many contact submissions in one statement"""
+    return {"affected": bulk_delete(db, Contact, bulk.ids)}
 
 @router.get("/contacts/{contact_id}", response_model=ContactRead)
 def read_admin_contact(
@@ -807,15 +988,38 @@ def update_admin_contact_status(
 
 @router.get("/course-purchases", response_model=List[CoursePurchaseRead])
 def read_admin_purchases(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
     status: Optional[str] = None,
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
     """Get all course purchase requests"""
-    purchases = get_course_purchases(db, skip=skip, limit=limit, status=status)
-    return [purchase.model_dump() for purchase in purchases]
+    purchases = get_course_purchases(db, skip=skip, limit=limit, status=status, cursor=cursor)
+    set_cursor_headers(response, purchases, limit, cursor, skip)
+    set_total_count(response, db, CoursePurchase, count, status=status)
+    return schema_response(List[CoursePurchaseRead], purchases, response)
+
+@router.patch("/course-purchases/bulk", response_model=BulkResult)
+def bulk_update_admin_course_purchases(
+    bulk: CoursePurchaseBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Set the status of many course purchases in one statement"""
+    return {"affected": bulk_update_status(db, CoursePurchase, bulk.ids, bulk.status)}
+
+@router.post("/course-purchases/bulk-delete", response_model=BulkResult)
+def bulk_delete_admin_course_purchases(
+    bulk: BulkDelete,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Delete many course purchases in one statement"""
+    return {"affected": bulk_delete(db, CoursePurchase, bulk.ids)}
 
 @router.get("/course-purchases/{purchase_id}", response_model=CoursePurchaseRead)
 def read_admin_purchase(
@@ -848,15 +1052,38 @@ def update_admin_purchase(
 
 @router.get("/product-inquiries", response_model=List[ProductInquiryRead])
 def read_admin_inquiries(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
     status: Optional[str] = None,
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
     """Get all product inquiries"""
-    inquiries = get_product_inquiries(db, skip=skip, limit=limit, status=status)
-    return [inquiry.model_dump() for inquiry in inquiries]
+    inquiries = get_product_inquiries(db, skip=skip, limit=limit, status=status, cursor=cursor)
+    set_cursor_headers(response, inquiries, limit, cursor, skip)
+    set_total_count(response, db, ProductInquiry, count, status=status)
+    return schema_response(List[ProductInquiryRead], inquiries, response)
+
+@router.patch("/product-inquiries/bulk", response_model=BulkResult)
+def bulk_update_admin_product_inquiries(
+    bulk: ProductInquiryBulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Set the status of many product inquiries in one statement"""
+    return {"affected": bulk_update_status(db, ProductInquiry, bulk.ids, bulk.status)}
+
+@router.post("/product-inquiries/bulk-delete", response_model=BulkResult)
+def bulk_delete_admin_product_inquiries(
+    bulk: BulkDelete,
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """Delete many product inquiries in one statement"""
+    return {"affected": bulk_delete(db, ProductInquiry, bulk.ids)}
 
 @router.get("/product-inquiries/{inquiry_id}", response_model=ProductInquiryRead)
 def read_admin_inquiry(
@@ -889,16 +1116,21 @@ def update_admin_inquiry(
 
 @router.get("/payments", response_model=List[PaymentRead])
 def read_admin_payments(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
     user_email: Optional[str] = None,
     status: Optional[str] = None,
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
     """Get all payments"""
-    payments = get_payments(db, skip=skip, limit=limit, user_email=user_email, status=status)
-    return [payment.model_dump() for payment in payments]
+    payments = get_payments(db, skip=skip, limit=limit, user_email=user_email, status=status, cursor=cursor)
+    set_cursor_headers(response, payments, limit, cursor, skip)
+    set_total_count(response, db, Payment, count, user_email=user_email, status=status)
+    return schema_response(List[PaymentRead], payments, response)
 
 @router.get("/payments/{payment_id}", response_model=PaymentRead)
 def read_admin_payment(
@@ -940,22 +1172,27 @@ def send_notification(
     
     # TODO: Implement actual email sending here using SMTP or service like SendGrid
     # For now, just mark as sent
-    mark_notification_sent(db, db_notification.id)
+    db_notification = mark_notification_sent(db, db_notification.id)
     
     return db_notification.model_dump()
 
 @router.get("/notifications", response_model=List[NotificationRead])
 def read_admin_notifications(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
     recipient_email: Optional[str] = None,
     is_sent: Optional[bool] = None,
     db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin)
 ):
     """Get all notifications"""
-    notifications = get_notifications(db, skip=skip, limit=limit, recipient_email=recipient_email, is_sent=is_sent)
-    return [notification.model_dump() for notification in notifications]
+    notifications = get_notifications(db, skip=skip, limit=limit, recipient_email=recipient_email, is_sent=is_sent, cursor=cursor)
+    set_cursor_headers(response, notifications, limit, cursor, skip)
+    set_total_count(response, db, Notification, count, recipient_email=recipient_email, is_sent=is_sent)
+    return schema_response(List[NotificationRead], notifications, response)
 
 @router.patch("/notifications/{notification_id}/mark-sent")
 def mark_notification_as_sent(
@@ -1,73 +1,113 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File, Form
+from fastapi.responses import FileResponse, RedirectResponse
 from sqlmodel import Session
-from app.deps import get_db
-from app.crud import get_projects, get_project_by_slug, get_courses, get_internships, get_products, create_application, get_mission, get_project_templates, get_project_template_by_id, create_project_request, get_project_requests, get_project_files, create_contact, create_course_purchase, create_product_inquiry, create_payment, get_payments
-from app.schemas import ProjectRead, CourseRead, InternshipRead, ProductRead, ApplicationCreate, MissionRead, ProjectTemplateRead, ProjectRequestCreate, ProjectRequestRead, ProjectFileRead, ContactCreate, CoursePurchaseCreate, ProductInquiryCreate, PaymentCreate, PaymentRead
+from app.deps import get_db, get_read_db, get_async_db, get_catalog_cache, get_sqlite_pragmas
+from app.config import settings
+from app.pagination import set_cursor_headers
+from app import cache
+from app.cache import TTLCache
+from app.codec import schema_response
+from app.conditional import conditional_response
+from app.http_cache import CATALOG, STATIC, cache_policy
+from app import materialized
+from app.materialized import dump, dump_all
+from app import async_crud
+from app import blobs
+from app.blobs import save_blob
+from app.async_crud import AnySession
+from app.storage import LocalStorage, get_storage, verify
+from app.crud import PROJECT_SUMMARY, PROJECT_TEMPLATE_SUMMARY, get_projects, get_project_by_slug, get_courses, get_internships, get_products, get_mission, get_project_templates, get_project_template_by_id, get_project_requests, get_project_files, get_project_file_by_id, get_payments
+from app.models import PROJECT_CATEGORIES
+from app.schemas import HomeBundleRead, ProjectRead, CourseRead, InternshipRead, ProductRead, ApplicationCreate, MissionRead, ProjectTemplateRead, ProjectRequestCreate, ProjectRequestRead, ProjectRequestUpdate, ProjectFileRead, ContactCreate, CoursePurchaseCreate, ProductInquiryCreate, PaymentCreate, PaymentRead
 import shutil
-import os
 from pathlib import Path
-import aiofiles
 
 router = APIRouter()
 
+FIELDS_HELP = "Comma-separated fields to return, or 'summary' for the list-page projection"
+
+def parse_fields(fields: Optional[str], schema, summary: Tuple[str, ...]) -> Optional[Tuple[str, ...]]:
+    """Validate a ?fields= value into a column tuple in schema order (id always included)"""
+    if not fields:
+        return None
+    requested = set(summary) if fields.strip() == "summary" else {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(schema.model_fields)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return tuple(name for name in schema.model_fields if name in requested)
+
 @router.get("/health")
-def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "aelvynor-backend"}
+def health_check(db: Session = Depends(get_db)):
+    """Health check endpoint, including the active SQLite PRAGMAs"""
+    health = {"status": "healthy", "service": "aelvynor-backend"}
+    if settings.is_sqlite:
+        health["database"] = {"engine": "sqlite", "pragmas": get_sqlite_pragmas(db)}
+    return health
 
 @router.get("/mission", response_model=MissionRead)
-def read_mission(db: Session = Depends(get_db)):
-    mission = get_mission(db)
+@cache_policy(CATALOG)
+def read_mission(request: Request, db: Session = Depends(get_read_db), catalog: TTLCache = Depends(get_catalog_cache)):
+    mission = materialized.load(catalog, db, (cache.MISSION,), MissionRead, lambda: dump(get_mission(db)))
     if not mission:
         raise HTTPException(status_code=404, detail="Mission not found")
-    return mission
+    return conditional_response(request, mission)
 
 @router.get("/projects", response_model=List[ProjectRead])
-def read_projects(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    import json
-    projects = get_projects(db, skip=skip, limit=limit)
-    # Convert JSON strings to lists for proper Pydantic serialization
-    result = []
-    for project in projects:
-        project_dict = project.model_dump()
-        project_dict['tags'] = json.loads(project.tags) if isinstance(project.tags, str) else project.tags
-        project_dict['features'] = json.loads(project.features) if isinstance(project.features, str) else project.features
-        result.append(project_dict)
-    return result
+@cache_policy(CATALOG)
+def read_projects(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[str] = Query(None, description=FIELDS_HELP),
+    db: Session = Depends(get_read_db),
+    catalog: TTLCache = Depends(get_catalog_cache)
+):
+    columns = parse_fields(fields, ProjectRead, PROJECT_SUMMARY)
+    if columns:
+        projects = materialized.load(
+            catalog, db, (cache.PROJECTS, skip, limit, columns), None,
+            lambda: get_projects(db, skip=skip, limit=limit, fields=columns),
+        )
+    else:
+        projects = materialized.load(
+            catalog, db, (cache.PROJECTS, skip, limit, None), List[ProjectRead],
+            lambda: dump_all(get_projects(db, skip=skip, limit=limit)),
+        )
+    return conditional_response(request, projects)
 
 @router.get("/projects/{slug}", response_model=ProjectRead)
-def read_project(slug: str, db: Session = Depends(get_db)):
-    import json
-    project = get_project_by_slug(db, slug=slug)
+@cache_policy(CATALOG)
+def read_project(slug: str, request: Request, db: Session = Depends(get_read_db), catalog: TTLCache = Depends(get_catalog_cache)):
+    project = materialized.load(catalog, db, (cache.PROJECTS, slug), ProjectRead, lambda: dump(get_project_by_slug(db, slug=slug)))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    # Convert JSON strings to lists
-    project_dict = project.model_dump()
-    project_dict['tags'] = json.loads(project.tags) if isinstance(project.tags, str) else project.tags
-    project_dict['features'] = json.loads(project.features) if isinstance(project.features, str) else project.features
-    return project_dict
+    return conditional_response(request, project)
 
 @router.get("/courses", response_model=List[CourseRead])
-def read_courses(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return get_courses(db, skip=skip, limit=limit)
+@cache_policy(CATALOG)
+def read_courses(request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db), catalog: TTLCache = Depends(get_catalog_cache)):
+    courses = materialized.load(catalog, db, (cache.COURSES, skip, limit), List[CourseRead], lambda: dump_all(get_courses(db, skip=skip, limit=limit)))
+    return conditional_response(request, courses)
 
 @router.get("/internships", response_model=List[InternshipRead])
-def read_internships(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return get_internships(db, skip=skip, limit=limit)
+@cache_policy(CATALOG)
+def read_internships(request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db), catalog: TTLCache = Depends(get_catalog_cache)):
+    internships = materialized.load(catalog, db, (cache.INTERNSHIPS, skip, limit), List[InternshipRead], lambda: dump_all(get_internships(db, skip=skip, limit=limit)))
+    return conditional_response(request, internships)
 
 @router.get("/product", response_model=List[ProductRead])
-def read_products(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    import json
-    products = get_products(db, skip=skip, limit=limit)
-    # Convert JSON strings to proper types for Pydantic serialization
-    result = []
-    for product in products:
-        product_dict = product.model_dump()
-        product_dict['features'] = json.loads(product.features) if isinstance(product.features, str) else product.features
-        product_dict['specs'] = json.loads(product.specs) if isinstance(product.specs, str) else product.specs
-        result.append(product_dict)
-    return result
+@cache_policy(CATALOG)
+def read_products(request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db), catalog: TTLCache = Depends(get_catalog_cache)):
+    products = materialized.load(catalog, db, (cache.PRODUCT, skip, limit), List[ProductRead], lambda: dump_all(get_products(db, skip=skip, limit=limit)))
+    return conditional_response(request, products)
+
+@router.get("/bundle/home", response_model=HomeBundleRead)
+@cache_policy(CATALOG)
+def read_home_bundle(request: Request, db: Session = Depends(get_read_db), catalog: TTLCache = Depends(get_catalog_cache)):
+    """Everything the landing page reads (the default catalog pages) in one response with one ETag"""
+    return conditional_response(request, materialized.load_home(catalog, db))
 
 @router.post("/apply")
 async def apply_for_position(
@@ -76,20 +116,13 @@ async def apply_for_position(
     phone: str = Form(...),
     applied_for: str = Form(...),
     resume: UploadFile = File(None),
-    db: Session = Depends(get_db)
+    db: AnySession = Depends(get_async_db)
 ):
     resume_path = ""
     
     # Handle file upload if provided
     if resume and resume.filename:
-        # Validate file size (5MB limit)
-        MAX_FILE_SIZE = 5 * 1024 * 1024
-        resume.file.seek(0, 2)
-        size = resume.file.tell()
-        resume.file.seek(0)
-        
-        if size > MAX_FILE_SIZE:
-            raise HTTPException(status_code=400, detail="File too large (max 5MB)")
+        MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB limit, enforced while saving
         
         # Validate file type
         ALLOWED_EXTENSIONS = {'.pdf', '.doc', '.docx'}
@@ -97,17 +130,7 @@ async def apply_for_position(
         if file_ext not in ALLOWED_EXTENSIONS:
             raise HTTPException(status_code=400, detail="Invalid file type. Allowed: PDF, DOC, DOCX")
         
-        # Save file
-        upload_dir = Path("uploads/resumes")
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        
-        file_path = upload_dir / f"{name.replace(' ', '_')}_{int(os.times().elapsed)}_{resume.filename}"
-        
-        async with aiofiles.open(file_path, 'wb') as out_file:
-            content = await resume.read()
-            await out_file.write(content)
-        
-        resume_path = str(file_path)
+        resume_path = blobs.file_url(await save_blob(db, resume, MAX_FILE_SIZE, file_ext))
     
     application_data = ApplicationCreate(
         name=name,
@@ -116,7 +139,7 @@ async def apply_for_position(
         applied_for=applied_for
     )
     
-    create_application(db, application_data, resume_path)
+    await async_crud.create_application(db, application_data, resume_path)
     
     return {"message": "Application submitted successfully"}
 
@@ -125,51 +148,45 @@ async def apply_for_position(
 # ============================================
 
 @router.get("/project-templates", response_model=List[ProjectTemplateRead])
+@cache_policy(CATALOG)
 def get_templates(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
     category: Optional[str] = None,
-    db: Session = Depends(get_db)
+    tech: Optional[str] = None,
+    fields: Optional[str] = Query(None, description=FIELDS_HELP),
+    db: Session = Depends(get_read_db),
+    catalog: TTLCache = Depends(get_catalog_cache)
 ):
-    """Get list of available project templates"""
-    import json
-    templates = get_project_templates(db, skip=skip, limit=limit, category=category, is_active=True)
-    result = []
-    for template in templates:
-        template_dict = template.model_dump()
-        template_dict['tech_stack'] = json.loads(template.tech_stack) if isinstance(template.tech_stack, str) else template.tech_stack
-        template_dict['demo_images'] = json.loads(template.demo_images) if isinstance(template.demo_images, str) else template.demo_images
-        result.append(template_dict)
-    return result
+    """Get list of available project templates, optionally only those using a given tech"""
+    columns = parse_fields(fields, ProjectTemplateRead, PROJECT_TEMPLATE_SUMMARY)
+    if columns:
+        templates = materialized.load(
+            catalog, db, (cache.PROJECT_TEMPLATES, skip, limit, category, tech, columns), None,
+            lambda: get_project_templates(db, skip=skip, limit=limit, category=category, is_active=True, tech=tech, fields=columns),
+        )
+    else:
+        templates = materialized.load(
+            catalog, db, (cache.PROJECT_TEMPLATES, skip, limit, category, tech, None), List[ProjectTemplateRead],
+            lambda: dump_all(get_project_templates(db, skip=skip, limit=limit, category=category, is_active=True, tech=tech)),
+        )
+    return conditional_response(request, templates)
 
 @router.get("/project-templates/{template_id}", response_model=ProjectTemplateRead)
-def get_template_by_id(template_id: int, db: Session = Depends(get_db)):
+@cache_policy(CATALOG)
+def get_template_by_id(template_id: int, request: Request, db: Session = Depends(get_read_db), catalog: TTLCache = Depends(get_catalog_cache)):
     """Get a specific project template by ID"""
-    import json
-    template = get_project_template_by_id(db, template_id)
-    if not template or not template.is_active:
+    template = materialized.load(catalog, db, (cache.PROJECT_TEMPLATES, template_id), ProjectTemplateRead, lambda: dump(get_project_template_by_id(db, template_id)))
+    if not template or not template.payload["is_active"]:
         raise HTTPException(status_code=404, detail="Project template not found")
-    template_dict = template.model_dump()
-    template_dict['tech_stack'] = json.loads(template.tech_stack) if isinstance(template.tech_stack, str) else template.tech_stack
-    template_dict['demo_images'] = json.loads(template.demo_images) if isinstance(template.demo_images, str) else template.demo_images
-    return template_dict
+    return conditional_response(request, template)
 
 @router.get("/project-templates/categories/list")
+@cache_policy(STATIC)
 def get_categories():
     """Get list of available project categories"""
-    return {
-        "categories": [
-            "BCA / MCA",
-            "Engineering",
-            "School",
-            "Company",
-            "IoT",
-            "AI/ML",
-            "Robotics",
-            "Web/Mobile",
-            "Custom"
-        ]
-    }
+    return {"categories": PROJECT_CATEGORIES}
 
 @router.post("/project-request")
 async def submit_project_request(
@@ -182,7 +199,7 @@ async def submit_project_request(
     custom_category: Optional[str] = Form(None),
     deadline: Optional[str] = Form(None),
     documents: Optional[List[UploadFile]] = File(None),
-    db: Session = Depends(get_db)
+    db: AnySession = Depends(get_async_db)
 ):
     """Submit a new project request"""
     from datetime import datetime
@@ -201,8 +218,6 @@ async def submit_project_request(
     if documents:
         MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB limit
         ALLOWED_EXTENSIONS = {'.pdf', '.doc', '.docx', '.zip', '.rar'}
-        upload_dir = Path("uploads/project-requests")
-        upload_dir.mkdir(parents=True, exist_ok=True)
         
         for doc in documents:
             if not doc.filename:
@@ -221,13 +236,7 @@ async def submit_project_request(
             if file_ext not in ALLOWED_EXTENSIONS:
                 continue
             
-            # Save file
-            file_path = upload_dir / f"{name.replace(' ', '_')}_{int(os.times().elapsed)}_{doc.filename}"
-            async with aiofiles.open(file_path, 'wb') as out_file:
-                content = await doc.read()
-                await out_file.write(content)
-            
-            uploaded_files.append(str(file_path))
+            uploaded_files.append(blobs.file_url(await save_blob(db, doc, MAX_FILE_SIZE, file_ext)))
     
     # Create request
     request_data = ProjectRequestCreate(
@@ -241,13 +250,12 @@ async def submit_project_request(
         deadline=deadline_date
     )
     
-    request = create_project_request(db, request_data)
+    request = await async_crud.create_project_request(db, request_data)
     
     # Store uploaded files info in notes for now (will be moved to project_files table later)
     if uploaded_files:
-        request.notes = f"Uploaded files: {', '.join(uploaded_files)}"
-        db.add(request)
-        db.commit()
+        notes = ProjectRequestUpdate(notes=f"Uploaded files: {', '.join(uploaded_files)}")
+        request = await async_crud.update_project_request(db, request.id, notes)
     
     return {
         "id": request.id,
@@ -255,17 +263,65 @@ async def submit_project_request(
         "status": request.status
     }
 
+# Per-user reads stay on the primary so a submission is visible immediately
 @router.get("/project-requests/{email}", response_model=List[ProjectRequestRead])
-def get_user_requests(email: str, db: Session = Depends(get_db)):
+def get_user_requests(
+    email: str,
+    response: Response,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
     """Get all project requests for a specific user (by email)"""
-    requests = get_project_requests(db, email=email)
-    return [req.model_dump() for req in requests]
+    requests = get_project_requests(db, limit=limit, email=email, cursor=cursor)
+    set_cursor_headers(response, requests, limit, cursor)
+    return schema_response(List[ProjectRequestRead], requests, response)
 
 @router.get("/project-requests/{request_id}/files", response_model=List[ProjectFileRead])
 def get_request_files(request_id: int, db: Session = Depends(get_db)):
     """Get all files associated with a project request"""
     files = get_project_files(db, request_id)
-    return [file.model_dump() for file in files]
+    return schema_response(List[ProjectFileRead], files)
+
+@router.get("/project-files/{file_id}/download")
+def download_project_file(file_id: int, db: Session = Depends(get_db)):
+    """Redirect to a short-lived download URL for a delivered file"""
+    db_file = get_project_file_by_id(db, file_id)
+    if not db_file:
+        raise HTTPException(status_code=404, detail="Project file not found")
+    storage = get_storage()
+    key = storage.key_for(db_file.file_url)
+    if key is None:
+        # Stored before the storage backends: a plain URL
+        return RedirectResponse(db_file.file_url if db_file.file_url.startswith("http") else f"/{db_file.file_url}")
+    filename = f"{db_file.file_type}-{db_file.id}{Path(key).suffix}"
+    return RedirectResponse(storage.presigned_get(key, settings.STORAGE_PRESIGN_EXPIRES, filename))
+
+# Presigned URLs of the local storage backend; S3 serves its own
+def local_storage() -> LocalStorage:
+    storage = get_storage()
+    if not isinstance(storage, LocalStorage):
+        raise HTTPException(status_code=404, detail="Not found")
+    return storage
+
+@router.put("/storage/{key:path}", status_code=201)
+async def put_storage_object(key: str, request: Request, sha256: str, size: int, expires: int, signature: str):
+    """Direct upload to a presigned URL (see POST /api/admin/project-requests/{id}/files/presign)"""
+    storage = local_storage()
+    if not verify(signature, expires, "PUT", key, sha256, size):
+        raise HTTPException(status_code=403, detail="Invalid or expired signature")
+    await storage.receive(key, sha256, size, request.stream())
+    return Response(status_code=201)
+
+@router.get("/storage/{key:path}")
+def get_storage_object(key: str, expires: int, signature: str, filename: Optional[str] = None):
+    storage = local_storage()
+    if not verify(signature, expires, "GET", key, filename or ""):
+        raise HTTPException(status_code=403, detail="Invalid or expired signature")
+    path = storage.path(key)
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Not found")
+    return FileResponse(path, filename=filename)
 
 # ============================================
 # Contact, Course Purchase, Product Inquiry, Payment
@@ -277,7 +333,7 @@ async def submit_contact(
     email: str = Form(...),
     phone: str = Form(...),
     message: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AnySession = Depends(get_async_db)
 ):
     """Submit contact form"""
     contact_data = ContactCreate(
@@ -287,7 +343,7 @@ async def submit_contact(
         message=message
     )
     
-    contact = create_contact(db, contact_data)
+    contact = await async_crud.create_contact(db, contact_data)
     
     return {
         "id": contact.id,
@@ -301,12 +357,11 @@ async def purchase_course(
     email: str = Form(...),
     phone: str = Form(...),
     course_id: int = Form(...),
-    db: Session = Depends(get_db)
+    db: AnySession = Depends(get_async_db)
 ):
     """Request course purchase"""
     # Verify course exists
-    from app.crud import get_course_by_id
-    course = get_course_by_id(db, course_id)
+    course = await async_crud.get_course_by_id(db, course_id)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
     
@@ -317,7 +372,7 @@ async def purchase_course(
         course_id=course_id
     )
     
-    purchase = create_course_purchase(db, purchase_data)
+    purchase = await async_crud.create_course_purchase(db, purchase_data)
     
     return {
         "id": purchase.id,
@@ -332,7 +387,7 @@ async def submit_product_inquiry(
     email: str = Form(...),
     company: str = Form(...),
     message: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AnySession = Depends(get_async_db)
 ):
     """Submit product inquiry"""
     inquiry_data = ProductInquiryCreate(
@@ -342,7 +397,7 @@ async def submit_product_inquiry(
         message=message
     )
     
-    inquiry = create_product_inquiry(db, inquiry_data)
+    inquiry = await async_crud.create_product_inquiry(db, inquiry_data)
     
     return {
         "id": inquiry.id,
@@ -357,7 +412,7 @@ async def create_new_payment(
     purpose: str = Form(...),
     reference_id: Optional[int] = Form(None),
     payment_method: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    db: AnySession = Depends(get_async_db)
 ):
     """Create new payment record"""
     payment_data = PaymentCreate(
@@ -368,11 +423,18 @@ async def create_new_payment(
         payment_method=payment_method
     )
     
-    payment = create_payment(db, payment_data)
+    payment = await async_crud.create_payment(db, payment_data)
     return payment.model_dump()
 
 @router.get("/payment/history/{email}", response_model=List[PaymentRead])
-def get_payment_history(email: str, db: Session = Depends(get_db)):
+def get_payment_history(
+    email: str,
+    response: Response,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
     """Get payment history for a user"""
-    payments = get_payments(db, user_email=email)
-    return [payment.model_dump() for payment in payments]
+    payments = get_payments(db, limit=limit, user_email=email, cursor=cursor)
+    set_cursor_headers(response, payments, limit, cursor)
+    return schema_response(List[PaymentRead], payments, response)
@@ -0,0 +1,63 @@
+"""
+Async variants of the crud functions used by the public async handlers.
+
+Each function delegates to the matching function in app.crud so the query logic
+lives in one place. With an AsyncSession (DATABASE_ASYNC=true) the call runs on
+the async driver via run_sync; with a regular Session it runs in the threadpool.
+Either way the event loop is never blocked on a commit.
+"""
+
+from typing import Any, Callable, Optional, Sequence, Union
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app import crud
+from app.schemas import ApplicationCreate, ProjectRequestCreate, ProjectRequestUpdate, ContactCreate, CoursePurchaseCreate, ProductInquiryCreate, PaymentCreate
+
+AnySession = Union[Session, AsyncSession]
+
+async def run_crud(db: AnySession, fn: Callable, *args: Any, **kwargs: Any):
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+# Reads
+async def get_projects(db: AnySession, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None):
+    return await run_crud(db, crud.get_projects, skip=skip, limit=limit, fields=fields)
+
+async def get_courses(db: AnySession, skip: int = 0, limit: int = 100):
+    return await run_crud(db, crud.get_courses, skip=skip, limit=limit)
+
+async def get_course_by_id(db: AnySession, course_id: int):
+    return await run_crud(db, crud.get_course_by_id, course_id)
+
+async def get_internships(db: AnySession, skip: int = 0, limit: int = 100):
+    return await run_crud(db, crud.get_internships, skip=skip, limit=limit)
+
+async def get_project_templates(db: AnySession, skip: int = 0, limit: int = 100, category: Optional[str] = None, is_active: Optional[bool] = True, tech: Optional[str] = None, fields: Optional[Sequence[str]] = None):
+    return await run_crud(db, crud.get_project_templates, skip=skip, limit=limit, category=category, is_active=is_active, tech=tech, fields=fields)
+
+async def get_payments(db: AnySession, skip: int = 0, limit: int = 100, user_email: Optional[str] = None, status: Optional[str] = None, cursor: Optional[str] = None):
+    return await run_crud(db, crud.get_payments, skip=skip, limit=limit, user_email=user_email, status=status, cursor=cursor)
+
+# Writes
+async def create_application(db: AnySession, application: ApplicationCreate, resume_path: str):
+    return await run_crud(db, crud.create_application, application, resume_path)
+
+async def create_project_request(db: AnySession, request: ProjectRequestCreate):
+    return await run_crud(db, crud.create_project_request, request)
+
+async def update_project_request(db: AnySession, request_id: int, request: ProjectRequestUpdate):
+    return await run_crud(db, crud.update_project_request, request_id, request)
+
+async def create_contact(db: AnySession, contact: ContactCreate):
+    return await run_crud(db, crud.create_contact, contact)
+
+async def create_course_purchase(db: AnySession, purchase: CoursePurchaseCreate):
+    return await run_crud(db, crud.create_course_purchase, purchase)
+
+async def create_product_inquiry(db: AnySession, inquiry: ProductInquiryCreate):
+    return await run_crud(db, crud.create_product_inquiry, inquiry)
+
+async def create_payment(db: AnySession, payment: PaymentCreate):
+    return await run_crud(db, crud.create_payment, payment)
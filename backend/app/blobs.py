@@ -0,0 +1,143 @@
+"""
+Content-addressed storage for uploaded files.
+
+An upload is hashed (SHA-256) while it streams to a staging file, then saved
+under the key blobs/<aa>/<bb>/<sha256><ext> in the storage backend (see
+app.storage). If that key already exists the bytes are stored already and the
+staged copy is dropped, so re-uploading a file costs one streamed read and no
+extra storage. Names can't collide: staging files get random names and keys
+are the content hash. Clients that upload straight to storage (presigned PUT)
+use the same keys, so they dedupe against server-side uploads too.
+
+Each upload that hands out a blob adds one reference (Blob.ref_count, keyed by
+Blob.path, which holds the storage key) before its bytes are committed; deleting the record that holds its
+URL releases it, and the object (with any image variants, see app.images) is
+removed with its last reference. URLs that predate the store aren't blobs and
+are left alone by release().
+"""
+
+import hashlib
+import mimetypes
+import re
+import secrets
+import shutil
+from pathlib import Path
+from typing import Optional, Tuple, Union
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
+from app import crud
+from app.async_crud import AnySession, run_crud
+from app.config import settings
+from app.storage import get_storage
+from app.uploads import save_upload
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+BLOB_KEY = re.compile(r"^blobs/([0-9a-f]{2})/([0-9a-f]{2})/([0-9a-f]{64})(\.[a-z0-9]+)?$")
+
+
+def blob_key(digest: str, extension: str) -> str:
+    return f"blobs/{digest[:2]}/{digest[2:4]}/{digest}{extension.lower()}"
+
+def parse_key(key: str) -> Optional[str]:
+    """The sha256 a well-formed blob key names, else None"""
+    match = BLOB_KEY.match(key)
+    if not match or match.group(3)[:2] != match.group(1) or match.group(3)[2:4] != match.group(2):
+        return None
+    return match.group(3)
+
+def url(key: str) -> str:
+    """URL stored on media fields (demo_images, image_url, ...)"""
+    return get_storage().url(key)
+
+def file_url(key: str) -> str:
+    """URL stored on ProjectFile.file_url and Application.resume_path: relative to the API for local storage"""
+    return url(key).lstrip("/")
+
+def staging_dir() -> Path:
+    return Path(settings.UPLOAD_SESSION_DIR) / ".incoming"
+
+def staging_path() -> Path:
+    staging = staging_dir()
+    staging.mkdir(parents=True, exist_ok=True)
+    return staging / secrets.token_hex(16)
+
+def _commit(staged: Path, key: str):
+    storage = get_storage()
+    if storage.exists(key):
+        staged.unlink()
+    else:
+        storage.save(staged, key, mimetypes.guess_type(key)[0])
+
+def commit(db: Session, staged: Path, digest: str, extension: str, size: int) -> str:
+    """Reference the blob, then store the staged bytes unless they are stored already.
+
+    The reference comes first: while it is held release() can't remove the
+    object, so the exists() check in _commit can't race a delete.
+    """
+    key = blob_key(digest, extension)
+    crud.add_blob_reference(db, digest, key, size)
+    try:
+        _commit(staged, key)
+    except Exception:
+        crud.release_blob_reference(db, key)
+        raise
+    return key
+
+def reference_stored(db: Session, key: str, size: int):
+    """Reference an object written straight to storage (presigned PUT)"""
+    crud.add_blob_reference(db, parse_key(key), key, size)
+    if not get_storage().exists(key):
+        # Its last reference was released between the client's PUT and now
+        crud.release_blob_reference(db, key)
+        raise HTTPException(status_code=409, detail="Nothing has been uploaded to this key")
+
+async def store_upload(file: UploadFile, max_size: int) -> Tuple[Path, str, int]:
+    """Stream an upload to a staging file; returns (staged path, sha256, size)"""
+    staged = staging_path()
+    hasher = hashlib.sha256()
+    size = await save_upload(file, staged, max_size, hasher=hasher)
+    return staged, hasher.hexdigest(), size
+
+def adopt(db: Session, source: Union[str, Path], extension: str) -> Tuple[str, str, int]:
+    """Move an existing file into the store (hashing it in chunks) and reference it; returns (key, sha256, size)"""
+    source = Path(source)
+    size = source.stat().st_size
+    hasher = hashlib.sha256()
+    with open(source, "rb") as stream:
+        while chunk := stream.read(HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+    staged = staging_path()
+    shutil.move(source, staged)
+    digest = hasher.hexdigest()
+    return commit(db, staged, digest, extension, size), digest, size
+
+async def save_blob(db: AnySession, file: UploadFile, max_size: int, extension: str) -> str:
+    """Store an upload and take a reference to it; returns its storage key"""
+    staged, digest, size = await store_upload(file, max_size)
+    key = blob_key(digest, extension)
+    await run_crud(db, crud.add_blob_reference, digest, key, size)
+    try:
+        # Storage writes block (S3 upload, local move + precompress): keep them off the loop
+        await run_in_threadpool(_commit, staged, key)
+    except Exception:
+        await run_crud(db, crud.release_blob_reference, key)
+        raise
+    return key
+
+def release(db: Session, *urls: str) -> int:
+    """Drop one reference per URL (as stored on records); returns objects removed"""
+    storage = get_storage()
+
+    def delete_object(blob):
+        storage.delete(blob.path)
+        for variant in blob.variants:
+            storage.delete(variant["key"])
+
+    removed = 0
+    for record_url in urls:
+        key = storage.key_for(record_url) if record_url else None
+        if key and crud.release_blob_reference(db, key, on_last=delete_object) == 0:
+            removed += 1
+    return removed
@@ -0,0 +1,115 @@
+"""
+In-process cache for the public catalog reads.
+
+Entries are keyed by (namespace, *args) and hold plain dicts, never ORM
+objects, so they outlive the session that loaded them. Each entry expires
+after CATALOG_CACHE_TTL seconds and the least recently used entry is evicted
+once CATALOG_CACHE_SIZE is reached. Admin writes drop a whole namespace, e.g.
+every cached projects page plus every cached project detail.
+
+With a read replica, a read right after an invalidation may still see the old
+rows, so entries loaded within READ_YOUR_WRITES_SECONDS of one only live that
+long.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+from app.config import settings
+
+# Namespaces used by the public router and invalidated by the admin router
+MISSION = "mission"
+PROJECTS = "projects"
+COURSES = "courses"
+INTERNSHIPS = "internships"
+PRODUCT = "product"
+PROJECT_TEMPLATES = "project-templates"
+CONTENT = "content"
+# The /api/bundle/home response, rebuilt whenever one of its parts changes
+HOME = "home"
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ttl seconds"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300, settle: float = 0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.settle = settle
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+        self._invalidated: Dict[Hashable, float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key: Tuple[Hashable, ...], value: Any):
+        with self._lock:
+            now = time.monotonic()
+            ttl = self.ttl
+            if now - self._invalidated.get(key[0], float("-inf")) < self.settle:
+                ttl = min(ttl, self.settle)
+            self._data[key] = (now + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key: Tuple[Hashable, ...], loader: Callable[[], Any]) -> Any:
+        """Return the cached value or call loader and cache its result (None is not cached)"""
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return loader()
+        found, value = self.get(key)
+        if found:
+            return value
+        value = loader()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def invalidate(self, *namespaces: str):
+        """Drop every entry whose key starts with one of the namespaces"""
+        with self._lock:
+            now = time.monotonic()
+            for namespace in namespaces:
+                self._invalidated[namespace] = now
+            for key in [key for key in self._data if key[0] in namespaces]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._invalidated.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+catalog_cache = TTLCache(
+    maxsize=settings.CATALOG_CACHE_SIZE,
+    ttl=settings.CATALOG_CACHE_TTL,
+    settle=settings.READ_YOUR_WRITES_SECONDS if settings.READ_DATABASE_URL else 0,
+)
+
+# Pass-through cache for reads that must see the primary's latest rows
+NO_CACHE = TTLCache(maxsize=0)
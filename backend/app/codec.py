@@ -0,0 +1,105 @@
+"""
+JSON codec shared by the API responses and the database JSON columns.
+
+Uses orjson when it is installed and FAST_JSON is enabled, otherwise the
+standard library with the same compact output.
+
+schema_response() is the list-endpoint path. crud rows are ORM objects that
+were already typed by their columns, so a List[Read] response is encoded
+straight from the rows' attributes (the Read schema's fields, in order)
+instead of model_dump -> response_model validation -> encoding; see
+scripts/bench_serialization.py.
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Union, get_args, get_origin
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from app.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def use_orjson() -> bool:
+    return orjson is not None and settings.FAST_JSON
+
+def dumps(value: Any) -> bytes:
+    if use_orjson():
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+def dumps_str(value: Any) -> str:
+    """dumps() for APIs that want text, e.g. SQLAlchemy's json_serializer"""
+    return dumps(value).decode("utf-8")
+
+def loads(data: Union[str, bytes]) -> Any:
+    if use_orjson():
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with the shared codec (orjson when available)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+_adapters: Dict[Any, TypeAdapter] = {}
+
+def schema_adapter(schema) -> TypeAdapter:
+    adapter = _adapters.get(schema)
+    if adapter is None:
+        adapter = _adapters[schema] = TypeAdapter(schema)
+    return adapter
+
+def encode_as(schema, value: Any) -> bytes:
+    """Validate value against schema once (ORM rows via from_attributes) and encode it"""
+    adapter = schema_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+_row_fields: Dict[Any, List[Tuple[str, Any]]] = {}
+
+def row_fields(model) -> List[Tuple[str, Any]]:
+    """(name, default) for each field of a Read schema"""
+    fields = _row_fields.get(model)
+    if fields is None:
+        fields = _row_fields[model] = [
+            (name, field.get_default(call_default_factory=True)) for name, field in model.model_fields.items()
+        ]
+    return fields
+
+def encode_rows(model, rows) -> bytes:
+    """Encode trusted ORM rows as a list of model, reading its fields off the rows without validation"""
+    fields = row_fields(model)
+    return dumps([{name: getattr(row, name, default) for name, default in fields} for row in rows])
+
+def _row_model(schema):
+    if get_origin(schema) is list:
+        (model,) = get_args(schema)
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            return model
+    return None
+
+def schema_response(schema, value: Any, response: Optional[Response] = None) -> Response:
+    """JSON response for value as schema, keeping headers set on the handler's injected response"""
+    model = _row_model(schema)
+    content = encode_rows(model, value) if model is not None else encode_as(schema, value)
+    encoded = Response(content=content, media_type="application/json")
+    if response is not None:
+        encoded.raw_headers.extend(response.headers.raw)
+    return encoded
@@ -0,0 +1,214 @@
+"""
+Response compression (gzip, and brotli when the brotli package is installed).
+
+CompressionMiddleware compresses responses whose content type is in the
+allowlist and whose body reaches COMPRESSION_MIN_SIZE. Uploaded text-like
+files get .br/.gz siblings written once by precompress(), and
+PrecompressedStaticFiles serves those instead of compressing on every request.
+"""
+
+import gzip
+import os
+import zlib
+from pathlib import Path
+from typing import List, Optional, Union
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# Uploads worth precompressing; images, PDFs and archives are compressed already
+TEXT_EXTENSIONS = {".json", ".txt", ".csv", ".md", ".html", ".htm", ".css", ".js", ".xml", ".svg"}
+
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+def accepted_encodings(accept_encoding: str) -> List[str]:
+    """Encodings from an Accept-Encoding header that we can produce, best first"""
+    offered = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            offered[name.strip()] = quality
+    supported = ["br", "gzip"] if brotli is not None else ["gzip"]
+    return [name for name in supported if offered.get(name, offered.get("*", 0)) > 0]
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.split(";")[0].strip().lower().startswith(COMPRESSIBLE_TYPES)
+
+
+class _Compressor:
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=level)
+        else:
+            # wbits=31: zlib stream with a gzip header and trailer
+            self._zlib = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data)
+        return self._zlib.compress(data)
+
+    def flush(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing allowlisted responses above a size threshold"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encodings = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        if not encodings:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponder(self, encodings[0])(scope, receive, send, self.app)
+
+
+class _CompressedResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send, app: ASGIApp):
+        self.send = send
+        await app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message):
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or not is_compressible(headers.get("content-type", ""))
+                or message["status"] < 200
+                or message["status"] in (204, 304)
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                # Hold the start message until we know the body size
+                self.start = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            if not more_body and len(body) < self.middleware.minimum_size:
+                await self.send(start)
+                await self.send(message)
+                self.passthrough = True
+                return
+            level = self.middleware.brotli_quality if self.encoding == "br" else self.middleware.gzip_level
+            self.compressor = _Compressor(self.encoding, level)
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            # A strong ETag names the uncompressed bytes; weak still matches If-None-Match
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                del headers["content-length"]
+                await self.send(start)
+            else:
+                compressed = self.compressor.compress(body) + self.compressor.flush()
+                headers["Content-Length"] = str(len(compressed))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.flush()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def precompress(path: Union[str, Path]) -> List[Path]:
+    """Write .br/.gz siblings for a text-like file when they are smaller; returns what was written"""
+    path = Path(path)
+    if path.suffix.lower() not in TEXT_EXTENSIONS or not path.is_file():
+        return []
+    data = path.read_bytes()
+    if len(data) < settings.COMPRESSION_MIN_SIZE:
+        return []
+    written = []
+    for encoding, suffix in PRECOMPRESSED:
+        if encoding == "br" and brotli is None:
+            continue
+        compressed = compress_bytes(data, encoding)
+        if len(compressed) < len(data):
+            sibling = path.with_name(path.name + suffix)
+            tmp = sibling.with_name(sibling.name + ".tmp")
+            tmp.write_bytes(compressed)
+            os.replace(tmp, sibling)
+            written.append(sibling)
+    return written
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves a file's .br/.gz sibling when the client accepts it"""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if not isinstance(response, FileResponse) or response.status_code != 200:
+            return response
+        response.headers.add_vary_header("Accept-Encoding")
+        for encoding in accepted_encodings(Headers(scope=scope).get("accept-encoding", "")):
+            suffix = dict(PRECOMPRESSED)[encoding]
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+            if stat_result is None or not os.path.isfile(full_path):
+                continue
+            compressed = self.file_response(full_path, stat_result, scope)
+            compressed.headers["Content-Type"] = response.headers["content-type"]
+            compressed.headers["Content-Encoding"] = encoding
+            compressed.headers.add_vary_header("Accept-Encoding")
+            return compressed
+        return response
@@ -0,0 +1,63 @@
+"""
+Conditional GET support (ETag / Last-Modified -> 304) for cached catalog payloads.
+
+The strong ETag is a SHA-256 of the serialized body, computed once when the
+cache entry is built, so a matching If-None-Match is answered from the cache
+without running the query or serializing the response. If-Modified-Since is
+only consulted when the request has no If-None-Match.
+
+Last-Modified is the newest row timestamp, floored by the namespace's last
+admin write as recorded in the database (CatalogChange), so every worker sends
+the same value for the same bytes. Entries with neither have no Last-Modified.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, NamedTuple, Optional
+from fastapi import Request, Response
+
+class CatalogEntry(NamedTuple):
+    payload: Any
+    body: bytes
+    etag: str
+    last_modified: Optional[datetime]
+
+def make_entry(payload: Any, body: bytes, modified_at: Optional[datetime]) -> CatalogEntry:
+    """Wrap dumped rows and their JSON body with validators"""
+    rows = payload if isinstance(payload, list) else [payload]
+    stamps = [row[column] for row in rows for column in ("updated_at", "created_at") if row.get(column)]
+    if modified_at:
+        stamps.append(modified_at)
+    digest = hashlib.sha256(body).hexdigest()
+    return CatalogEntry(payload, body, f'"{digest[:32]}"', max(stamps, default=None))
+
+def http_date(value: datetime) -> str:
+    # Naive datetimes in this app are UTC
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+    return False
+
+def conditional_response(request: Request, entry: CatalogEntry) -> Response:
+    """304 when the client's copy is current, otherwise the stored body with validators set"""
+    headers = {"ETag": entry.etag}
+    if entry.last_modified:
+        headers["Last-Modified"] = http_date(entry.last_modified)
+    if is_not_modified(request, entry.etag, entry.last_modified):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
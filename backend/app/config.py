@@ -1,6 +1,6 @@
 import os
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Optional, Union
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Aelvynor"
@@ -11,6 +11,78 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./aelvynor.db")
+    # Optional read replica for the public catalog endpoints
+    READ_DATABASE_URL: str = os.getenv("READ_DATABASE_URL", "")
+    # After an admin write, reads from that client go to the primary for this long
+    READ_YOUR_WRITES_SECONDS: int = int(os.getenv("READ_YOUR_WRITES_SECONDS", "10"))
+    # Use an async driver (aiosqlite / asyncpg) for the public write endpoints
+    DATABASE_ASYNC: bool = os.getenv("DATABASE_ASYNC", "false").lower() == "true"
+    
+    # Connection pool (not used for in-memory SQLite)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # seconds
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds, -1 disables
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    
+    # SQLite tuning profile, applied to every new connection (ignored for Postgres)
+    SQLITE_TUNING: bool = os.getenv("SQLITE_TUNING", "true").lower() == "true"
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE: int = int(os.getenv("SQLITE_CACHE_SIZE", "-64000"))  # negative = KiB
+    SQLITE_TEMP_STORE: str = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+    
+    # Serialize responses and JSON columns with orjson (falls back to json if not installed)
+    FAST_JSON: bool = os.getenv("FAST_JSON", "true").lower() == "true"
+    
+    # Response compression (brotli is used when the package is installed)
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # bytes
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+    
+    # In-process cache for the public catalog endpoints (0 disables)
+    CATALOG_CACHE_TTL: int = int(os.getenv("CATALOG_CACHE_TTL", "300"))  # seconds
+    CATALOG_CACHE_SIZE: int = int(os.getenv("CATALOG_CACHE_SIZE", "1024"))  # entries
+    
+    # Cache-Control for HTTP caches; catalog routes are public, the rest of the API no-store
+    HTTP_CACHE_ENABLED: bool = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+    HTTP_CACHE_MAX_AGE: int = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))  # seconds, browsers
+    HTTP_CACHE_S_MAXAGE: int = int(os.getenv("HTTP_CACHE_S_MAXAGE", "300"))  # seconds, shared caches
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = int(os.getenv("HTTP_CACHE_STALE_WHILE_REVALIDATE", "600"))
+    HTTP_CACHE_STALE_IF_ERROR: int = int(os.getenv("HTTP_CACHE_STALE_IF_ERROR", "86400"))
+    
+    # Uploads are streamed to disk in chunks; larger request bodies get 413 before parsing
+    UPLOAD_CHUNK_SIZE: int = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))  # bytes
+    MAX_REQUEST_BODY_SIZE: int = int(os.getenv("MAX_REQUEST_BODY_SIZE", str(110 * 1024 * 1024)))  # bytes, 0 disables
+    
+    # Where uploaded files are stored: "local" (STORAGE_LOCAL_ROOT, served under /uploads) or "s3"
+    STORAGE_BACKEND: str = os.getenv("STORAGE_BACKEND", "local")
+    STORAGE_LOCAL_ROOT: str = os.getenv("STORAGE_LOCAL_ROOT", "uploads")
+    STORAGE_LOCAL_URL: str = os.getenv("STORAGE_LOCAL_URL", "/uploads")
+    STORAGE_PRESIGN_EXPIRES: int = int(os.getenv("STORAGE_PRESIGN_EXPIRES", "900"))  # seconds presigned URLs stay valid
+    # S3-compatible object storage (AWS S3, MinIO, R2); needs boto3
+    S3_BUCKET: str = os.getenv("S3_BUCKET", "")
+    S3_ENDPOINT_URL: Optional[str] = os.getenv("S3_ENDPOINT_URL")  # e.g. http://localhost:9000 for MinIO
+    S3_REGION: Optional[str] = os.getenv("S3_REGION")
+    S3_ACCESS_KEY_ID: Optional[str] = os.getenv("S3_ACCESS_KEY_ID")
+    S3_SECRET_ACCESS_KEY: Optional[str] = os.getenv("S3_SECRET_ACCESS_KEY")
+    S3_PUBLIC_URL: Optional[str] = os.getenv("S3_PUBLIC_URL")  # CDN or bucket URL stored on records
+    # Resumable (tus-style) upload sessions; keep this directory outside uploads/, which is served
+    UPLOAD_SESSION_DIR: str = os.getenv("UPLOAD_SESSION_DIR", "upload-sessions")
+    UPLOAD_SESSION_TTL: int = int(os.getenv("UPLOAD_SESSION_TTL", str(24 * 60 * 60)))  # seconds idle before removal
+    
+    # Resized WebP/AVIF variants of product and template images, rendered in a process pool after upload (needs Pillow)
+    IMAGE_VARIANTS_ENABLED: bool = os.getenv("IMAGE_VARIANTS_ENABLED", "true").lower() == "true"
+    IMAGE_VARIANT_WIDTHS: str = os.getenv("IMAGE_VARIANT_WIDTHS", "320,640,1024,1600")  # pixels
+    IMAGE_VARIANT_FORMATS: str = os.getenv("IMAGE_VARIANT_FORMATS", "avif,webp")  # preferred first; AVIF needs Pillow >= 11.3
+    IMAGE_WORKERS: int = int(os.getenv("IMAGE_WORKERS", "2"))  # processes, 0 renders in a thread instead
+    
+    # Static snapshots of the public catalog (scripts/export_snapshot.py, POST /api/admin/snapshots)
+    SNAPSHOT_DIR: str = os.getenv("SNAPSHOT_DIR", "snapshots")
+    SNAPSHOT_KEEP: int = int(os.getenv("SNAPSHOT_KEEP", "5"))  # versions kept on disk
     
     # CORS
     CORS_ORIGINS: str = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:3001")
@@ -20,6 +92,53 @@ class Settings(BaseSettings):
         """Convert comma-separated CORS origins string to list"""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
     
+    @property
+    def image_variant_widths(self) -> List[int]:
+        return sorted(int(width) for width in self.IMAGE_VARIANT_WIDTHS.split(",") if width.strip())
+    
+    @property
+    def image_variant_formats(self) -> List[str]:
+        return [name.strip().lower() for name in self.IMAGE_VARIANT_FORMATS.split(",") if name.strip()]
+    
+    @property
+    def is_sqlite(self) -> bool:
+        return self.DATABASE_URL.startswith("sqlite")
+    
+    @property
+    def pool_options(self) -> Dict[str, Union[int, bool]]:
+        """Keyword arguments for create_engine's QueuePool"""
+        return {
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+        }
+    
+    @property
+    def sqlite_pragmas(self) -> Dict[str, Union[str, int]]:
+        """PRAGMAs applied on connect; busy_timeout first so the WAL switch can wait for locks"""
+        return {
+            "busy_timeout": self.SQLITE_BUSY_TIMEOUT_MS,
+            "journal_mode": self.SQLITE_JOURNAL_MODE,
+            "synchronous": self.SQLITE_SYNCHRONOUS,
+            "mmap_size": self.SQLITE_MMAP_SIZE,
+            "cache_size": self.SQLITE_CACHE_SIZE,
+            "temp_store": self.SQLITE_TEMP_STORE,
+        }
+    
+    @property
+    def async_database_url(self) -> str:
+        """DATABASE_URL rewritten to use the matching async driver"""
+        url = self.DATABASE_URL
+        if url.startswith("sqlite:"):
+            return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+        if url.startswith("postgres://"):
+            return url.replace("postgres://", "postgresql+asyncpg://", 1)
+        if url.startswith("postgresql://"):
+            return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        return url
+    
     class Config:
         case_sensitive = True
         env_file = ".env"
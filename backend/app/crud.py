@@ -1,9 +1,77 @@
-from sqlmodel import Session, select
-from app.models import Project, Course, Internship, Product, Application, Admin, Mission, Content, ProjectTemplate, ProjectRequest, ProjectFile, Contact, CoursePurchase, ProductInquiry, Payment, Notification
+from sqlmodel import Session, select, insert, update, delete
+from sqlalchemy import exists, func, select as select_columns, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import IntegrityError
+from app.models import Blob, CatalogChange, Project, Course, Internship, Product, Application, Admin, Mission, Content, ProjectTemplate, ProjectRequest, ProjectFile, Contact, CoursePurchase, ProductInquiry, Payment, Notification
 from app.schemas import ProjectCreate, CourseCreate, InternshipCreate, ProductCreate, ApplicationCreate, MissionCreate, ContentCreate, ApplicationUpdate, ProjectTemplateCreate, ProjectRequestCreate, ProjectRequestUpdate, ProjectFileCreate, ProjectTemplateUpdate, ContactCreate, CoursePurchaseCreate, CoursePurchaseUpdate, ProductInquiryCreate, ProductInquiryUpdate, PaymentCreate, PaymentUpdate, NotificationCreate
-from typing import Optional
+from app.pagination import paginate
+from typing import Callable, Dict, List, Optional, Sequence
 from datetime import datetime
-import json
+
+# JSON containment: JSONB @> on Postgres (served by the GIN index), json_each on SQLite.
+# The column type is a JSON variant, so coerce to JSONB explicitly; the generic
+# JSON comparator would compile contains() to LIKE.
+def json_array_contains(db: Session, column, value):
+    if db.get_bind().dialect.name == "postgresql":
+        return type_coerce(column, JSONB).contains([value])
+    elements = func.json_each(column).table_valued("value")
+    return exists(select(elements.c.value).where(elements.c.value == value))
+
+# Column projections (?fields=) for the catalog list pages: only the listed
+# columns are selected and rows come back as dicts instead of ORM objects
+PROJECT_SUMMARY = ("id", "title", "slug", "description", "image", "tags", "created_at")
+PROJECT_TEMPLATE_SUMMARY = ("id", "title", "category", "description", "tech_stack", "price", "time_duration", "created_at", "updated_at")
+
+def select_fields(model, fields: Optional[Sequence[str]] = None):
+    if not fields:
+        return select(model)
+    return select_columns(*(getattr(model, name) for name in fields))
+
+def fetch_fields(db: Session, statement, fields: Optional[Sequence[str]] = None):
+    rows = db.exec(statement).all()
+    if not fields:
+        return rows
+    return [dict(row._mapping) for row in rows]
+
+# Write helpers: a single INSERT/UPDATE ... RETURNING round trip instead of
+# add -> commit -> refresh. Falls back to the ORM path when the database has
+# no RETURNING support (SQLite < 3.35).
+def insert_returning(db: Session, db_obj):
+    model = type(db_obj)
+    if not db.get_bind().dialect.insert_returning:
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+    values = {
+        column.name: getattr(db_obj, column.name)
+        for column in model.__table__.columns
+        if not (column.primary_key and getattr(db_obj, column.name) is None)
+    }
+    row = db.exec(insert(model).values(**values).returning(model)).scalar_one()
+    # Detach so the commit does not expire the freshly returned attributes
+    db.expunge(row)
+    db.commit()
+    return row
+
+def update_returning(db: Session, model, id: int, values: dict):
+    if not values:
+        return db.get(model, id)
+    if not db.get_bind().dialect.update_returning:
+        db_obj = db.get(model, id)
+        if not db_obj:
+            return None
+        for key, value in values.items():
+            setattr(db_obj, key, value)
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+    row = db.exec(update(model).where(model.id == id).values(**values).returning(model)).scalar_one_or_none()
+    if row is not None:
+        db.expunge(row)
+    db.commit()
+    return row
 
 # Admin
 def get_admin_by_username(db: Session, username: str):
@@ -12,10 +80,7 @@ def get_admin_by_username(db: Session, username: str):
 
 def create_admin(db: Session, username: str, password_hash: str):
     db_admin = Admin(username=username, password_hash=password_hash)
-    db.add(db_admin)
-    db.commit()
-    db.refresh(db_admin)
-    return db_admin
+    return insert_returning(db, db_admin)
 
 # Mission
 def get_mission(db: Session):
@@ -23,26 +88,20 @@ def get_mission(db: Session):
 
 def create_mission(db: Session, mission: MissionCreate):
     db_mission = Mission(**mission.model_dump())
-    db.add(db_mission)
-    db.commit()
-    db.refresh(db_mission)
-    return db_mission
+    return insert_returning(db, db_mission)
 
 def update_mission(db: Session, mission: MissionCreate):
     db_mission = get_mission(db)
     if not db_mission:
         db_mission = create_mission(db, mission)
     else:
-        db_mission.short = mission.short
-        db_mission.long = mission.long
-        db.add(db_mission)
-        db.commit()
-        db.refresh(db_mission)
+        db_mission = update_returning(db, Mission, db_mission.id, mission.model_dump())
     return db_mission
 
 # Projects
-def get_projects(db: Session, skip: int = 0, limit: int = 100):
-    return db.exec(select(Project).offset(skip).limit(limit)).all()
+def get_projects(db: Session, skip: int = 0, limit: int = 100, fields: Optional[Sequence[str]] = None):
+    statement = select_fields(Project, fields)
+    return fetch_fields(db, statement.offset(skip).limit(limit), fields)
 
 def get_project_by_slug(db: Session, slug: str):
     return db.exec(select(Project).where(Project.slug == slug)).first()
@@ -51,32 +110,21 @@ def get_project_by_id(db: Session, project_id: int):
     return db.get(Project, project_id)
 
 def create_project(db: Session, project: ProjectCreate):
-    db_project = Project(
-        **project.model_dump(exclude={'tags', 'features'}),
-        tags=json.dumps(project.tags),
-        features=json.dumps(project.features)
-    )
-    db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
-    return db_project
+    db_project = Project(**project.model_dump())
+    return insert_returning(db, db_project)
 
 def update_project(db: Session, project_id: int, project: ProjectCreate):
-    db_project = get_project_by_id(db, project_id)
-    if not db_project:
-        return None
-    db_project.title = project.title
-    db_project.slug = project.slug
-    db_project.description = project.description
-    db_project.full_description = project.full_description
-    db_project.tags = json.dumps(project.tags)
-    db_project.features = json.dumps(project.features)
+    values = {
+        "title": project.title,
+        "slug": project.slug,
+        "description": project.description,
+        "full_description": project.full_description,
+        "tags": project.tags,
+        "features": project.features,
+    }
     if project.image:
-        db_project.image = project.image
-    db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
-    return db_project
+        values["image"] = project.image
+    return update_returning(db, Project, project_id, values)
 
 def delete_project(db: Session, project_id: int):
     db_project = get_project_by_id(db, project_id)
@@ -95,21 +143,10 @@ def get_course_by_id(db: Session, course_id: int):
 
 def create_course(db: Session, course: CourseCreate):
     db_course = Course(**course.model_dump())
-    db.add(db_course)
-    db.commit()
-    db.refresh(db_course)
-    return db_course
+    return insert_returning(db, db_course)
 
 def update_course(db: Session, course_id: int, course: CourseCreate):
-    db_course = get_course_by_id(db, course_id)
-    if not db_course:
-        return None
-    for key, value in course.model_dump().items():
-        setattr(db_course, key, value)
-    db.add(db_course)
-    db.commit()
-    db.refresh(db_course)
-    return db_course
+    return update_returning(db, Course, course_id, course.model_dump())
 
 def delete_course(db: Session, course_id: int):
     db_course = get_course_by_id(db, course_id)
@@ -128,21 +165,10 @@ def get_internship_by_id(db: Session, internship_id: int):
 
 def create_internship(db: Session, internship: InternshipCreate):
     db_internship = Internship(**internship.model_dump())
-    db.add(db_internship)
-    db.commit()
-    db.refresh(db_internship)
-    return db_internship
+    return insert_returning(db, db_internship)
 
 def update_internship(db: Session, internship_id: int, internship: InternshipCreate):
-    db_internship = get_internship_by_id(db, internship_id)
-    if not db_internship:
-        return None
-    for key, value in internship.model_dump().items():
-        setattr(db_internship, key, value)
-    db.add(db_internship)
-    db.commit()
-    db.refresh(db_internship)
-    return db_internship
+    return update_returning(db, Internship, internship_id, internship.model_dump())
 
 def delete_internship(db: Session, internship_id: int):
     db_internship = get_internship_by_id(db, internship_id)
@@ -163,32 +189,25 @@ def get_product(db: Session):
     return db.exec(select(Product)).first()
 
 def create_product(db: Session, product: ProductCreate):
-    db_product = Product(
-        **product.model_dump(exclude={'features', 'specs'}),
-        features=json.dumps(product.features),
-        specs=json.dumps(product.specs)
-    )
-    db.add(db_product)
-    db.commit()
-    db.refresh(db_product)
-    return db_product
+    db_product = Product(**product.model_dump())
+    return insert_returning(db, db_product)
 
 def update_product(db: Session, product: ProductCreate):
     db_product = get_product(db)
     if not db_product:
         db_product = create_product(db, product)
     else:
-        db_product.name = product.name
-        db_product.description = product.description
-        db_product.features = json.dumps(product.features)
-        db_product.specs = json.dumps(product.specs)
+        values = {
+            "name": product.name,
+            "description": product.description,
+            "features": product.features,
+            "specs": product.specs,
+        }
         if product.image:
-            db_product.image = product.image
+            values["image"] = product.image
         if product.brochure:
-            db_product.brochure = product.brochure
-        db.add(db_product)
-        db.commit()
-        db.refresh(db_product)
+            values["brochure"] = product.brochure
+        db_product = update_returning(db, Product, db_product.id, values)
     return db_product
 
 # Applications
@@ -198,27 +217,17 @@ def create_application(db: Session, application: ApplicationCreate, resume_path:
         resume_path=resume_path,
         status="pending"  # Explicitly set status
     )
-    db.add(db_application)
-    db.commit()
-    db.refresh(db_application)
-    return db_application
+    return insert_returning(db, db_application)
 
-def get_applications(db: Session, skip: int = 0, limit: int = 100):
-    return db.exec(select(Application).order_by(Application.created_at.desc()).offset(skip).limit(limit)).all()
+def get_applications(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+    return paginate(db, select(Application), Application, skip=skip, limit=limit, cursor=cursor)
 
 def get_application_by_id(db: Session, application_id: int):
     return db.get(Application, application_id)
 
 def update_application(db: Session, application_id: int, application_update: ApplicationUpdate):
-    db_application = get_application_by_id(db, application_id)
-    if not db_application:
-        return None
-    if application_update.status:
-        db_application.status = application_update.status
-    db.add(db_application)
-    db.commit()
-    db.refresh(db_application)
-    return db_application
+    values = {"status": application_update.status} if application_update.status else {}
+    return update_returning(db, Application, application_id, values)
 
 # Content
 def get_content(db: Session):
@@ -226,124 +235,78 @@ def get_content(db: Session):
 
 def create_content(db: Session, content: ContentCreate):
     db_content = Content(**content.model_dump())
-    db.add(db_content)
-    db.commit()
-    db.refresh(db_content)
-    return db_content
+    return insert_returning(db, db_content)
 
 def update_content(db: Session, content: ContentCreate):
     db_content = get_content(db)
     if not db_content:
         db_content = create_content(db, content)
     else:
-        for key, value in content.model_dump().items():
-            setattr(db_content, key, value)
-        db_content.updated_at = datetime.utcnow()
-        db.add(db_content)
-        db.commit()
-        db.refresh(db_content)
+        values = {**content.model_dump(), "updated_at": datetime.utcnow()}
+        db_content = update_returning(db, Content, db_content.id, values)
     return db_content
 
 # Admin
 def update_admin_password(db: Session, admin_id: int, new_password_hash: str):
-    admin = db.get(Admin, admin_id)
-    if not admin:
-        return None
-    admin.password_hash = new_password_hash
-    db.add(admin)
-    db.commit()
-    db.refresh(admin)
-    return admin
+    return update_returning(db, Admin, admin_id, {"password_hash": new_password_hash})
 
 # Projects Management System (PMS) CRUD
 
 # Project Templates
-def get_project_templates(db: Session, skip: int = 0, limit: int = 100, category: Optional[str] = None, is_active: Optional[bool] = True):
-    statement = select(ProjectTemplate)
+def get_project_templates(db: Session, skip: int = 0, limit: int = 100, category: Optional[str] = None, is_active: Optional[bool] = True, tech: Optional[str] = None, fields: Optional[Sequence[str]] = None):
+    statement = select_fields(ProjectTemplate, fields)
     if category:
         statement = statement.where(ProjectTemplate.category == category)
+    if tech:
+        statement = statement.where(json_array_contains(db, ProjectTemplate.tech_stack, tech))
     if is_active is not None:
         statement = statement.where(ProjectTemplate.is_active == is_active)
-    return db.exec(statement.offset(skip).limit(limit)).all()
+    return fetch_fields(db, statement.offset(skip).limit(limit), fields)
 
 def get_project_template_by_id(db: Session, template_id: int):
     return db.get(ProjectTemplate, template_id)
 
 def create_project_template(db: Session, template: ProjectTemplateCreate):
-    import json
-    db_template = ProjectTemplate(
-        title=template.title,
-        category=template.category,
-        description=template.description,
-        tech_stack=json.dumps(template.tech_stack) if template.tech_stack else "[]",
-        price=template.price,
-        time_duration=template.time_duration,
-        requirements=template.requirements,
-        demo_images=json.dumps(template.demo_images) if template.demo_images else "[]",
-        demo_video=template.demo_video,
-        is_active=template.is_active
-    )
-    db.add(db_template)
-    db.commit()
-    db.refresh(db_template)
-    return db_template
+    db_template = ProjectTemplate(**template.model_dump())
+    return insert_returning(db, db_template)
 
 def update_project_template(db: Session, template_id: int, template: ProjectTemplateUpdate):
-    import json
-    db_template = db.get(ProjectTemplate, template_id)
-    if not db_template:
-        return None
     update_data = template.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        if key in ['tech_stack', 'demo_images'] and value is not None:
-            setattr(db_template, key, json.dumps(value))
-        else:
-            setattr(db_template, key, value)
-    db_template.updated_at = datetime.utcnow()
-    db.add(db_template)
-    db.commit()
-    db.refresh(db_template)
-    return db_template
+    # JSON list columns are NOT NULL; an explicit null leaves them unchanged
+    for key in ['tech_stack', 'demo_images']:
+        if key in update_data and update_data[key] is None:
+            del update_data[key]
+    update_data["updated_at"] = datetime.utcnow()
+    return update_returning(db, ProjectTemplate, template_id, update_data)
 
 def delete_project_template(db: Session, template_id: int):
+    """The deleted template (so its media can be released), or False"""
     db_template = db.get(ProjectTemplate, template_id)
     if not db_template:
         return False
     db.delete(db_template)
     db.commit()
-    return True
+    return db_template
 
 # Project Requests
-def get_project_requests(db: Session, skip: int = 0, limit: int = 100, status: Optional[str] = None, email: Optional[str] = None):
+def get_project_requests(db: Session, skip: int = 0, limit: int = 100, status: Optional[str] = None, email: Optional[str] = None, cursor: Optional[str] = None):
     statement = select(ProjectRequest)
     if status:
         statement = statement.where(ProjectRequest.status == status)
     if email:
         statement = statement.where(ProjectRequest.email == email)
-    return db.exec(statement.order_by(ProjectRequest.created_at.desc()).offset(skip).limit(limit)).all()
+    return paginate(db, statement, ProjectRequest, skip=skip, limit=limit, cursor=cursor)
 
 def get_project_request_by_id(db: Session, request_id: int):
     return db.get(ProjectRequest, request_id)
 
 def create_project_request(db: Session, request: ProjectRequestCreate):
     db_request = ProjectRequest(**request.model_dump())
-    db.add(db_request)
-    db.commit()
-    db.refresh(db_request)
-    return db_request
+    return insert_returning(db, db_request)
 
 def update_project_request(db: Session, request_id: int, request: ProjectRequestUpdate):
-    db_request = db.get(ProjectRequest, request_id)
-    if not db_request:
-        return None
-    update_data = request.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_request, key, value)
-    db_request.updated_at = datetime.utcnow()
-    db.add(db_request)
-    db.commit()
-    db.refresh(db_request)
-    return db_request
+    update_data = {**request.model_dump(exclude_unset=True), "updated_at": datetime.utcnow()}
+    return update_returning(db, ProjectRequest, request_id, update_data)
 
 def delete_project_request(db: Session, request_id: int):
     db_request = db.get(ProjectRequest, request_id)
@@ -362,159 +325,208 @@ def get_project_file_by_id(db: Session, file_id: int):
 
 def create_project_file(db: Session, file: ProjectFileCreate):
     db_file = ProjectFile(**file.model_dump())
-    db.add(db_file)
-    db.commit()
-    db.refresh(db_file)
-    return db_file
+    return insert_returning(db, db_file)
 
 def delete_project_file(db: Session, file_id: int):
+    """The deleted file record (so its blob can be released), or False"""
     db_file = db.get(ProjectFile, file_id)
     if not db_file:
         return False
     db.delete(db_file)
     db.commit()
-    return True
+    return db_file
 
 # Contact
 def create_contact(db: Session, contact: ContactCreate):
     db_contact = Contact(**contact.model_dump(), status="new")
-    db.add(db_contact)
-    db.commit()
-    db.refresh(db_contact)
-    return db_contact
+    return insert_returning(db, db_contact)
 
-def get_contacts(db: Session, skip: int = 0, limit: int = 100, status: Optional[str] = None):
+def get_contacts(db: Session, skip: int = 0, limit: int = 100, status: Optional[str] = None, cursor: Optional[str] = None):
     statement = select(Contact)
     if status:
         statement = statement.where(Contact.status == status)
-    return db.exec(statement.order_by(Contact.created_at.desc()).offset(skip).limit(limit)).all()
+    return paginate(db, statement, Contact, skip=skip, limit=limit, cursor=cursor)
 
 def get_contact_by_id(db: Session, contact_id: int):
     return db.get(Contact, contact_id)
 
 def update_contact_status(db: Session, contact_id: int, status: str):
-    db_contact = db.get(Contact, contact_id)
-    if not db_contact:
-        return None
-    db_contact.status = status
-    db.add(db_contact)
-    db.commit()
-    db.refresh(db_contact)
-    return db_contact
+    return update_returning(db, Contact, contact_id, {"status": status})
 
 # Course Purchase
 def create_course_purchase(db: Session, purchase: CoursePurchaseCreate):
     db_purchase = CoursePurchase(**purchase.model_dump())
-    db.add(db_purchase)
-    db.commit()
-    db.refresh(db_purchase)
-    return db_purchase
+    return insert_returning(db, db_purchase)
 
-def get_course_purchases(db: Session, skip: int = 0, limit: int = 100, status: Optional[str] = None):
+def get_course_purchases(db: Session, skip: int = 0, limit: int = 100, status: Optional[str] = None, cursor: Optional[str] = None):
     statement = select(CoursePurchase)
     if status:
         statement = statement.where(CoursePurchase.status == status)
-    return db.exec(statement.order_by(CoursePurchase.created_at.desc()).offset(skip).limit(limit)).all()
+    return paginate(db, statement, CoursePurchase, skip=skip, limit=limit, cursor=cursor)
 
 def get_course_purchase_by_id(db: Session, purchase_id: int):
     return db.get(CoursePurchase, purchase_id)
 
 def update_course_purchase(db: Session, purchase_id: int, purchase: CoursePurchaseUpdate):
-    db_purchase = db.get(CoursePurchase, purchase_id)
-    if not db_purchase:
-        return None
-    update_data = purchase.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_purchase, key, value)
-    db.add(db_purchase)
-    db.commit()
-    db.refresh(db_purchase)
-    return db_purchase
+    return update_returning(db, CoursePurchase, purchase_id, purchase.model_dump(exclude_unset=True))
 
 # Product Inquiry
 def create_product_inquiry(db: Session, inquiry: ProductInquiryCreate):
     db_inquiry = ProductInquiry(**inquiry.model_dump(), status="new")
-    db.add(db_inquiry)
-    db.commit()
-    db.refresh(db_inquiry)
-    return db_inquiry
+    return insert_returning(db, db_inquiry)
 
-def get_product_inquiries(db: Session, skip: int = 0, limit: int = 100, status: Optional[str] = None):
+def get_product_inquiries(db: Session, skip: int = 0, limit: int = 100, status: Optional[str] = None, cursor: Optional[str] = None):
     statement = select(ProductInquiry)
     if status:
         statement = statement.where(ProductInquiry.status == status)
-    return db.exec(statement.order_by(ProductInquiry.created_at.desc()).offset(skip).limit(limit)).all()
+    return paginate(db, statement, ProductInquiry, skip=skip, limit=limit, cursor=cursor)
 
 def get_product_inquiry_by_id(db: Session, inquiry_id: int):
     return db.get(ProductInquiry, inquiry_id)
 
 def update_product_inquiry(db: Session, inquiry_id: int, inquiry: ProductInquiryUpdate):
-    db_inquiry = db.get(ProductInquiry, inquiry_id)
-    if not db_inquiry:
-        return None
-    update_data = inquiry.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_inquiry, key, value)
-    db.add(db_inquiry)
-    db.commit()
-    db.refresh(db_inquiry)
-    return db_inquiry
+    return update_returning(db, ProductInquiry, inquiry_id, inquiry.model_dump(exclude_unset=True))
 
 # Payment
 def create_payment(db: Session, payment: PaymentCreate):
     db_payment = Payment(**payment.model_dump())
-    db.add(db_payment)
-    db.commit()
-    db.refresh(db_payment)
-    return db_payment
+    return insert_returning(db, db_payment)
 
-def get_payments(db: Session, skip: int = 0, limit: int = 100, user_email: Optional[str] = None, status: Optional[str] = None):
+def get_payments(db: Session, skip: int = 0, limit: int = 100, user_email: Optional[str] = None, status: Optional[str] = None, cursor: Optional[str] = None):
     statement = select(Payment)
     if user_email:
         statement = statement.where(Payment.user_email == user_email)
     if status:
         statement = statement.where(Payment.status == status)
-    return db.exec(statement.order_by(Payment.created_at.desc()).offset(skip).limit(limit)).all()
+    return paginate(db, statement, Payment, skip=skip, limit=limit, cursor=cursor)
 
 def get_payment_by_id(db: Session, payment_id: int):
     return db.get(Payment, payment_id)
 
 def update_payment(db: Session, payment_id: int, payment: PaymentUpdate):
-    db_payment = db.get(Payment, payment_id)
-    if not db_payment:
-        return None
-    update_data = payment.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_payment, key, value)
-    db_payment.updated_at = datetime.utcnow()
-    db.add(db_payment)
-    db.commit()
-    db.refresh(db_payment)
-    return db_payment
+    update_data = {**payment.model_dump(exclude_unset=True), "updated_at": datetime.utcnow()}
+    return update_returning(db, Payment, payment_id, update_data)
 
 # Notification
 def create_notification(db: Session, notification: NotificationCreate):
     db_notification = Notification(**notification.model_dump())
-    db.add(db_notification)
-    db.commit()
-    db.refresh(db_notification)
-    return db_notification
+    return insert_returning(db, db_notification)
 
-def get_notifications(db: Session, skip: int = 0, limit: int = 100, recipient_email: Optional[str] = None, is_sent: Optional[bool] = None):
+def get_notifications(db: Session, skip: int = 0, limit: int = 100, recipient_email: Optional[str] = None, is_sent: Optional[bool] = None, cursor: Optional[str] = None):
     statement = select(Notification)
     if recipient_email:
         statement = statement.where(Notification.recipient_email == recipient_email)
     if is_sent is not None:
         statement = statement.where(Notification.is_sent == is_sent)
-    return db.exec(statement.order_by(Notification.created_at.desc()).offset(skip).limit(limit)).all()
+    return paginate(db, statement, Notification, skip=skip, limit=limit, cursor=cursor)
 
 def mark_notification_sent(db: Session, notification_id: int):
-    db_notification = db.get(Notification, notification_id)
-    if not db_notification:
-        return None
-    db_notification.is_sent = True
-    db_notification.sent_at = datetime.utcnow()
-    db.add(db_notification)
-    db.commit()
-    db.refresh(db_notification)
-    return db_notification
+    return update_returning(db, Notification, notification_id, {"is_sent": True, "sent_at": datetime.utcnow()})
+
+# Bulk operations: one UPDATE/DELETE ... WHERE id IN (...) in a single transaction
+def bulk_update_status(db: Session, model, ids: List[int], status: str) -> int:
+    values = {"status": status}
+    if "updated_at" in model.__table__.columns:
+        values["updated_at"] = datetime.utcnow()
+    statement = update(model).where(model.id.in_(ids)).values(**values)
+    result = db.exec(statement.execution_options(synchronize_session=False))
+    db.commit()
+    return result.rowcount
+
+def bulk_delete(db: Session, model, ids: List[int]) -> int:
+    statement = delete(model).where(model.id.in_(ids))
+    result = db.exec(statement.execution_options(synchronize_session=False))
+    db.commit()
+    return result.rowcount
+
+def get_application_resume_paths(db: Session, ids: List[int]) -> List[str]:
+    statement = select(Application.resume_path).where(Application.id.in_(ids), Application.resume_path != "")
+    return list(db.exec(statement).all())
+
+def delete_request_files(db: Session, request_ids: List[int]) -> List[str]:
+    """Delete the files of many project requests; returns their URLs so the blobs can be released"""
+    urls = list(db.exec(select(ProjectFile.file_url).where(ProjectFile.request_id.in_(request_ids))).all())
+    statement = delete(ProjectFile).where(ProjectFile.request_id.in_(request_ids))
+    db.exec(statement.execution_options(synchronize_session=False))
+    db.commit()
+    return urls
+
+# Blobs: reference counts change with one UPDATE so concurrent uploads of the
+# same bytes can't lose a count
+def add_blob_reference(db: Session, sha256: str, path: str, size: int) -> Blob:
+    """Count one more reference to the blob at path, creating its row on first use"""
+    increment = update(Blob).where(Blob.path == path).values(ref_count=Blob.ref_count + 1)
+    if db.exec(increment).rowcount == 0:
+        try:
+            db.add(Blob(sha256=sha256, path=path, size=size))
+            db.commit()
+        except IntegrityError:
+            # Another upload of the same bytes created it first
+            db.rollback()
+            db.exec(increment)
+    db.commit()
+    return db.exec(select(Blob).where(Blob.path == path)).one()
+
+def release_blob_reference(db: Session, path: str, on_last: Optional[Callable[[Blob], None]] = None) -> Optional[int]:
+    """Drop one reference; returns the references left, or None if path is not a blob.
+
+    on_last runs before the row goes, while the decrement still holds its row
+    lock, so a concurrent add_blob_reference waits until the object is gone
+    instead of re-referencing it mid-delete.
+    """
+    db.exec(update(Blob).where(Blob.path == path, Blob.ref_count > 0).values(ref_count=Blob.ref_count - 1))
+    blob = db.exec(select(Blob).where(Blob.path == path).with_for_update()).first()
+    remaining = blob.ref_count if blob else None
+    if remaining == 0:
+        try:
+            if on_last:
+                on_last(blob)
+        except Exception:
+            db.rollback()
+            raise
+        db.exec(delete(Blob).where(Blob.path == path, Blob.ref_count == 0))
+    db.commit()
+    return remaining
+
+def get_blob(db: Session, path: str) -> Optional[Blob]:
+    return db.exec(select(Blob).where(Blob.path == path)).first()
+
+def get_blob_variants(db: Session, paths: Sequence[str]) -> Dict[str, List[dict]]:
+    """Variants recorded for each blob path that has any"""
+    if not paths:
+        return {}
+    rows = db.exec(select(Blob.path, Blob.variants).where(Blob.path.in_(paths))).all()
+    return {path: variants for path, variants in rows if variants}
+
+def set_blob_variants(db: Session, path: str, variants: List[dict]) -> bool:
+    """False if the blob was released meanwhile"""
+    result = db.exec(update(Blob).where(Blob.path == path).values(variants=variants))
+    db.commit()
+    return result.rowcount > 0
+
+# Catalog change times
+def touch_catalog(db: Session, *namespaces: str) -> datetime:
+    """Record an admin write to the namespaces; returns the time recorded"""
+    now = datetime.utcnow()
+    for namespace in namespaces:
+        touch = update(CatalogChange).where(CatalogChange.namespace == namespace).values(changed_at=now)
+        if db.exec(touch).rowcount == 0:
+            try:
+                db.add(CatalogChange(namespace=namespace, changed_at=now))
+                db.commit()
+            except IntegrityError:
+                # Another worker recorded it first
+                db.rollback()
+                db.exec(touch)
+    db.commit()
+    return now
+
+def get_catalog_changed_at(db: Session, namespace: str) -> Optional[datetime]:
+    return db.exec(select(CatalogChange.changed_at).where(CatalogChange.namespace == namespace)).first()
+
+def get_products_by_image(db: Session, image: str) -> List[Product]:
+    return list(db.exec(select(Product).where(Product.image == image)).all())
+
+def get_project_templates_by_image(db: Session, image: str) -> List[ProjectTemplate]:
+    statement = select(ProjectTemplate).where(json_array_contains(db, ProjectTemplate.demo_images, image))
+    return list(db.exec(statement).all())
@@ -1,20 +1,113 @@
-from typing import Generator
-from fastapi import Depends, HTTPException, status
+from typing import AsyncGenerator, Dict, Generator
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app import codec
 from app.config import settings
+from app.pool import MonitoredQueuePool, MonitoredAsyncQueuePool
+from app.cache import NO_CACHE, TTLCache, catalog_cache
 from app.models import Admin
 from app.crud import get_admin_by_username
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/admin/login")
 
-engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Connect event applying the SQLite tuning profile from settings"""
+    cursor = dbapi_connection.cursor()
+    for name, value in settings.sqlite_pragmas.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+def get_sqlite_pragmas(db: Session) -> Dict[str, str]:
+    """Read back the PRAGMAs active on the session's connection"""
+    return {
+        name: str(db.exec(text(f"PRAGMA {name}")).scalar())
+        for name in settings.sqlite_pragmas
+    }
+
+def build_engines(database_url: str, async_url: str = None):
+    """Create the sync engine and, when DATABASE_ASYNC is on, the async engine for a URL"""
+    is_sqlite = database_url.startswith("sqlite")
+    connect_args = {"check_same_thread": False} if is_sqlite else {}
+    pool_options = settings.pool_options if ":memory:" not in database_url else {}
+    # JSON columns go through the same codec as the API responses
+    json_options = {"json_serializer": codec.dumps_str, "json_deserializer": codec.loads}
+    sync_engine = create_engine(
+        database_url,
+        connect_args=connect_args,
+        poolclass=MonitoredQueuePool if pool_options else None,
+        **json_options,
+        **pool_options,
+    )
+    # Optional async engine, enabled per deployment with DATABASE_ASYNC=true
+    async_db_engine = None
+    if settings.DATABASE_ASYNC and async_url:
+        async_db_engine = create_async_engine(
+            async_url,
+            poolclass=MonitoredAsyncQueuePool if pool_options else None,
+            **json_options,
+            **pool_options,
+        )
+    if is_sqlite and settings.SQLITE_TUNING:
+        event.listen(sync_engine, "connect", set_sqlite_pragmas)
+        if async_db_engine is not None:
+            event.listen(async_db_engine.sync_engine, "connect", set_sqlite_pragmas)
+    return sync_engine, async_db_engine
+
+engine, async_engine = build_engines(settings.DATABASE_URL, settings.async_database_url)
+
+# Replica engine for read-only routes; falls back to the primary when not configured
+read_engine = build_engines(settings.READ_DATABASE_URL)[0] if settings.READ_DATABASE_URL else engine
+
+READ_PRIMARY_HEADER = "X-Read-Primary"
+READ_PRIMARY_COOKIE = "read_primary"
 
 def get_db() -> Generator:
     with Session(engine) as session:
         yield session
 
+def get_read_db(request: Request) -> Generator:
+    """
+    Read-only session on the replica. Requests carrying the X-Read-Primary header
+    or the read_primary cookie (set after an admin write) read from the primary.
+    """
+    use_primary = read_engine is engine or pinned_to_primary(request)
+    with Session(engine if use_primary else read_engine) as session:
+        yield session
+
+def pinned_to_primary(request: Request) -> bool:
+    return bool(request.headers.get(READ_PRIMARY_HEADER) or request.cookies.get(READ_PRIMARY_COOKIE))
+
+def get_catalog_cache(request: Request) -> TTLCache:
+    """The shared catalog cache, or a pass-through one for clients pinned to the primary"""
+    if read_engine is not engine and pinned_to_primary(request):
+        return NO_CACHE
+    return catalog_cache
+
+def stick_to_primary(request: Request, response: Response):
+    """Router dependency: after a write, pin this client's reads to the primary briefly"""
+    if read_engine is not engine and request.method not in ("GET", "HEAD", "OPTIONS"):
+        response.set_cookie(
+            READ_PRIMARY_COOKIE, "1",
+            max_age=settings.READ_YOUR_WRITES_SECONDS, httponly=True, samesite="lax",
+        )
+
+async def get_async_db() -> AsyncGenerator:
+    """
+    Session for async handlers. Yields an AsyncSession when the async engine is
+    enabled, otherwise a regular Session that app.async_crud runs in a threadpool.
+    """
+    if async_engine is None:
+        with Session(engine) as session:
+            yield session
+        return
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
 def get_current_admin(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
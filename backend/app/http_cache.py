@@ -0,0 +1,126 @@
+"""
+Cache-Control policies for HTTP caches (browsers, proxies, CDNs).
+
+Routes opt in with the @cache_policy(...) decorator, placed under the router
+decorator; everything else gets the policy of the longest matching prefix in
+PREFIX_POLICIES, which is no-store for the API. CacheControlMiddleware adds
+the header to GET/HEAD responses with a 2xx or 304 status; other methods and
+error responses are always no-store, so a 404 for a project that is about to
+be created is never cached by a CDN.
+
+Clients pinned to the primary after an admin write (see deps.pinned_to_primary)
+get "private, no-cache" instead of a public policy, so a shared cache never
+stores what they read.
+"""
+
+from typing import Callable, NamedTuple, Optional, Tuple
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.config import settings
+from app.deps import pinned_to_primary
+
+
+class CachePolicy(NamedTuple):
+    public: bool = False
+    private: bool = False
+    no_store: bool = False
+    no_cache: bool = False
+    max_age: Optional[int] = None
+    s_maxage: Optional[int] = None
+    stale_while_revalidate: Optional[int] = None
+    stale_if_error: Optional[int] = None
+    vary: Tuple[str, ...] = ()
+
+    @property
+    def header(self) -> str:
+        if self.no_store:
+            return "no-store"
+        directives = [name for name, on in (("public", self.public), ("private", self.private), ("no-cache", self.no_cache)) if on]
+        for name, seconds in (
+            ("max-age", self.max_age),
+            ("s-maxage", self.s_maxage),
+            ("stale-while-revalidate", self.stale_while_revalidate),
+            ("stale-if-error", self.stale_if_error),
+        ):
+            if seconds is not None:
+                directives.append(f"{name}={seconds}")
+        return ", ".join(directives)
+
+
+NO_STORE = CachePolicy(no_store=True)
+PINNED = CachePolicy(private=True, no_cache=True)
+
+# Catalog reads: short browser lifetime, longer at the CDN, which may keep
+# serving a stale copy while it revalidates (ETag -> 304) in the background
+CATALOG = CachePolicy(
+    public=True,
+    max_age=settings.HTTP_CACHE_MAX_AGE,
+    s_maxage=settings.HTTP_CACHE_S_MAXAGE,
+    stale_while_revalidate=settings.HTTP_CACHE_STALE_WHILE_REVALIDATE,
+    stale_if_error=settings.HTTP_CACHE_STALE_IF_ERROR,
+    vary=("Accept-Encoding",),
+)
+
+# Responses that only change with a deploy
+STATIC = CachePolicy(public=True, max_age=3600, s_maxage=86400, stale_while_revalidate=86400, vary=("Accept-Encoding",))
+
+# Longest prefix wins
+PREFIX_POLICIES = (
+    ("/api/admin/", NO_STORE),
+    ("/api/", NO_STORE),
+    ("/snapshots/", CATALOG),
+)
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+
+def cache_policy(policy: CachePolicy) -> Callable:
+    """Route decorator attaching a policy to the endpoint"""
+    def decorate(endpoint: Callable) -> Callable:
+        endpoint.cache_policy = policy
+        return endpoint
+    return decorate
+
+def policy_for(scope: Scope) -> Optional[CachePolicy]:
+    policy = getattr(scope.get("endpoint"), "cache_policy", None)
+    if policy is not None:
+        return policy
+    path = scope["path"]
+    matches = [(prefix, policy) for prefix, policy in PREFIX_POLICIES if path.startswith(prefix) or path == prefix.rstrip("/")]
+    return max(matches, key=lambda match: len(match[0]))[1] if matches else None
+
+
+class CacheControlMiddleware:
+    """ASGI middleware setting Cache-Control (and Vary) from the route's policy"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_policy(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                policy = self.resolve(scope, message["status"])
+                if policy is not None and "cache-control" not in headers:
+                    headers["Cache-Control"] = policy.header
+                    for name in policy.vary:
+                        headers.add_vary_header(name)
+            await send(message)
+
+        await self.app(scope, receive, send_with_policy)
+
+    def resolve(self, scope: Scope, status: int) -> Optional[CachePolicy]:
+        # Read after the app has run: routing fills in scope["endpoint"]
+        policy = policy_for(scope)
+        if policy is None:
+            return None
+        if scope["method"] not in CACHEABLE_METHODS or not (200 <= status < 300 or status == 304):
+            return NO_STORE
+        if policy.public and pinned_to_primary(Request(scope)):
+            return PINNED
+        return policy
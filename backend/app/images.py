@@ -0,0 +1,174 @@
+"""
+Responsive variants of uploaded catalog images.
+
+After a product image or template demo image is uploaded, generate_variants()
+runs as a background task: the original is fetched from storage, resized to
+each of IMAGE_VARIANT_WIDTHS narrower than it (plus its own width, capped at
+the widest) and encoded to each of IMAGE_VARIANT_FORMATS in a process pool,
+so encoding never holds up the event loop or the GIL of the API workers.
+
+Variants are stored under variants/<aa>/<bb>/<sha256>-<width>w.<format> and
+recorded on the original's Blob row, so identical uploads share them and they
+are deleted with the original's last reference. Records that show the image
+carry ready-made srcset strings (Product.image_srcset,
+ProjectTemplate.demo_image_srcsets), kept in sync by with_srcsets() when the
+record is saved and again when the variants are done, whichever comes last.
+
+Pillow is optional (like brotli): without it, or without an encoder for a
+format, uploads simply keep their originals only.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
+from app import blobs, cache, crud
+from app.config import settings
+from app.materialized import refresh
+from app.models import Product
+from app.storage import get_storage
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+
+# Encoder settings per format; AVIF reaches WebP's quality at a lower number
+SAVE_OPTIONS = {
+    "avif": {"quality": 55, "speed": 6},
+    "webp": {"quality": 80, "method": 4},
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def supported_formats() -> List[str]:
+    """IMAGE_VARIANT_FORMATS this Pillow build can encode"""
+    if Image is None:
+        return []
+    Image.init()
+    return [name for name in settings.image_variant_formats if name in MIME_TYPES and name.upper() in Image.SAVE]
+
+def target_widths(width: int, widths: Sequence[int]) -> List[int]:
+    """Configured widths below the original, plus the original's (never upscaled past the widest); [] when none are configured"""
+    if not widths:
+        return []
+    return sorted({w for w in widths if w < width} | {min(width, max(widths))})
+
+def variant_key(digest: str, width: int, image_format: str) -> str:
+    return f"variants/{digest[:2]}/{digest[2:4]}/{digest}-{width}w.{image_format}"
+
+def render_variants(source: str, out_dir: str, widths: Sequence[int], formats: Sequence[str]) -> List[Dict]:
+    """Resize and encode source into out_dir; returns [{"file", "width", "format", "size"}]
+
+    Runs in a worker process, so it only takes and returns plain values.
+    """
+    rendered = []
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        for width in target_widths(image.width, widths):
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            for image_format in formats:
+                path = Path(out_dir) / f"{width}.{image_format}"
+                frame = resized.convert("RGB") if image_format == "jpeg" else resized
+                frame.save(path, image_format.upper(), **SAVE_OPTIONS[image_format])
+                rendered.append({"file": path.name, "width": width, "format": image_format, "size": path.stat().st_size})
+    return rendered
+
+def pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn: forking a process that runs threads and an event loop isn't safe
+        _pool = ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+async def render(*args) -> List[Dict]:
+    if settings.IMAGE_WORKERS > 0:
+        return await asyncio.get_running_loop().run_in_executor(pool(), render_variants, *args)
+    return await run_in_threadpool(render_variants, *args)
+
+
+def srcset(variants: List[Dict]) -> Dict[str, str]:
+    """{type: "<url> 320w, <url> 640w, ..."}, types in the order they were rendered"""
+    storage = get_storage()
+    candidates: Dict[str, List[str]] = {}
+    for variant in sorted(variants, key=lambda variant: variant["width"]):
+        candidates.setdefault(MIME_TYPES[variant["format"]], []).append(f"{storage.url(variant['key'])} {variant['width']}w")
+    return {mime_type: ", ".join(urls) for mime_type, urls in candidates.items()}
+
+def srcsets_for(db: Session, urls: Sequence[Optional[str]]) -> Dict[str, Dict[str, str]]:
+    """srcsets of the URLs whose blobs have variants"""
+    storage = get_storage()
+    keys = {url: storage.key_for(url) for url in urls if url}
+    variants = crud.get_blob_variants(db, [key for key in keys.values() if key])
+    return {url: srcset(variants[key]) for url, key in keys.items() if key in variants}
+
+def with_srcsets(db: Session, record):
+    """A product or project template with its srcset column matching its images' variants"""
+    if record is None:
+        return None
+    if isinstance(record, Product):
+        column, value = "image_srcset", srcsets_for(db, [record.image]).get(record.image, {})
+    else:
+        column, value = "demo_image_srcsets", srcsets_for(db, record.demo_images)
+    if getattr(record, column) == value:
+        return record
+    return crud.update_returning(db, type(record), record.id, {column: value})
+
+
+async def generate_variants(bind, key: str):
+    """Background task: render, store and record the variants of the image blob at key"""
+    formats = supported_formats()
+    if not settings.IMAGE_VARIANTS_ENABLED or not formats or not settings.image_variant_widths:
+        return
+    with Session(bind) as db:
+        blob = crud.get_blob(db, key)
+        if blob is None or blob.variants:
+            return
+        digest = blob.sha256
+
+    storage = get_storage()
+    workdir = blobs.staging_path()
+    workdir.mkdir()
+    variants = []
+    try:
+        source = workdir / Path(key).name
+        await run_in_threadpool(storage.fetch, key, source)
+        for item in await render(str(source), str(workdir), settings.image_variant_widths, formats):
+            stored_key = variant_key(digest, item["width"], item["format"])
+            await run_in_threadpool(storage.save, workdir / item["file"], stored_key, MIME_TYPES[item["format"]])
+            variants.append({"key": stored_key, "width": item["width"], "format": item["format"], "size": item["size"]})
+    except Exception:
+        logger.exception("Could not generate variants of %s", key)
+        for variant in variants:
+            storage.delete(variant["key"])
+        return
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    with Session(bind) as db:
+        if not crud.set_blob_variants(db, key, variants):
+            # The original was released while we were rendering
+            for variant in variants:
+                storage.delete(variant["key"])
+            return
+        url = storage.url(key)
+        products = [with_srcsets(db, product) for product in crud.get_products_by_image(db, url)]
+        templates = [with_srcsets(db, template) for template in crud.get_project_templates_by_image(db, url)]
+        namespaces = [namespace for namespace, updated in ((cache.PRODUCT, products), (cache.PROJECT_TEMPLATES, templates)) if updated]
+        if namespaces:
+            refresh(db, *namespaces)
@@ -1,11 +1,16 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from app.api import public, admin
+from app.codec import FastJSONResponse
+from app.compression import CompressionMiddleware, PrecompressedStaticFiles
 from app.config import settings
+from app.deps import stick_to_primary
+from app.http_cache import CacheControlMiddleware
+from app.uploads import RequestSizeLimitMiddleware
+from app.pagination import NEXT_CURSOR_HEADER, PREV_CURSOR_HEADER, TOTAL_COUNT_HEADER, TOTAL_COUNT_ESTIMATED_HEADER
 import os
 
-app = FastAPI(title="Aelvynor API")
+app = FastAPI(title="Aelvynor API", default_response_class=FastJSONResponse)
 
 # CORS - Use environment variable or default to localhost
 app.add_middleware(
@@ -14,8 +19,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Location", "Tus-Resumable", "Upload-Offset", "Upload-Length", NEXT_CURSOR_HEADER, PREV_CURSOR_HEADER, TOTAL_COUNT_HEADER, TOTAL_COUNT_ESTIMATED_HEADER],
 )
 
+# Compress JSON/text responses (gzip, or brotli when installed)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+# Cache-Control from each route's cache policy
+if settings.HTTP_CACHE_ENABLED:
+    app.add_middleware(CacheControlMiddleware)
+
+# Reject oversized request bodies before they are parsed and spooled
+if settings.MAX_REQUEST_BODY_SIZE > 0:
+    app.add_middleware(RequestSizeLimitMiddleware, max_size=settings.MAX_REQUEST_BODY_SIZE)
+
 # Create uploads directory if it doesn't exist
 os.makedirs("uploads", exist_ok=True)
 os.makedirs("uploads/resumes", exist_ok=True)
@@ -23,15 +46,18 @@ os.makedirs("uploads/examples", exist_ok=True)
 os.makedirs("uploads/project-requests", exist_ok=True)
 os.makedirs("uploads/project-files", exist_ok=True)
 
-# Mount static files for uploads
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# Mount static files for uploads, serving precompressed .br/.gz siblings when present
+app.mount("/uploads", PrecompressedStaticFiles(directory="uploads"), name="uploads")
 
 # Mount examples folder directly (for backward compatibility with image paths)
-app.mount("/examples", StaticFiles(directory="uploads/examples"), name="examples")
+app.mount("/examples", PrecompressedStaticFiles(directory="uploads/examples"), name="examples")
+
+# Catalog snapshots; /snapshots/current/ follows the latest exported version
+app.mount("/snapshots", PrecompressedStaticFiles(directory=settings.SNAPSHOT_DIR, check_dir=False), name="snapshots")
 
 # Include routers
 app.include_router(public.router, prefix="/api", tags=["Public"])
-app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
+app.include_router(admin.router, prefix="/api/admin", tags=["Admin"], dependencies=[Depends(stick_to_primary)])
 
 @app.get("/")
 def root():
@@ -0,0 +1,116 @@
+"""
+Materialized public catalog responses.
+
+Catalog cache entries hold the final JSON body of a public response, validated
+against its Read schema once when the entry is built, so a read is a dict
+lookup plus a write of stored bytes. Admin writes call refresh(), which drops
+the affected namespaces and rebuilds the default pages (skip=0, limit=100)
+from the primary straight away; other pages and detail views are built on
+their first read after the write.
+
+The homepage bundle is stitched together from the parts' stored bodies rather
+than encoded again, and is rebuilt after any of its parts is refreshed.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlmodel import Session
+from app import cache, codec
+from app.cache import TTLCache, catalog_cache
+from app.codec import encode_as
+from app.conditional import CatalogEntry, make_entry
+from app.crud import PROJECT_SUMMARY, PROJECT_TEMPLATE_SUMMARY, get_catalog_changed_at, touch_catalog, get_content, get_mission, get_projects, get_courses, get_internships, get_products, get_project_templates
+from app.schemas import ContentRead, MissionRead, ProjectRead, CourseRead, InternshipRead, ProductRead, ProjectTemplateRead
+
+# Rows are stored as dicts so entries don't hold on to the session
+def dump(row):
+    return row.model_dump() if row is not None else None
+
+def dump_all(rows):
+    return [row.model_dump() for row in rows]
+
+def build_entry(db: Session, namespace: str, schema, payload: Any) -> Optional[CatalogEntry]:
+    """schema=None for ?fields= projections, whose column dicts are encoded as they are"""
+    if payload is None:
+        return None
+    body = encode_as(schema, payload) if schema is not None else codec.dumps(payload)
+    return make_entry(payload, body, get_catalog_changed_at(db, namespace))
+
+def load(catalog: TTLCache, db: Session, key: Tuple, schema, loader: Callable[[], Any]) -> Optional[CatalogEntry]:
+    """Cached entry for key, built from loader() on a miss; None when loader finds nothing"""
+    return catalog.get_or_load(key, lambda: build_entry(db, key[0], schema, loader()))
+
+# Public responses rebuilt on every admin write to their namespace; the keys
+# match the ones the public handlers use for their default query parameters
+DEFAULT_PAGES: Dict[str, List[Tuple[Tuple, Any, Callable[[Session], Any]]]] = {
+    cache.MISSION: [
+        ((cache.MISSION,), MissionRead, lambda db: dump(get_mission(db))),
+    ],
+    cache.CONTENT: [
+        ((cache.CONTENT,), ContentRead, lambda db: dump(get_content(db))),
+    ],
+    cache.PROJECTS: [
+        ((cache.PROJECTS, 0, 100, None), List[ProjectRead], lambda db: dump_all(get_projects(db, skip=0, limit=100))),
+        ((cache.PROJECTS, 0, 100, PROJECT_SUMMARY), None, lambda db: get_projects(db, skip=0, limit=100, fields=PROJECT_SUMMARY)),
+    ],
+    cache.COURSES: [
+        ((cache.COURSES, 0, 100), List[CourseRead], lambda db: dump_all(get_courses(db, skip=0, limit=100))),
+    ],
+    cache.INTERNSHIPS: [
+        ((cache.INTERNSHIPS, 0, 100), List[InternshipRead], lambda db: dump_all(get_internships(db, skip=0, limit=100))),
+    ],
+    cache.PRODUCT: [
+        ((cache.PRODUCT, 0, 100), List[ProductRead], lambda db: dump_all(get_products(db, skip=0, limit=100))),
+    ],
+    cache.PROJECT_TEMPLATES: [
+        ((cache.PROJECT_TEMPLATES, 0, 100, None, None, None), List[ProjectTemplateRead],
+         lambda db: dump_all(get_project_templates(db, skip=0, limit=100, is_active=True))),
+        ((cache.PROJECT_TEMPLATES, 0, 100, None, None, PROJECT_TEMPLATE_SUMMARY), None,
+         lambda db: get_project_templates(db, skip=0, limit=100, is_active=True, fields=PROJECT_TEMPLATE_SUMMARY)),
+    ],
+}
+
+# Bundle field -> the default page it is built from
+HOME_PARTS: Dict[str, Tuple] = {
+    "mission": (cache.MISSION,),
+    "content": (cache.CONTENT,),
+    "projects": (cache.PROJECTS, 0, 100, None),
+    "courses": (cache.COURSES, 0, 100),
+    "internships": (cache.INTERNSHIPS, 0, 100),
+    "product": (cache.PRODUCT, 0, 100),
+}
+
+def default_page(key: Tuple):
+    return next((schema, loader) for page, schema, loader in DEFAULT_PAGES[key[0]] if page == key)
+
+def build_home(catalog: TTLCache, db: Session) -> CatalogEntry:
+    """Homepage bundle from the parts' cached entries, loading missing parts from db"""
+    parts = {}
+    for name, key in HOME_PARTS.items():
+        schema, loader = default_page(key)
+        parts[name] = load(catalog, db, key, schema, lambda loader=loader: loader(db))
+    body = b"{" + b",".join(
+        codec.dumps(name) + b":" + (entry.body if entry is not None else b"null")
+        for name, entry in parts.items()
+    ) + b"}"
+    payload = {name: entry.payload if entry is not None else None for name, entry in parts.items()}
+    stamps = [get_catalog_changed_at(db, cache.HOME), *(entry.last_modified for entry in parts.values() if entry is not None)]
+    return make_entry(payload, body, max((stamp for stamp in stamps if stamp), default=None))
+
+def load_home(catalog: TTLCache, db: Session) -> CatalogEntry:
+    return catalog.get_or_load((cache.HOME,), lambda: build_home(catalog, db))
+
+def refresh(db: Session, *namespaces: str):
+    """Invalidate the namespaces and rebuild their default public pages from db"""
+    rebuild_home = any(key[0] in namespaces for key in HOME_PARTS.values())
+    changed = (*namespaces, *((cache.HOME,) if rebuild_home else ()))
+    touch_catalog(db, *changed)
+    catalog_cache.invalidate(*changed)
+    if catalog_cache.maxsize <= 0 or catalog_cache.ttl <= 0:
+        return
+    for namespace in namespaces:
+        for key, schema, loader in DEFAULT_PAGES.get(namespace, []):
+            entry = build_entry(db, namespace, schema, loader(db))
+            if entry is not None:
+                catalog_cache.set(key, entry)
+    if rebuild_home:
+        catalog_cache.set((cache.HOME,), build_home(catalog_cache, db))
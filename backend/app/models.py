@@ -1,22 +1,11 @@
-from typing import Optional, List
+from typing import Optional, List, Any, Dict
 from sqlmodel import Field, SQLModel
+from sqlalchemy import Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
-import json
-
-# Helper for JSON fields in SQLite/Postgres
-class JSONField(str):
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
-
-    @classmethod
-    def validate(cls, v):
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return []
-        return v
+
+# Native JSON column: JSONB on Postgres (GIN-indexable), JSON (TEXT) on SQLite
+JSONType = JSON().with_variant(JSONB(), "postgresql")
 
 # Base Models
 class MissionBase(SQLModel):
@@ -28,9 +17,9 @@ class ProjectBase(SQLModel):
     slug: str = Field(index=True, unique=True)
     description: str
     full_description: str
-    tags: str = "[]"  # JSON string
+    tags: List[str] = Field(default_factory=list, sa_type=JSONType)
     image: Optional[str] = None
-    features: str = "[]"  # JSON string
+    features: List[str] = Field(default_factory=list, sa_type=JSONType)
 
 class CourseBase(SQLModel):
     title: str
@@ -49,8 +38,8 @@ class InternshipBase(SQLModel):
 class ProductBase(SQLModel):
     name: str
     description: str
-    features: str = "[]" # JSON string
-    specs: str = "{}" # JSON string
+    features: List[str] = Field(default_factory=list, sa_type=JSONType)
+    specs: Dict[str, Any] = Field(default_factory=dict, sa_type=JSONType)
     image: Optional[str] = None
     brochure: Optional[str] = None
 
@@ -109,15 +98,27 @@ class NotificationBase(SQLModel):
     is_sent: bool = False
 
 # Projects Management System (PMS) Models
+PROJECT_CATEGORIES = [
+    "BCA / MCA",
+    "Engineering",
+    "School",
+    "Company",
+    "IoT",
+    "AI/ML",
+    "Robotics",
+    "Web/Mobile",
+    "Custom"
+]
+
 class ProjectTemplateBase(SQLModel):
     title: str
     category: str  # BCA/MCA, Engineering, School, Company, IoT, AI/ML, Robotics, Web/Mobile, Custom
     description: str
-    tech_stack: str = "[]"  # JSON string array
+    tech_stack: List[str] = Field(default_factory=list, sa_type=JSONType)
     price: Optional[float] = None  # None means negotiable
     time_duration: str  # e.g., "2 weeks", "1 month"
     requirements: str = ""  # JSON string or text
-    demo_images: str = "[]"  # JSON string array of image URLs
+    demo_images: List[str] = Field(default_factory=list, sa_type=JSONType)  # image URLs
     demo_video: Optional[str] = None  # Video URL
     is_active: bool = True
 
@@ -168,11 +169,19 @@ class Internship(InternshipBase, table=True):
 class Product(ProductBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Resized WebP/AVIF copies of image: {"image/avif": "<url> 320w, ...", ...}, see app.images
+    image_srcset: Dict[str, str] = Field(default_factory=dict, sa_type=JSONType)
 
 class Application(ApplicationBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    # Composite indexes matching the crud list filters ordered by (created_at, id),
+    # created by migration 005_add_list_indexes
+    __table_args__ = (
+        Index("ix_application_created_at_id", "created_at", "id"),
+    )
+
 class Content(ContentBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -181,37 +190,95 @@ class Contact(ContactBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_contact_created_at_id", "created_at", "id"),
+        Index("ix_contact_status_created_at_id", "status", "created_at", "id"),
+    )
+
 class CoursePurchase(CoursePurchaseBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_coursepurchase_created_at_id", "created_at", "id"),
+        Index("ix_coursepurchase_status_created_at_id", "status", "created_at", "id"),
+    )
+
 class ProductInquiry(ProductInquiryBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_productinquiry_created_at_id", "created_at", "id"),
+        Index("ix_productinquiry_status_created_at_id", "status", "created_at", "id"),
+    )
+
 class Payment(PaymentBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_payment_created_at_id", "created_at", "id"),
+        Index("ix_payment_user_email_created_at_id", "user_email", "created_at", "id"),
+        Index("ix_payment_status_created_at_id", "status", "created_at", "id"),
+    )
+
 class Notification(NotificationBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_notification_created_at_id", "created_at", "id"),
+        Index("ix_notification_recipient_email_created_at_id", "recipient_email", "created_at", "id"),
+        Index("ix_notification_is_sent_created_at_id", "is_sent", "created_at", "id"),
+    )
+
 # Projects Management System (PMS) Database Models
 class ProjectTemplate(ProjectTemplateBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # demo_images URL -> {type: srcset} for the images that have variants
+    demo_image_srcsets: Dict[str, Dict[str, str]] = Field(default_factory=dict, sa_type=JSONType)
+
+    # GIN index for "tech_stack contains ..." queries, Postgres only
+    __table_args__ = (
+        Index("ix_projecttemplate_tech_stack_gin", "tech_stack", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
 class ProjectRequest(ProjectRequestBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_projectrequest_created_at_id", "created_at", "id"),
+        Index("ix_projectrequest_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_projectrequest_email_created_at_id", "email", "created_at", "id"),
+    )
+
 class ProjectFile(ProjectFileBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     uploaded_at: datetime = Field(default_factory=datetime.utcnow)
 
+# Content-addressed upload storage: one row per stored file, shared by every
+# record that uploaded the same bytes
+class Blob(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    sha256: str = Field(index=True)
+    path: str = Field(unique=True)  # storage key, e.g. blobs/ab/cd/<sha256>.pdf
+    size: int
+    ref_count: int = 1
+    # Derived images: [{"key", "width", "format", "size"}], removed with the blob
+    variants: List[Dict[str, Any]] = Field(default_factory=list, sa_type=JSONType)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+# Last admin write to each public catalog namespace (app.cache), the
+# Last-Modified floor every worker reads for deletes and untimestamped rows
+class CatalogChange(SQLModel, table=True):
+    namespace: str = Field(primary_key=True)
+    changed_at: datetime = Field(default_factory=datetime.utcnow)
+
 def create_db_and_tables(engine):
     SQLModel.metadata.create_all(engine)
@@ -0,0 +1,105 @@
+"""
+Keyset (cursor) pagination on (created_at, id), newest first.
+
+Cursors are opaque base64 tokens pointing just past the last row of a page
+("next") or just before its first row ("prev"). Offset pagination via skip is
+kept as a fallback when no cursor is given.
+
+Total counts are exposed through X-Total-Count: an exact COUNT over the
+filter's index, or for unfiltered lists an estimate read from the planner
+statistics (sqlite_stat1 / pg_class.reltuples).
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, List, Literal, Optional, Tuple
+from fastapi import HTTPException, Response
+from sqlalchemy import func, text, tuple_
+from sqlmodel import Session, select
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+PREV_CURSOR_HEADER = "X-Prev-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_COUNT_ESTIMATED_HEADER = "X-Total-Count-Estimated"
+
+CountMode = Literal["exact", "estimate", "none"]
+
+def encode_cursor(direction: str, created_at: datetime, id: int) -> str:
+    raw = f"{direction}|{created_at.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[str, datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, created_at, id = base64.urlsafe_b64decode(padded).decode().split("|")
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        return direction, datetime.fromisoformat(created_at), int(id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def paginate(db: Session, statement, model, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List:
+    """Run a select(model) statement ordered by (created_at, id) desc, one page at a time"""
+    key = tuple_(model.created_at, model.id)
+    if not cursor:
+        statement = statement.order_by(model.created_at.desc(), model.id.desc())
+        return db.exec(statement.offset(skip).limit(limit)).all()
+
+    direction, created_at, id = decode_cursor(cursor)
+    if direction == "next":
+        statement = statement.where(key < (created_at, id))
+        statement = statement.order_by(model.created_at.desc(), model.id.desc())
+        return db.exec(statement.limit(limit)).all()
+    # Walk backwards in ascending order, then restore newest-first order
+    statement = statement.where(key > (created_at, id))
+    statement = statement.order_by(model.created_at.asc(), model.id.asc())
+    return list(reversed(db.exec(statement.limit(limit)).all()))
+
+def set_cursor_headers(response: Response, items: List, limit: int, cursor: Optional[str] = None, skip: int = 0):
+    """Expose next/prev cursors for a page through response headers"""
+    if not items:
+        return
+    first, last = items[0], items[-1]
+    paged_forward = not cursor or decode_cursor(cursor)[0] == "next"
+    # A short page in the forward direction is the last one
+    if len(items) >= limit or not paged_forward:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor("next", last.created_at, last.id)
+    if cursor or skip:
+        if paged_forward or len(items) >= limit:
+            response.headers[PREV_CURSOR_HEADER] = encode_cursor("prev", first.created_at, first.id)
+
+def count_rows(db: Session, model, **filters: Any) -> int:
+    """COUNT(*) with the same equality filters as the crud list functions (None/"" = no filter)"""
+    statement = select(func.count()).select_from(model)
+    for column, value in filters.items():
+        if value is not None and value != "":
+            statement = statement.where(getattr(model, column) == value)
+    return db.exec(statement).one()
+
+def estimate_rows(db: Session, model) -> Optional[int]:
+    """Row count from planner statistics, or None when the table was never analyzed"""
+    table = model.__tablename__
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        has_stats = db.exec(text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")).first()
+        if not has_stats:
+            return None
+        row = db.exec(text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table LIMIT 1").bindparams(table=table)).first()
+        return int(row[0].split()[0]) if row else None
+    if dialect == "postgresql":
+        row = db.exec(text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)").bindparams(table=table)).first()
+        return int(row[0]) if row and row[0] >= 0 else None
+    return None
+
+def set_total_count(response: Response, db: Session, model, mode: CountMode = "exact", **filters: Any):
+    """Set X-Total-Count; "estimate" only applies to unfiltered lists and falls back to exact"""
+    if mode == "none":
+        return
+    filtered = any(value is not None and value != "" for value in filters.values())
+    if mode == "estimate" and not filtered:
+        estimate = estimate_rows(db, model)
+        if estimate is not None:
+            response.headers[TOTAL_COUNT_HEADER] = str(estimate)
+            response.headers[TOTAL_COUNT_ESTIMATED_HEADER] = "true"
+            return
+    response.headers[TOTAL_COUNT_HEADER] = str(count_rows(db, model, **filters))
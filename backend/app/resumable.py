@@ -0,0 +1,166 @@
+"""
+Resumable uploads in the style of the tus protocol (https://tus.io).
+
+An upload session is created with the final size and what the file is for;
+the client then PATCHes the bytes in any number of requests, each starting at
+the session's current offset, and can ask for that offset (HEAD) after a
+dropped connection to carry on from there. Bytes are appended to
+UPLOAD_SESSION_DIR/<id>.part as they stream in, so whatever arrived before a
+disconnect is kept. Once complete, finish() moves the file into the blob
+store, where the multipart upload endpoints put theirs.
+
+Session metadata is a JSON file next to the .part file, so every worker sees
+the same sessions. Appending and finishing hold an exclusive flock on the
+.part file, so a second PATCH to the same upload gets a 409 whichever worker
+it lands on. Sessions untouched for UPLOAD_SESSION_TTL seconds are
+removed by purge_idle(), which runs whenever a session is created and also
+clears stale files from the blob staging directory (app.blobs).
+"""
+
+import fcntl
+import secrets
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, NamedTuple, Optional, Tuple
+import aiofiles
+from fastapi import HTTPException
+from sqlmodel import Session
+from app import blobs, codec
+from app.config import settings
+from app.uploads import ALLOWED_VIDEO_EXTENSIONS, MB, file_too_large
+
+TUS_VERSION = "1.0.0"
+
+
+class UploadTarget(NamedTuple):
+    extensions: Optional[set]
+    max_size: int
+
+
+# What a finished upload attaches to
+TARGETS: Dict[str, UploadTarget] = {
+    "template-video": UploadTarget(ALLOWED_VIDEO_EXTENSIONS, 100 * MB),
+    "project-file": UploadTarget(None, 50 * MB),
+}
+
+def session_dir() -> Path:
+    return Path(settings.UPLOAD_SESSION_DIR)
+
+def _paths(upload_id: str):
+    # ids are token_hex, anything else can't name a session
+    if not upload_id.isalnum():
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return session_dir() / f"{upload_id}.json", session_dir() / f"{upload_id}.part"
+
+def create(target: str, target_id: int, filename: str, length: int, **extra) -> Dict:
+    """Validate and start a session; raises HTTPException for a bad type or size"""
+    spec = TARGETS[target]
+    extension = Path(filename).suffix.lower()
+    if spec.extensions is not None and extension not in spec.extensions:
+        raise HTTPException(status_code=400, detail=f"Invalid file type. Allowed: {', '.join(sorted(spec.extensions))}")
+    if length > spec.max_size:
+        raise file_too_large(spec.max_size)
+    purge_idle()
+    session_dir().mkdir(parents=True, exist_ok=True)
+    upload_id = secrets.token_hex(16)
+    meta_path, part_path = _paths(upload_id)
+    session = {
+        "id": upload_id,
+        "target": target,
+        "target_id": target_id,
+        "filename": Path(filename).name,
+        "length": length,
+        "created_at": datetime.utcnow().isoformat(),
+        **extra,
+    }
+    part_path.touch()
+    meta_path.write_bytes(codec.dumps(session))
+    return {**session, "offset": 0}
+
+def get(upload_id: str) -> Dict:
+    meta_path, part_path = _paths(upload_id)
+    try:
+        session = codec.loads(meta_path.read_bytes())
+        offset = part_path.stat().st_size
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return {**session, "offset": offset}
+
+def _lock(part_file):
+    """Exclusive flock on the open .part file, held until it is closed; shared by all workers"""
+    try:
+        fcntl.flock(part_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        raise HTTPException(status_code=409, detail="Upload is already receiving data")
+
+async def append(upload_id: str, offset: int, chunks: AsyncIterator[bytes]) -> int:
+    """Append streamed bytes at offset; returns the new offset"""
+    get(upload_id)
+    _, part_path = _paths(upload_id)
+    async with aiofiles.open(part_path, "ab") as out_file:
+        _lock(out_file)
+        # Checked under the lock: another worker may have appended since the request came in
+        session = get(upload_id)
+        if offset != session["offset"]:
+            raise HTTPException(status_code=409, detail=f"Upload-Offset must be {session['offset']}")
+        remaining = session["length"] - offset
+        async for chunk in chunks:
+            if len(chunk) > remaining:
+                raise HTTPException(status_code=413, detail="Data exceeds Upload-Length")
+            await out_file.write(chunk)
+            remaining -= len(chunk)
+    return session["length"] - remaining
+
+def finish(db: Session, upload_id: str) -> Tuple[str, str, int]:
+    """Move a complete upload into the blob store and reference it; returns (key, sha256, size)"""
+    get(upload_id)
+    meta_path, part_path = _paths(upload_id)
+    with open(part_path, "rb") as part_file:
+        _lock(part_file)
+        session = get(upload_id)
+        if session["offset"] != session["length"]:
+            raise HTTPException(status_code=409, detail=f"Upload incomplete ({session['offset']} of {session['length']} bytes)")
+        stored = blobs.adopt(db, part_path, Path(session["filename"]).suffix)
+        meta_path.unlink(missing_ok=True)
+    return stored
+
+def delete(upload_id: str):
+    meta_path, part_path = _paths(upload_id)
+    if not meta_path.exists():
+        raise HTTPException(status_code=404, detail="Upload not found")
+    meta_path.unlink(missing_ok=True)
+    part_path.unlink(missing_ok=True)
+
+def purge_idle(max_idle: Optional[float] = None) -> int:
+    """Remove sessions, and blob staging files left by failed uploads, with no data
+    for max_idle seconds (UPLOAD_SESSION_TTL by default); returns how many went"""
+    max_idle = settings.UPLOAD_SESSION_TTL if max_idle is None else max_idle
+    if not session_dir().is_dir():
+        return 0
+    cutoff = time.time() - max_idle
+    removed = 0
+    for meta_path in session_dir().glob("*.json"):
+        part_path = meta_path.with_suffix(".part")
+        try:
+            last_activity = max(meta_path.stat().st_mtime, part_path.stat().st_mtime if part_path.exists() else 0)
+        except FileNotFoundError:
+            continue
+        if last_activity < cutoff:
+            meta_path.unlink(missing_ok=True)
+            part_path.unlink(missing_ok=True)
+            removed += 1
+    staging = blobs.staging_dir()
+    for staged in staging.iterdir() if staging.is_dir() else ():
+        try:
+            if staged.stat().st_mtime < cutoff:
+                if staged.is_dir():
+                    # An image variant render's work directory (app.images)
+                    shutil.rmtree(staged)
+                else:
+                    staged.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
@@ -1,5 +1,5 @@
-from typing import Optional, List, Any, Dict
-from pydantic import BaseModel
+from typing import Optional, List, Any, Dict, Literal
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 # Token
@@ -16,6 +16,8 @@ class MissionCreate(BaseModel):
     long: str
 
 class MissionRead(MissionCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     created_at: datetime
 
@@ -30,6 +32,8 @@ class ProjectCreate(BaseModel):
     features: List[str] = []
 
 class ProjectRead(ProjectCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     created_at: datetime
 
@@ -42,6 +46,8 @@ class CourseCreate(BaseModel):
     students_count: int = 0
 
 class CourseRead(CourseCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     created_at: datetime
 
@@ -54,6 +60,8 @@ class InternshipCreate(BaseModel):
     description: str
 
 class InternshipRead(InternshipCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     created_at: datetime
 
@@ -67,8 +75,11 @@ class ProductCreate(BaseModel):
     brochure: Optional[str] = None
 
 class ProductRead(ProductCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     created_at: datetime
+    image_srcset: Dict[str, str] = {}  # type -> srcset, once variants are generated
 
 # Content
 class ContentCreate(BaseModel):
@@ -80,6 +91,8 @@ class ContentCreate(BaseModel):
     contact_address: str = ""
 
 class ContentRead(ContentCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     updated_at: datetime
 
@@ -108,6 +121,8 @@ class ApplicationCreate(BaseModel):
     applied_for: str
 
 class ApplicationRead(ApplicationCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     resume_path: str
     created_at: datetime
@@ -134,9 +149,12 @@ class ProjectTemplateCreate(BaseModel):
     is_active: bool = True
 
 class ProjectTemplateRead(ProjectTemplateCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     created_at: datetime
     updated_at: datetime
+    demo_image_srcsets: Dict[str, Dict[str, str]] = {}  # demo_images URL -> type -> srcset
 
 class ProjectTemplateUpdate(BaseModel):
     title: Optional[str] = None
@@ -162,6 +180,8 @@ class ProjectRequestCreate(BaseModel):
     deadline: Optional[datetime] = None
 
 class ProjectRequestRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     email: str
@@ -197,6 +217,8 @@ class ProjectFileCreate(BaseModel):
     description: Optional[str] = None
 
 class ProjectFileRead(ProjectFileCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     uploaded_at: datetime
 
@@ -208,6 +230,8 @@ class ContactCreate(BaseModel):
     message: str
 
 class ContactRead(ContactCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     status: str
     created_at: datetime
@@ -220,6 +244,8 @@ class CoursePurchaseCreate(BaseModel):
     course_id: int
 
 class CoursePurchaseRead(CoursePurchaseCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     status: str
     payment_status: str
@@ -237,6 +263,8 @@ class ProductInquiryCreate(BaseModel):
     message: str
 
 class ProductInquiryRead(ProductInquiryCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     status: str
     created_at: datetime
@@ -253,6 +281,8 @@ class PaymentCreate(BaseModel):
     payment_method: Optional[str] = None
 
 class PaymentRead(PaymentCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     transaction_id: Optional[str] = None
     status: str
@@ -271,7 +301,83 @@ class NotificationCreate(BaseModel):
     message: str
 
 class NotificationRead(NotificationCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     sent_at: Optional[datetime] = None
     is_sent: bool
     created_at: datetime
+
+# Bulk admin operations
+ApplicationStatus = Literal["pending", "reviewing", "accepted", "rejected"]
+ProjectRequestStatus = Literal["pending", "approved", "in_progress", "completed", "delivered", "cancelled"]
+ContactStatus = Literal["new", "read", "replied"]
+CoursePurchaseStatus = Literal["pending", "confirmed", "completed", "cancelled"]
+ProductInquiryStatus = Literal["new", "contacted", "quoted", "closed"]
+
+class BulkStatusUpdate(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=1000)
+    status: str
+
+class ApplicationBulkStatusUpdate(BulkStatusUpdate):
+    status: ApplicationStatus
+
+class ProjectRequestBulkStatusUpdate(BulkStatusUpdate):
+    status: ProjectRequestStatus
+
+class ContactBulkStatusUpdate(BulkStatusUpdate):
+    status: ContactStatus
+
+class CoursePurchaseBulkStatusUpdate(BulkStatusUpdate):
+    status: CoursePurchaseStatus
+
+class ProductInquiryBulkStatusUpdate(BulkStatusUpdate):
+    status: ProductInquiryStatus
+
+class BulkDelete(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=1000)
+
+class BulkResult(BaseModel):
+    affected: int
+
+# Homepage bundle: the landing page's catalog reads in one response
+class HomeBundleRead(BaseModel):
+    mission: Optional[MissionRead] = None
+    content: Optional[ContentRead] = None
+    projects: List[ProjectRead]
+    courses: List[CourseRead]
+    internships: List[InternshipRead]
+    product: List[ProductRead]
+
+# Resumable uploads
+class UploadSessionCreate(BaseModel):
+    target: Literal["template-video", "project-file"]
+    target_id: int
+    filename: str = Field(min_length=1)
+    length: int = Field(gt=0)
+    # project-file only
+    file_type: str = "other"
+    description: Optional[str] = None
+
+class UploadSessionRead(UploadSessionCreate):
+    id: str
+    offset: int
+    created_at: datetime
+
+# Direct-to-storage uploads: presign, PUT to the returned URL, complete
+class DirectUploadCreate(BaseModel):
+    filename: str = Field(min_length=1)
+    size: int = Field(gt=0)
+    sha256: str = Field(pattern=r"^[0-9a-f]{64}$")
+    content_type: str = "application/octet-stream"
+
+class DirectUploadRead(BaseModel):
+    key: str
+    exists: bool  # stored already: skip the PUT and complete straight away
+    upload: Optional[Dict[str, Any]] = None  # {"method", "url", "headers"}
+    expires_in: int
+
+class DirectUploadComplete(BaseModel):
+    key: str
+    file_type: str = "other"
+    description: Optional[str] = None
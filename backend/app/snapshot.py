@@ -0,0 +1,167 @@
+"""
+Static snapshots of the public catalog API.
+
+export_snapshot() renders every public catalog response (the default list
+pages, each project by slug, each active template by id, the template
+categories and the homepage bundle) to JSON files under
+SNAPSHOT_DIR/<version>/, laid out like the API paths:
+
+    /api/projects               -> projects.json
+    /api/projects/{slug}        -> projects/{slug}.json
+    /api/project-templates/{id} -> project-templates/{id}.json
+
+A version is written to a temporary directory and renamed into place, then
+the SNAPSHOT_DIR/current symlink is swapped to it with os.replace, so readers
+only ever see a complete snapshot. Files are precompressed (.br/.gz) for
+PrecompressedStaticFiles or a CDN origin. Only the newest SNAPSHOT_KEEP
+versions are kept.
+"""
+
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from urllib.parse import quote
+from sqlmodel import Session
+from app import cache, codec, materialized
+from app.cache import NO_CACHE
+from app.compression import precompress
+from app.config import settings
+from app.conditional import CatalogEntry, http_date
+from app.crud import get_projects, get_project_templates
+from app.models import PROJECT_CATEGORIES
+from app.schemas import ProjectRead, ProjectTemplateRead
+
+CURRENT = "current"
+MANIFEST = "manifest.json"
+
+# Snapshot file -> default page key in materialized.DEFAULT_PAGES
+LIST_PAGES = {
+    "mission": (cache.MISSION,),
+    "projects": (cache.PROJECTS, 0, 100, None),
+    "courses": (cache.COURSES, 0, 100),
+    "internships": (cache.INTERNSHIPS, 0, 100),
+    "product": (cache.PRODUCT, 0, 100),
+    "project-templates": (cache.PROJECT_TEMPLATES, 0, 100, None, None, None),
+}
+
+_export_lock = threading.Lock()
+
+
+class SnapshotInProgress(Exception):
+    pass
+
+
+def _all_rows(fetch: Callable[[int, int], List[Any]], page_size: int = 100) -> Iterator[Any]:
+    skip = 0
+    while True:
+        rows = fetch(skip, page_size)
+        yield from rows
+        if len(rows) < page_size:
+            return
+        skip += page_size
+
+def _file_name(value: Any) -> Optional[str]:
+    # StaticFiles decodes the request path before the lookup, so files are named by
+    # the slug itself. Slugs come from admin input: skip any that isn't a single
+    # file name inside its directory
+    name = str(value)
+    return None if name in ("", ".", "..") or "/" in name or "\\" in name or "\0" in name else name
+
+def render(db: Session) -> Dict[str, CatalogEntry]:
+    """Every public catalog response, keyed by its path relative to /api (without .json)"""
+    entries: Dict[str, CatalogEntry] = {}
+    for path, key in LIST_PAGES.items():
+        schema, loader = materialized.default_page(key)
+        entry = materialized.build_entry(db, key[0], schema, loader(db))
+        if entry is not None:
+            entries[path] = entry
+    for project in _all_rows(lambda skip, limit: get_projects(db, skip=skip, limit=limit)):
+        name = _file_name(project.slug)
+        if name:
+            entries[f"projects/{name}"] = materialized.build_entry(db, cache.PROJECTS, ProjectRead, materialized.dump(project))
+    for template in _all_rows(lambda skip, limit: get_project_templates(db, skip=skip, limit=limit, is_active=True)):
+        entries[f"project-templates/{template.id}"] = materialized.build_entry(
+            db, cache.PROJECT_TEMPLATES, ProjectTemplateRead, materialized.dump(template)
+        )
+    entries["project-templates/categories/list"] = materialized.build_entry(
+        db, cache.PROJECT_TEMPLATES, None, {"categories": PROJECT_CATEGORIES}
+    )
+    entries["bundle/home"] = materialized.build_home(NO_CACHE, db)
+    return entries
+
+def current_version(root: Union[str, Path, None] = None) -> Optional[str]:
+    pointer = Path(root or settings.SNAPSHOT_DIR) / CURRENT
+    return os.readlink(pointer) if pointer.is_symlink() else None
+
+def list_versions(root: Union[str, Path, None] = None) -> List[str]:
+    root = Path(root or settings.SNAPSHOT_DIR)
+    if not root.is_dir():
+        return []
+    return sorted(
+        path.name for path in root.iterdir()
+        if path.is_dir() and not path.is_symlink() and not path.name.startswith(".")
+    )
+
+def _write(version_dir: Path, entries: Dict[str, CatalogEntry]) -> Dict[str, Any]:
+    files = {}
+    for path, entry in entries.items():
+        target = version_dir / f"{path}.json"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(entry.body)
+        precompress(target)
+        files[f"/api/{quote(path)}"] = {
+            "file": f"{path}.json",
+            "etag": entry.etag,
+            "last_modified": http_date(entry.last_modified) if entry.last_modified else None,
+        }
+    return files
+
+def _point_current(root: Path, version: str):
+    tmp = root / f".{CURRENT}.tmp"
+    if tmp.is_symlink() or tmp.exists():
+        tmp.unlink()
+    os.symlink(version, tmp)
+    os.replace(tmp, root / CURRENT)
+
+def _prune(root: Path, keep: int):
+    current = current_version(root)
+    versions = list_versions(root)
+    for version in versions[:max(len(versions) - keep, 0)]:
+        if version != current:
+            shutil.rmtree(root / version, ignore_errors=True)
+
+def export_snapshot(db: Session, root: Union[str, Path, None] = None, keep: Optional[int] = None) -> Dict[str, Any]:
+    """Render and publish a new snapshot version; returns its manifest"""
+    if not _export_lock.acquire(blocking=False):
+        raise SnapshotInProgress()
+    try:
+        root = Path(root or settings.SNAPSHOT_DIR)
+        root.mkdir(parents=True, exist_ok=True)
+        created_at = datetime.utcnow()
+        version = created_at.strftime("%Y%m%dT%H%M%S%fZ")
+        staging = root / f".{version}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        try:
+            files = _write(staging, render(db))
+            manifest = {"version": version, "created_at": created_at.isoformat(), "files": files}
+            (staging / MANIFEST).write_bytes(codec.dumps(manifest))
+            os.rename(staging, root / version)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        _point_current(root, version)
+        _prune(root, settings.SNAPSHOT_KEEP if keep is None else keep)
+        return manifest
+    finally:
+        _export_lock.release()
+
+def read_manifest(root: Union[str, Path, None] = None, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    root = Path(root or settings.SNAPSHOT_DIR)
+    version = version or current_version(root)
+    if version is None or not (root / version / MANIFEST).is_file():
+        return None
+    return codec.loads((root / version / MANIFEST).read_bytes())
@@ -0,0 +1,250 @@
+"""
+Storage backends for uploaded files.
+
+Files are addressed by key (e.g. blobs/ab/cd/<sha256>.pdf). STORAGE_BACKEND
+picks where they live:
+
+- local: under STORAGE_LOCAL_ROOT (uploads/), served by the /uploads mount.
+  Presigned URLs point at /api/storage/{key}, signed with SECRET_KEY, so
+  direct uploads work the same way without an object store.
+- s3: an S3-compatible bucket (AWS S3, MinIO, R2, ...) through boto3, which
+  is optional and only imported for this backend. Presigned URLs go straight
+  to the bucket, so browsers move the bytes and the API only records rows.
+
+Presigned PUTs are bound to the object's SHA-256: S3 checks the
+x-amz-checksum-sha256 header, the local endpoint hashes what it receives.
+"""
+
+import abc
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import shutil
+import time
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import quote, urlencode
+import aiofiles
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from app.compression import PRECOMPRESSED, precompress
+from app.config import settings
+
+try:
+    import boto3
+    from botocore.client import Config as BotoConfig
+    from botocore.exceptions import ClientError
+except ImportError:  # pragma: no cover - optional dependency
+    boto3 = None
+
+
+class StorageBackend(abc.ABC):
+    """Where uploaded files live; keys are relative, '/'-separated paths"""
+
+    @abc.abstractmethod
+    def save(self, source: Path, key: str, content_type: Optional[str] = None):
+        """Move a local file to key"""
+
+    @abc.abstractmethod
+    def fetch(self, key: str, destination: Path):
+        """Copy the object at key to a local file"""
+
+    @abc.abstractmethod
+    def size(self, key: str) -> Optional[int]:
+        """Size of the object at key, or None if there is none"""
+
+    def exists(self, key: str) -> bool:
+        return self.size(key) is not None
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        """Remove the object at key, if any"""
+
+    @abc.abstractmethod
+    def url(self, key: str) -> str:
+        """Stable URL stored on records (ProjectFile.file_url, demo_images, ...)"""
+
+    @abc.abstractmethod
+    def key_for(self, url: str) -> Optional[str]:
+        """Inverse of url(); None for URLs this backend didn't hand out"""
+
+    @abc.abstractmethod
+    def presigned_put(self, key: str, sha256: str, size: int, content_type: str, expires: int) -> Dict:
+        """{"method", "url", "headers"} for a direct upload of exactly these bytes to key"""
+
+    @abc.abstractmethod
+    def presigned_get(self, key: str, expires: int, filename: Optional[str] = None) -> str:
+        """Time-limited download URL for key"""
+
+
+def sign(*parts) -> str:
+    message = "\n".join(str(part) for part in parts).encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+def verify(signature: str, expires: int, *parts) -> bool:
+    return expires >= time.time() and hmac.compare_digest(signature, sign(*parts, expires))
+
+
+class LocalStorage(StorageBackend):
+    def __init__(self, root: str = "uploads", base_url: str = "/uploads"):
+        self.root = root
+        self.base_url = base_url.rstrip("/")
+
+    def path(self, key: str) -> Path:
+        root = Path(self.root).resolve()
+        path = (root / key).resolve()
+        if root not in path.parents:
+            raise ValueError(f"Key outside the storage root: {key}")
+        return path
+
+    def save(self, source: Path, key: str, content_type: Optional[str] = None):
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(source), path)
+        precompress(path)
+
+    def fetch(self, key: str, destination: Path):
+        shutil.copyfile(self.path(key), destination)
+
+    def size(self, key: str) -> Optional[int]:
+        path = self.path(key)
+        return path.stat().st_size if path.is_file() else None
+
+    def delete(self, key: str):
+        path = self.path(key)
+        for sibling in [path, *(path.with_name(path.name + suffix) for _, suffix in PRECOMPRESSED)]:
+            sibling.unlink(missing_ok=True)
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def key_for(self, url: str) -> Optional[str]:
+        prefix = self.base_url.lstrip("/") + "/"
+        url = url.lstrip("/")
+        return url[len(prefix):] if url.startswith(prefix) else None
+
+    def presigned_put(self, key: str, sha256: str, size: int, content_type: str, expires: int) -> Dict:
+        expires_at = int(time.time()) + expires
+        query = {"sha256": sha256, "size": size, "expires": expires_at, "signature": sign("PUT", key, sha256, size, expires_at)}
+        return {
+            "method": "PUT",
+            "url": f"/api/storage/{quote(key)}?{urlencode(query)}",
+            "headers": {"Content-Type": content_type},
+        }
+
+    def presigned_get(self, key: str, expires: int, filename: Optional[str] = None) -> str:
+        expires_at = int(time.time()) + expires
+        query = {"expires": expires_at, "signature": sign("GET", key, filename or "", expires_at)}
+        if filename:
+            query["filename"] = filename
+        return f"/api/storage/{quote(key)}?{urlencode(query)}"
+
+    async def receive(self, key: str, sha256: str, size: int, chunks: AsyncIterator[bytes]):
+        """Write a presigned PUT body to key if it is exactly the signed bytes"""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{secrets.token_hex(8)}.part")
+        hasher = hashlib.sha256()
+        written = 0
+        try:
+            async with aiofiles.open(partial, "wb") as out_file:
+                async for chunk in chunks:
+                    written += len(chunk)
+                    if written > size:
+                        raise HTTPException(status_code=413, detail=f"Body exceeds the signed size ({size} bytes)")
+                    hasher.update(chunk)
+                    await out_file.write(chunk)
+            if written != size or hasher.hexdigest() != sha256:
+                raise HTTPException(status_code=400, detail="Body does not match the signed size and sha256")
+            os.replace(partial, path)
+        finally:
+            partial.unlink(missing_ok=True)
+        await run_in_threadpool(precompress, path)
+
+
+class S3Storage(StorageBackend):
+    def __init__(self, bucket: str, endpoint_url: Optional[str] = None, region: Optional[str] = None,
+                 access_key_id: Optional[str] = None, secret_access_key: Optional[str] = None,
+                 public_url: Optional[str] = None):
+        if boto3 is None:
+            raise RuntimeError("STORAGE_BACKEND=s3 needs boto3 (pip install boto3)")
+        self.bucket = bucket
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or None,
+            region_name=region or None,
+            aws_access_key_id=access_key_id or None,
+            aws_secret_access_key=secret_access_key or None,
+            # Path-style addressing and SigV4 work with MinIO as well as AWS
+            config=BotoConfig(signature_version="s3v4", s3={"addressing_style": "path"}),
+        )
+        base = public_url or (f"{endpoint_url.rstrip('/')}/{bucket}" if endpoint_url else f"https://{bucket}.s3.amazonaws.com")
+        self.base_url = base.rstrip("/")
+
+    def save(self, source: Path, key: str, content_type: Optional[str] = None):
+        extra = {"ContentType": content_type} if content_type else None
+        self.client.upload_file(str(source), self.bucket, key, ExtraArgs=extra)
+        os.unlink(source)
+
+    def fetch(self, key: str, destination: Path):
+        self.client.download_file(self.bucket, key, str(destination))
+
+    def size(self, key: str) -> Optional[int]:
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)["ContentLength"]
+        except ClientError as error:
+            if error.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def delete(self, key: str):
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def key_for(self, url: str) -> Optional[str]:
+        prefix = self.base_url + "/"
+        return url[len(prefix):] if url.startswith(prefix) else None
+
+    def presigned_put(self, key: str, sha256: str, size: int, content_type: str, expires: int) -> Dict:
+        checksum = base64.b64encode(bytes.fromhex(sha256)).decode()
+        url = self.client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": self.bucket, "Key": key, "ContentType": content_type, "ChecksumSHA256": checksum},
+            ExpiresIn=expires,
+        )
+        return {
+            "method": "PUT",
+            "url": url,
+            "headers": {"Content-Type": content_type, "x-amz-checksum-sha256": checksum},
+        }
+
+    def presigned_get(self, key: str, expires: int, filename: Optional[str] = None) -> str:
+        params = {"Bucket": self.bucket, "Key": key}
+        if filename:
+            params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
+        return self.client.generate_presigned_url("get_object", Params=params, ExpiresIn=expires)
+
+
+_storage: Optional[StorageBackend] = None
+
+def build_storage() -> StorageBackend:
+    if settings.STORAGE_BACKEND == "s3":
+        return S3Storage(
+            bucket=settings.S3_BUCKET,
+            endpoint_url=settings.S3_ENDPOINT_URL,
+            region=settings.S3_REGION,
+            access_key_id=settings.S3_ACCESS_KEY_ID,
+            secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+            public_url=settings.S3_PUBLIC_URL,
+        )
+    return LocalStorage(settings.STORAGE_LOCAL_ROOT, settings.STORAGE_LOCAL_URL)
+
+def get_storage() -> StorageBackend:
+    global _storage
+    if _storage is None:
+        _storage = build_storage()
+    return _storage
@@ -0,0 +1,90 @@
+"""
+Streaming upload helpers.
+
+Starlette spools multipart files to a temporary file (in memory only up to
+1MB), so handlers should never call `await file.read()` on the whole upload.
+save_upload() copies it to its destination UPLOAD_CHUNK_SIZE bytes at a time
+and stops as soon as the file passes its size limit, so memory per upload
+stays constant whatever the file size.
+
+RequestSizeLimitMiddleware rejects request bodies over MAX_REQUEST_BODY_SIZE
+with 413 before they are parsed and spooled at all: from Content-Length when
+the client sends it, otherwise by counting the body as it streams in.
+"""
+
+import os
+from pathlib import Path
+from typing import Union
+import aiofiles
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.config import settings
+
+MB = 1024 * 1024
+
+# Project template uploads
+ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif'}
+ALLOWED_VIDEO_EXTENSIONS = {'.mp4', '.webm', '.ogg', '.mov'}
+ALLOWED_SOURCE_EXTENSIONS = {'.zip', '.rar', '.7z', '.tar', '.gz'}
+
+
+def file_too_large(max_size: int) -> HTTPException:
+    return HTTPException(status_code=400, detail=f"File too large (max {max_size // MB}MB)")
+
+async def save_upload(file: UploadFile, destination: Union[str, Path], max_size: int, chunk_size: int = 0, hasher=None) -> int:
+    """Stream file to destination in bounded chunks, feeding hasher if given; returns the size written"""
+    destination = Path(destination)
+    partial = destination.with_name(destination.name + ".part")
+    written = 0
+    try:
+        async with aiofiles.open(partial, "wb") as out_file:
+            while chunk := await file.read(chunk_size or settings.UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > max_size:
+                    raise file_too_large(max_size)
+                if hasher is not None:
+                    hasher.update(chunk)
+                await out_file.write(chunk)
+        os.replace(partial, destination)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    return written
+
+
+def body_too_large(max_size: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"Request body too large (max {max_size // MB}MB)")
+
+
+class RequestSizeLimitMiddleware:
+    """ASGI middleware answering 413 for request bodies over max_size"""
+
+    def __init__(self, app: ASGIApp, max_size: int):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_size:
+            response = JSONResponse({"detail": body_too_large(self.max_size).detail}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    # Raised inside the body parser; FastAPI passes HTTPExceptions through
+                    raise body_too_large(self.max_size)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,104 @@
+"""
+Benchmark JSON serialization of catalog list responses.
+
+Compares, on 100 (the default page size), 1k and 10k project-template rows:
+- json.loads with codec.loads for the JSON column values
+- a response_model list endpoint returning model_dump() dicts (validated and
+  serialized again by FastAPI) with codec.schema_response, which encodes the
+  ORM rows straight from their attributes
+
+Usage:
+    cd backend
+    python scripts/bench_serialization.py [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from typing import List
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app import codec
+from app.codec import FastJSONResponse, schema_response
+from app.models import ProjectTemplate
+from app.schemas import ProjectTemplateRead
+
+
+def make_rows(count: int) -> list:
+    now = datetime.utcnow()
+    return [
+        {
+            "id": i,
+            "title": f"Template {i}",
+            "category": "IoT",
+            "description": "An end-to-end IoT project with firmware, backend and dashboard. " * 8,
+            "tech_stack": ["Python", "FastAPI", "React", "ESP32", "MQTT"],
+            "price": 4999.0,
+            "time_duration": "4 weeks",
+            "requirements": "Basic Python",
+            "demo_images": [f"/uploads/project-templates/images/template_{i}_{n}.webp" for n in range(6)],
+            "demo_video": None,
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def response_model_path(field, orm_rows) -> bytes:
+    """What a handler returning [row.model_dump() ...] through response_model costs"""
+    content = [row.model_dump() for row in orm_rows]
+    serialized = asyncio.run(serialize_response(field=field, response_content=content, is_coroutine=True))
+    return FastJSONResponse(serialized).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"JSON codec: {'orjson' if codec.use_orjson() else 'json (orjson not installed or FAST_JSON=false)'}")
+    print(f"{'rows':>6}  {'case':<28} {'before (ms)':>12} {'after (ms)':>12} {'speedup':>8}")
+    for count in (100, 1_000, 10_000):
+        rows = make_rows(count)
+        column_values = [json.dumps(row["demo_images"]) for row in rows]
+        orm_rows = [ProjectTemplate(**row) for row in rows]
+        field = create_response_field(name="response", type_=List[ProjectTemplateRead])
+        cases = [
+            (
+                "JSON column decode",
+                lambda: [json.loads(value) for value in column_values],
+                lambda: [codec.loads(value) for value in column_values],
+            ),
+            (
+                "list endpoint per row",
+                lambda: response_model_path(field, orm_rows),
+                lambda: schema_response(List[ProjectTemplateRead], orm_rows).body,
+            ),
+        ]
+        for name, before, after in cases:
+            old = best_of(args.repeat, before)
+            new = best_of(args.repeat, after)
+            print(f"{count:>6}  {name:<28} {old * 1000:>12.2f} {new * 1000:>12.2f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
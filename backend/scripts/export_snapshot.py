@@ -0,0 +1,38 @@
+"""
+Export the public catalog API to a static snapshot.
+
+Writes a new version under SNAPSHOT_DIR (or the given directory), points
+SNAPSHOT_DIR/current at it and keeps the newest SNAPSHOT_KEEP versions. The
+files are served by the API at /snapshots/current/ and can be synced to a CDN.
+
+Usage:
+    cd backend
+    python scripts/export_snapshot.py [directory] [--keep N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlmodel import Session
+from app.config import settings
+from app.deps import engine
+from app.snapshot import export_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", nargs="?", default=settings.SNAPSHOT_DIR)
+    parser.add_argument("--keep", type=int, default=settings.SNAPSHOT_KEEP)
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        manifest = export_snapshot(session, root=args.directory, keep=args.keep)
+    print(f"Wrote snapshot {manifest['version']} ({len(manifest['files'])} files) to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
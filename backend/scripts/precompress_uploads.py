@@ -0,0 +1,32 @@
+"""
+Write .br/.gz siblings for text-like files already in uploads/.
+
+New uploads are precompressed when they are saved; run this once for files
+uploaded before that, or after changing COMPRESSION_MIN_SIZE.
+
+Usage:
+    cd backend
+    python scripts/precompress_uploads.py [directory]
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.compression import PRECOMPRESSED, precompress
+
+
+def main():
+    root = Path(sys.argv[1] if len(sys.argv) > 1 else "uploads")
+    suffixes = tuple(suffix for _, suffix in PRECOMPRESSED)
+    written = 0
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and not path.name.endswith(suffixes):
+            written += len(precompress(path))
+    print(f"Wrote {written} precompressed files under {root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 import sys
 from pathlib import Path
-import json
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -39,8 +38,8 @@ def seed_data():
                 
                 The project has undergone extensive field tests in Kottayam and Pathanamthitta districts, showing a 15% increase in yield and significant reduction in labor costs. The system includes a dashboard for plantation owners to monitor yield and tree health in real-time.
                 """,
-                tags=json.dumps(["IoT", "Automation", "Agriculture", "Embedded Systems"]),
-                features=json.dumps(["Precision Tapping", "Solar Powered", "Rain Guard Compatible", "Mobile App Control"]),
+                tags=["IoT", "Automation", "Agriculture", "Embedded Systems"],
+                features=["Precision Tapping", "Solar Powered", "Rain Guard Compatible", "Mobile App Control"],
                 image="/examples/tap1.jpg"
             ),
             Project(
@@ -48,8 +47,8 @@ def seed_data():
                 slug="iot-smart-farming-node",
                 description="A modular IoT node for monitoring soil moisture, temperature, and humidity.",
                 full_description="This project focuses on creating a low-cost, energy-efficient IoT node that can be deployed in large numbers across a farm. It uses LoRaWAN for long-range communication and solar harvesting for power.",
-                tags=json.dumps(["IoT", "LoRaWAN", "Sensors"]),
-                features=json.dumps(["Soil Moisture Sensing", "Temperature/Humidity", "Solar Harvesting", "Long Range"]),
+                tags=["IoT", "LoRaWAN", "Sensors"],
+                features=["Soil Moisture Sensing", "Temperature/Humidity", "Solar Harvesting", "Long Range"],
                 image="/examples/iot_node.jpg"
             ),
             Project(
@@ -57,8 +56,8 @@ def seed_data():
                 slug="vision-crop-monitoring",
                 description="Using computer vision to detect diseases and pests in crops early.",
                 full_description="Leveraging modern CNN architectures, this system analyzes images captured by drones or smartphones to identify common crop diseases with high accuracy, enabling targeted intervention.",
-                tags=json.dumps(["AI", "Computer Vision", "Python"]),
-                features=json.dumps(["Disease Detection", "Pest Identification", "Yield Estimation", "Mobile Integration"]),
+                tags=["AI", "Computer Vision", "Python"],
+                features=["Disease Detection", "Pest Identification", "Yield Estimation", "Mobile Integration"],
                 image="/examples/vision_ai.jpg"
             )
         ]
@@ -127,17 +126,17 @@ def seed_data():
             Product(
                 name="Aelvynor Rubber Tapping Machine",
                 description="The world's most advanced automated rubber tapping solution for smallholders.",
-                features=json.dumps([
+                features=[
                     "Adaptive tapping depth",
                     "Battery powered",
                     "Sensor-driven precision",
                     "Zero-maintenance design"
-                ]),
-                specs=json.dumps({
+                ],
+                specs={
                     "weight": "12kg",
                     "battery": "10Ah",
                     "power": "12V DC"
-                })
+                }
             )
         ]
         
@@ -4,6 +4,7 @@ Pytest configuration and shared fixtures
 
 import pytest
 from sqlmodel import Session, create_engine, SQLModel
+from sqlalchemy.pool import StaticPool
 
 # Import all models to ensure they're registered with SQLModel
 from app.models import (
@@ -17,8 +18,14 @@ def db_session():
     Create an in-memory SQLite database session for testing.
     Each test gets a fresh database.
     """
-    # Create in-memory SQLite database
-    engine = create_engine("sqlite:///:memory:", echo=False)
+    # Create in-memory SQLite database, shared across threads so handlers
+    # that run crud in the threadpool see the same connection
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
     
     # Create all tables
     SQLModel.metadata.create_all(engine)
@@ -29,3 +36,28 @@ def db_session():
     
     # Cleanup happens automatically when engine is closed
 
+
+
+@pytest.fixture(scope="function")
+def client(db_session):
+    """
+    TestClient for app.main with every session dependency bound to db_session
+    and admin authentication bypassed.
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.deps import get_db, get_read_db, get_async_db, get_current_admin
+    from app.cache import catalog_cache
+
+    def override_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_read_db] = override_db
+    app.dependency_overrides[get_async_db] = override_db
+    app.dependency_overrides[get_current_admin] = lambda: Admin(id=1, username="admin", password_hash="")
+    catalog_cache.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+    catalog_cache.clear()
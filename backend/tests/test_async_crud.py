@@ -0,0 +1,47 @@
+"""
+Tests for the async crud variants (threadpool and AsyncSession paths)
+"""
+
+import pytest
+from sqlmodel import Session, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import async_crud
+from app.models import Contact
+from app.schemas import ContactCreate, ProjectRequestCreate, ProjectRequestUpdate
+
+
+@pytest.mark.asyncio
+async def test_create_contact_with_sync_session(db_session: Session):
+    """A regular Session is run in the threadpool"""
+    contact = await async_crud.create_contact(
+        db_session, ContactCreate(name="A", email="a@test.com", phone="1", message="hi")
+    )
+    assert contact.id is not None
+    assert contact.status == "new"
+    assert db_session.exec(select(Contact)).one().email == "a@test.com"
+
+
+@pytest.mark.asyncio
+async def test_create_and_update_with_async_session():
+    """An AsyncSession runs the same crud functions on the async driver"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        request = await async_crud.create_project_request(
+            session,
+            ProjectRequestCreate(
+                name="B", email="b@test.com", phone="2",
+                college_company="College", custom_description="desc"
+            ),
+        )
+        updated = await async_crud.update_project_request(
+            session, request.id, ProjectRequestUpdate(notes="Uploaded files: x.pdf")
+        )
+        assert updated.notes == "Uploaded files: x.pdf"
+        assert updated.status == "pending"
+
+    await engine.dispose()
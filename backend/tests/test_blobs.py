@@ -0,0 +1,101 @@
+"""
+Tests for the content-addressed upload store
+"""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from sqlmodel import select
+
+from app.models import Blob, ProjectFile
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def make_request(client):
+    return client.post("/api/project-request", data={
+        "name": "A", "email": "a@example.com", "phone": "1", "college_company": "C", "custom_description": "d",
+    }).json()["id"]
+
+
+def upload(client, request_id, data, name="report.pdf"):
+    return client.post(
+        f"/api/admin/project-requests/{request_id}/files",
+        files={"file": (name, data)}, data={"file_type": "report"},
+    ).json()
+
+
+def test_identical_uploads_share_one_blob(client, db_session, workdir):
+    request_id = make_request(client)
+    data = b"%PDF-1.4 same bytes"
+    first = upload(client, request_id, data)
+    second = upload(client, request_id, data, name="copy of report.pdf")
+    other = upload(client, request_id, b"%PDF-1.4 other bytes")
+
+    digest = hashlib.sha256(data).hexdigest()
+    assert first["file_url"] == second["file_url"] == f"uploads/blobs/{digest[:2]}/{digest[2:4]}/{digest}.pdf"
+    assert other["file_url"] != first["file_url"]
+    assert Path(first["file_url"]).read_bytes() == data
+    blob = db_session.exec(select(Blob).where(Blob.path == first["file_url"].removeprefix("uploads/"))).one()
+    assert (blob.ref_count, blob.size) == (2, len(data))
+
+
+def test_last_reference_removes_the_file(client, db_session, workdir):
+    request_id = make_request(client)
+    first = upload(client, request_id, b"%PDF-1.4 shared")
+    second = upload(client, request_id, b"%PDF-1.4 shared")
+
+    client.delete(f"/api/admin/project-files/{first['id']}")
+    assert Path(first["file_url"]).exists()
+    client.delete(f"/api/admin/project-files/{second['id']}")
+    assert not Path(first["file_url"]).exists()
+    assert db_session.exec(select(Blob)).all() == []
+    assert db_session.exec(select(ProjectFile)).all() == []
+
+
+def test_replaced_template_media_is_released(client, workdir):
+    template_id = client.post("/api/admin/project-templates", json={
+        "title": "T", "category": "iot", "description": "d", "time_duration": "1w", "tech_stack": ["C"],
+    }).json()["id"]
+    images = [
+        client.post(f"/api/admin/project-templates/{template_id}/upload-image",
+                    files={"file": (f"{i}.png", b"\x89PNG" + bytes([i]) * 100)}).json()["url"]
+        for i in range(2)
+    ]
+    client.put(f"/api/admin/project-templates/{template_id}", json={"demo_images": images})
+    client.put(f"/api/admin/project-templates/{template_id}", json={"demo_images": images[1:]})
+    assert not Path(images[0].lstrip("/")).exists()
+    assert Path(images[1].lstrip("/")).exists()
+
+    client.delete(f"/api/admin/project-templates/{template_id}")
+    assert not Path(images[1].lstrip("/")).exists()
+
+
+def test_replaced_product_brochure_is_released(client, workdir):
+    brochures = [
+        client.post("/api/admin/product/upload-brochure", files={"file": (f"{i}.pdf", b"%PDF-1.4 " + bytes([i]))}).json()["url"]
+        for i in range(2)
+    ]
+    product = {"name": "P", "description": "d", "brochure": brochures[0]}
+    client.put("/api/admin/product", json=product)
+    client.put("/api/admin/product", json={**product, "brochure": brochures[1]})
+    assert not Path(brochures[0].lstrip("/")).exists()
+    assert Path(brochures[1].lstrip("/")).exists()
+
+
+def test_last_reference_deletes_the_object_before_the_row(client, db_session, workdir):
+    from app import blobs, crud
+
+    request_id = make_request(client)
+    stored = upload(client, request_id, b"%PDF-1.4 locked")
+    key = stored["file_url"].removeprefix("uploads/")
+    rows_seen = []
+    crud.release_blob_reference(db_session, key, on_last=lambda blob: rows_seen.append(crud.get_blob(db_session, blob.path)))
+    assert rows_seen[0] is not None
+    assert crud.get_blob(db_session, key) is None
+    assert blobs.release(db_session, "/" + stored["file_url"]) == 0
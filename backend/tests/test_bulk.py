@@ -0,0 +1,67 @@
+"""
+Tests for bulk admin status updates and deletes
+"""
+
+from sqlmodel import Session, select
+
+from app.models import Contact, CoursePurchase
+
+
+def test_bulk_update_contacts_status(client, db_session: Session):
+    for i in range(3):
+        db_session.add(Contact(name=f"c{i}", email="c@test.com", phone="1", message="m"))
+    db_session.commit()
+    ids = [c.id for c in db_session.exec(select(Contact)).all()]
+
+    response = client.patch("/api/admin/contacts/bulk", json={"ids": ids[:2] + [999], "status": "read"})
+    assert response.status_code == 200
+    assert response.json() == {"affected": 2}
+    statuses = sorted(c.status for c in db_session.exec(select(Contact)).all())
+    assert statuses == ["new", "read", "read"]
+
+
+def test_bulk_routes_do_not_clash_with_item_routes(client, db_session: Session):
+    db_session.add(CoursePurchase(name="p", email="p@test.com", phone="1", course_id=1))
+    db_session.commit()
+    purchase_id = db_session.exec(select(CoursePurchase)).one().id
+
+    response = client.patch("/api/admin/course-purchases/bulk", json={"ids": [purchase_id], "status": "confirmed"})
+    assert response.json() == {"affected": 1}
+
+    response = client.post("/api/admin/course-purchases/bulk-delete", json={"ids": [purchase_id]})
+    assert response.json() == {"affected": 1}
+    assert db_session.exec(select(CoursePurchase)).all() == []
+
+
+def test_bulk_rejects_empty_id_list(client):
+    assert client.patch("/api/admin/contacts/bulk", json={"ids": [], "status": "read"}).status_code == 422
+
+
+def test_bulk_delete_project_requests_releases_their_files(client, db_session: Session, tmp_path, monkeypatch):
+    from pathlib import Path
+    from app.models import Blob, ProjectFile
+
+    monkeypatch.chdir(tmp_path)
+    request_id = client.post("/api/project-request", data={
+        "name": "A", "email": "a@example.com", "phone": "1", "college_company": "C", "custom_description": "d",
+    }).json()["id"]
+    file_url = client.post(
+        f"/api/admin/project-requests/{request_id}/files",
+        files={"file": ("report.pdf", b"%PDF-1.4 bulk")}, data={"file_type": "report"},
+    ).json()["file_url"]
+
+    response = client.post("/api/admin/project-requests/bulk-delete", json={"ids": [request_id]})
+    assert response.json() == {"affected": 1}
+    assert db_session.exec(select(ProjectFile)).all() == []
+    assert db_session.exec(select(Blob)).all() == []
+    assert not Path(file_url).exists()
+
+
+def test_bulk_rejects_unknown_status(client, db_session: Session):
+    db_session.add(Contact(name="c", email="c@test.com", phone="1", message="m"))
+    db_session.commit()
+    contact_id = db_session.exec(select(Contact)).one().id
+
+    response = client.patch("/api/admin/contacts/bulk", json={"ids": [contact_id], "status": "confirmed"})
+    assert response.status_code == 422
+    assert db_session.exec(select(Contact)).one().status == "new"
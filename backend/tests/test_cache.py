@@ -0,0 +1,61 @@
+"""
+Tests for the public catalog cache and its invalidation from admin writes
+"""
+
+import time
+
+from app.cache import TTLCache, catalog_cache
+
+
+def test_lru_eviction():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set(("a",), 1)
+    cache.set(("b",), 2)
+    cache.get(("a",))
+    cache.set(("c",), 3)
+    assert cache.get(("a",)) == (True, 1)
+    assert cache.get(("b",)) == (False, None)
+
+
+def test_ttl_expiry():
+    cache = TTLCache(maxsize=10, ttl=0.01)
+    cache.set(("a",), 1)
+    time.sleep(0.02)
+    assert cache.get(("a",)) == (False, None)
+    assert cache.stats()["size"] == 0
+
+
+def test_invalidate_namespace():
+    cache = TTLCache()
+    cache.set(("projects", 0, 100), [])
+    cache.set(("projects", "slug"), {})
+    cache.set(("courses", 0, 100), [])
+    cache.invalidate("projects")
+    assert cache.stats()["size"] == 1
+    assert cache.get(("courses", 0, 100))[0]
+
+
+def test_entries_loaded_right_after_invalidation_expire_early():
+    cache = TTLCache(ttl=60, settle=0.01)
+    cache.invalidate("projects")
+    cache.set(("projects", 0, 100), ["stale replica page"])
+    cache.set(("courses", 0, 100), [])
+    time.sleep(0.02)
+    assert cache.get(("projects", 0, 100)) == (False, None)
+    assert cache.get(("courses", 0, 100))[0]
+
+
+def test_catalog_reads_hit_cache_until_admin_write(client):
+    project = {"title": "P", "slug": "p", "description": "d", "full_description": "f", "tags": ["iot"]}
+    assert client.get("/api/projects").json() == []
+    # The cached empty page is served until an admin write invalidates it
+    created = client.post("/api/admin/projects", json=project).json()
+    assert [p["slug"] for p in client.get("/api/projects").json()] == ["p"]
+
+    misses = catalog_cache.stats()["misses"]
+    assert client.get("/api/projects/p").json()["title"] == "P"
+    assert client.get("/api/projects/p").json()["title"] == "P"
+    assert catalog_cache.stats()["misses"] == misses + 1
+
+    client.put(f"/api/admin/projects/{created['id']}", json={**project, "title": "P2"})
+    assert client.get("/api/projects/p").json()["title"] == "P2"
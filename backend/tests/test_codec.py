@@ -0,0 +1,65 @@
+"""
+Tests for the shared JSON codec and the default response class
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+from app import codec
+from app.codec import FastJSONResponse
+
+
+def test_codec_round_trip():
+    value = {"when": datetime(2024, 1, 2, 3, 4, 5), "price": Decimal("1.5"), "tags": ["a"], 1: "x"}
+    assert codec.loads(codec.dumps(value)) == {
+        "when": "2024-01-02T03:04:05", "price": 1.5, "tags": ["a"], "1": "x",
+    }
+    assert isinstance(codec.dumps_str([]), str)
+
+
+def test_stdlib_fallback_matches(monkeypatch):
+    value = {"title": "Café", "tags": ["a", "b"]}
+    fast = codec.dumps(value)
+    monkeypatch.setattr(codec.settings, "FAST_JSON", False)
+    assert codec.dumps(value) == fast
+
+
+def test_app_default_response_class(client):
+    from app.main import app
+    routes = {route.path: route for route in app.routes}
+    assert routes["/api/projects"].response_class is FastJSONResponse
+    assert FastJSONResponse({"a": [1]}).body == b'{"a":[1]}'
+    assert client.get("/").json() == {"message": "Welcome to Aelvynor API"}
+
+
+def test_schema_response_encodes_orm_rows(db_session):
+    from typing import List
+    from fastapi import Response
+    from app import crud
+    from app.codec import schema_response
+    from app.schemas import ProjectCreate, ProjectRead
+
+    project = crud.create_project(db_session, ProjectCreate(
+        title="P", slug="p", description="d", full_description="f", tags=["iot"],
+    ))
+    injected = Response()
+    injected.headers["X-Total-Count"] = "1"
+    response = schema_response(List[ProjectRead], [project], injected)
+
+    expected = ProjectRead.model_validate(project.model_dump()).model_dump(mode="json")
+    assert codec.loads(response.body) == [expected]
+    assert response.headers["x-total-count"] == "1"
+    assert response.media_type == "application/json"
+
+
+def test_encode_rows_matches_pydantic(db_session):
+    from typing import List
+    from app import crud
+    from app.schemas import ProjectTemplateCreate, ProjectTemplateRead
+
+    template = crud.create_project_template(db_session, ProjectTemplateCreate(
+        title="T", category="iot", description="d", time_duration="1w", tech_stack=["C"], price=4999,
+    ))
+    adapter = codec.schema_adapter(List[ProjectTemplateRead])
+    expected = adapter.dump_json(adapter.validate_python([template], from_attributes=True))
+    assert codec.loads(codec.encode_rows(ProjectTemplateRead, [template])) == codec.loads(expected)
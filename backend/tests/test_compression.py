@@ -0,0 +1,74 @@
+"""
+Tests for response compression and precompressed static files
+"""
+
+import gzip
+
+from fastapi.testclient import TestClient
+
+from app import compression
+from app.compression import PrecompressedStaticFiles, accepted_encodings, precompress
+
+
+def make_templates(client, count=20):
+    for i in range(count):
+        client.post("/api/admin/project-templates", json={
+            "title": f"Template {i}", "category": "iot", "description": "A long description. " * 10,
+            "time_duration": "1w", "tech_stack": ["Python"],
+        })
+
+
+def test_accepted_encodings():
+    assert accepted_encodings("gzip, deflate") == ["gzip"]
+    assert accepted_encodings("br;q=0, gzip;q=0.5") == ["gzip"]
+    assert accepted_encodings("identity") == []
+
+
+def test_large_json_is_compressed(client):
+    make_templates(client)
+    response = client.get("/api/project-templates", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(response.json()) == 20
+
+    if compression.brotli is not None:
+        response = client.get("/api/project-templates", headers={"Accept-Encoding": "gzip, br"})
+        assert response.headers["content-encoding"] == "br"
+        assert len(response.json()) == 20
+
+
+def test_small_or_unaccepted_responses_are_not_compressed(client):
+    assert "content-encoding" not in client.get("/", headers={"Accept-Encoding": "gzip"}).headers
+    make_templates(client)
+    assert "content-encoding" not in client.get("/api/project-templates", headers={"Accept-Encoding": "identity"}).headers
+
+
+def test_compressed_etag_is_weak_and_still_matches(client):
+    make_templates(client)
+    response = client.get("/api/project-templates", headers={"Accept-Encoding": "gzip"})
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    response = client.get("/api/project-templates", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_precompressed_static_files(tmp_path):
+    data = ("id,title\n" + "1,Rubber tapping machine\n" * 200).encode()
+    (tmp_path / "list.csv").write_bytes(data)
+    (tmp_path / "photo.jpg").write_bytes(b"\xff\xd8" * 1000)
+    written = precompress(tmp_path / "list.csv")
+    expected = ["list.csv.br", "list.csv.gz"] if compression.brotli is not None else ["list.csv.gz"]
+    assert sorted(path.name for path in written) == expected
+    assert precompress(tmp_path / "photo.jpg") == []
+    assert gzip.decompress((tmp_path / "list.csv.gz").read_bytes()) == data
+
+    static = TestClient(PrecompressedStaticFiles(directory=tmp_path))
+    response = static.get("/list.csv", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-length"] == str((tmp_path / "list.csv.gz").stat().st_size)
+    assert response.content == data
+
+    response = static.get("/list.csv", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.content == data
@@ -0,0 +1,84 @@
+"""
+Tests for ETag / Last-Modified conditional GETs on the public catalog
+"""
+
+from sqlalchemy import event
+
+PROJECT = {"title": "P", "slug": "p", "description": "d", "full_description": "f", "tags": ["iot"]}
+
+
+def count_queries(db_session, fn):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return result, len(statements)
+
+
+def test_if_none_match_returns_304_without_querying(client, db_session):
+    client.post("/api/admin/projects", json=PROJECT)
+    first = client.get("/api/projects")
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and first.headers["last-modified"].endswith("GMT")
+
+    response, queries = count_queries(db_session, lambda: client.get("/api/projects", headers={"If-None-Match": etag}))
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert queries == 0
+
+    assert client.get("/api/projects", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_etag_changes_after_admin_write(client):
+    created = client.post("/api/admin/projects", json=PROJECT).json()
+    etag = client.get("/api/projects/p").headers["etag"]
+    client.put(f"/api/admin/projects/{created['id']}", json={**PROJECT, "title": "P2"})
+    response = client.get("/api/projects/p", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["title"] == "P2"
+
+
+def test_if_modified_since(client):
+    client.post("/api/admin/courses", json={"title": "C", "description": "d", "level": "l", "duration": "1w"})
+    last_modified = client.get("/api/courses").headers["last-modified"]
+    assert client.get("/api/courses", headers={"If-Modified-Since": last_modified}).status_code == 304
+    old = "Mon, 01 Jan 2001 00:00:00 GMT"
+    assert client.get("/api/courses", headers={"If-Modified-Since": old}).status_code == 200
+    # If-None-Match wins over If-Modified-Since
+    response = client.get("/api/courses", headers={"If-Modified-Since": last_modified, "If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+def test_last_modified_is_shared_across_workers(client, db_session):
+    """The floor comes from the database, so a fresh cache (another worker, a restart) sends the same value"""
+    from app.cache import catalog_cache
+
+    created = client.post("/api/admin/projects", json=PROJECT).json()
+    client.post("/api/admin/projects", json={**PROJECT, "slug": "p2"})
+    client.delete(f"/api/admin/projects/{created['id']}")
+    first = client.get("/api/projects").headers["last-modified"]
+    catalog_cache.clear()
+    assert client.get("/api/projects").headers["last-modified"] == first
+    assert client.get("/api/projects", headers={"If-Modified-Since": first}).status_code == 304
+
+
+def test_write_to_missing_row_keeps_last_modified(client, db_session):
+    from sqlmodel import select
+    from app.models import CatalogChange
+
+    client.post("/api/admin/courses", json={"title": "C", "description": "d", "level": "l", "duration": "1w"})
+    changes = lambda: [(row.namespace, row.changed_at) for row in db_session.exec(select(CatalogChange)).all()]
+    before = changes()
+    assert client.put("/api/admin/courses/999", json={"title": "C", "description": "d", "level": "l", "duration": "1w"}).status_code == 404
+    assert client.delete("/api/admin/courses/999").status_code == 404
+    db_session.expire_all()
+    assert changes() == before
@@ -0,0 +1,111 @@
+"""
+Tests for engine configuration in app.deps
+"""
+
+from sqlalchemy import event
+from sqlmodel import Session, create_engine
+
+from app.deps import set_sqlite_pragmas, get_sqlite_pragmas
+from app.pool import MonitoredQueuePool, pool_status
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    """The tuning profile is applied to every new file-backed connection"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    event.listen(engine, "connect", set_sqlite_pragmas)
+
+    with Session(engine) as session:
+        pragmas = get_sqlite_pragmas(session)
+
+    assert pragmas["journal_mode"] == "wal"
+    assert pragmas["synchronous"] == "1"  # NORMAL
+    assert pragmas["busy_timeout"] == "5000"
+    assert pragmas["temp_store"] == "2"  # MEMORY
+    assert int(pragmas["cache_size"]) == -64000
+    engine.dispose()
+
+
+def test_pool_status_reports_checkouts_and_waits(tmp_path):
+    """MonitoredQueuePool exposes checked-out/idle counts and wait statistics"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=MonitoredQueuePool, pool_size=2, max_overflow=1
+    )
+
+    with engine.connect():
+        status = pool_status(engine)
+        assert status["checked_out"] == 1
+        assert status["size"] == 2
+
+    status = pool_status(engine)
+    assert status["checked_out"] == 0
+    assert status["idle"] == 1
+    assert status["overflow"] == 0
+    assert status["wait"]["checkouts"] == 1
+    assert status["wait"]["timeouts"] == 0
+    engine.dispose()
+
+
+def test_read_db_routes_to_replica_unless_pinned(monkeypatch):
+    """Catalog reads use the replica; X-Read-Primary and the admin write cookie use the primary"""
+    from fastapi.testclient import TestClient
+    from sqlalchemy.pool import StaticPool
+    from sqlmodel import SQLModel
+    from app import deps
+    from app.main import app
+    from app.models import Course
+
+    def make_engine(title):
+        db_engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(db_engine)
+        with Session(db_engine) as session:
+            session.add(Course(title=title, description="d", level="l", duration="1w"))
+            session.commit()
+        return db_engine
+
+    primary, replica = make_engine("primary"), make_engine("replica")
+    monkeypatch.setattr(deps, "engine", primary)
+    monkeypatch.setattr(deps, "read_engine", replica)
+    app.dependency_overrides[deps.get_current_admin] = lambda: None
+
+    client = TestClient(app)
+    assert client.get("/api/courses").json()[0]["title"] == "replica"
+    assert client.get("/api/courses", headers={"X-Read-Primary": "1"}).json()[0]["title"] == "primary"
+
+    # An admin write sets the short-lived read_primary cookie
+    response = client.put("/api/admin/mission", json={"short": "s", "long": "l"})
+    assert response.status_code == 200
+    assert deps.READ_PRIMARY_COOKIE in response.cookies
+    assert client.get("/api/courses").json()[0]["title"] == "primary"
+    app.dependency_overrides.clear()
+
+
+def test_health_reports_configured_sqlite_pragmas(tmp_path, monkeypatch):
+    """GET /api/health reads back the tuning profile from the live connection"""
+    from fastapi.testclient import TestClient
+    from app import deps
+    from app.config import settings
+    from app.main import app
+
+    database_url = f"sqlite:///{tmp_path / 'health.db'}"
+    monkeypatch.setattr(settings, "DATABASE_URL", database_url)
+    monkeypatch.setattr(settings, "SQLITE_TUNING", True)
+    monkeypatch.setattr(settings, "SQLITE_SYNCHRONOUS", "FULL")
+    db_engine, _ = deps.build_engines(database_url)
+
+    def override_db():
+        with Session(db_engine) as session:
+            yield session
+
+    app.dependency_overrides[deps.get_db] = override_db
+    try:
+        with TestClient(app) as client:
+            database = client.get("/api/health").json()["database"]
+    finally:
+        app.dependency_overrides.clear()
+        db_engine.dispose()
+
+    assert database["engine"] == "sqlite"
+    assert database["pragmas"]["journal_mode"] == "wal"
+    assert database["pragmas"]["synchronous"] == "2"  # FULL
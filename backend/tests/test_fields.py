@@ -0,0 +1,64 @@
+"""
+Tests for ?fields= sparse fieldsets on the catalog lists
+"""
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app import crud
+from app.crud import PROJECT_SUMMARY
+from app.schemas import ProjectCreate
+
+
+def make_projects(client):
+    for i in range(3):
+        client.post("/api/admin/projects", json={
+            "title": f"Project {i}", "slug": f"project-{i}", "description": "d",
+            "full_description": "A long write-up. " * 50, "tags": ["iot"], "features": ["fast"],
+        })
+
+
+def test_summary_projection_omits_heavy_fields(client):
+    make_projects(client)
+    rows = client.get("/api/projects", params={"fields": "summary"}).json()
+    assert len(rows) == 3
+    assert set(rows[0]) == set(PROJECT_SUMMARY)
+    assert rows[0]["tags"] == ["iot"]
+
+    full = client.get("/api/projects").json()
+    assert "full_description" in full[0]
+
+
+def test_custom_fields_always_include_id(client):
+    make_projects(client)
+    rows = client.get("/api/projects", params={"fields": "title, slug"}).json()
+    assert rows[0] == {"id": rows[0]["id"], "title": "Project 0", "slug": "project-0"}
+
+
+def test_template_summary_projection(client):
+    client.post("/api/admin/project-templates", json={
+        "title": "T", "category": "iot", "description": "d", "time_duration": "1w",
+        "tech_stack": ["Python"], "requirements": "r", "demo_images": ["/a.webp"],
+    })
+    rows = client.get("/api/project-templates", params={"fields": "summary"}).json()
+    assert rows[0]["tech_stack"] == ["Python"]
+    assert "demo_images" not in rows[0] and "requirements" not in rows[0]
+
+
+def test_unknown_field_is_rejected(client):
+    response = client.get("/api/projects", params={"fields": "title,password_hash"})
+    assert response.status_code == 400
+    assert "password_hash" in response.json()["detail"]
+
+
+def test_projection_selects_only_requested_columns(db_session: Session):
+    crud.create_project(db_session, ProjectCreate(title="P", slug="p", description="d", full_description="f"))
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        rows = crud.get_projects(db_session, fields=("id", "title"))
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+    assert rows == [{"id": rows[0]["id"], "title": "P"}]
+    assert "full_description" not in statements[-1]
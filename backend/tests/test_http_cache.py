@@ -0,0 +1,39 @@
+"""
+Tests for the Cache-Control route policies
+"""
+
+from app.http_cache import CATALOG, NO_STORE, CachePolicy
+
+
+def test_policy_header():
+    assert NO_STORE.header == "no-store"
+    assert CachePolicy(public=True, max_age=60, s_maxage=300, stale_while_revalidate=600).header == (
+        "public, max-age=60, s-maxage=300, stale-while-revalidate=600"
+    )
+
+
+def test_catalog_routes_are_publicly_cacheable(client):
+    response = client.get("/api/project-templates")
+    assert response.headers["cache-control"] == CATALOG.header
+    assert "Accept-Encoding" in response.headers["vary"]
+
+    response = client.get("/api/project-templates", headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+    assert response.headers["cache-control"] == CATALOG.header
+
+    assert client.get("/api/project-templates/categories/list").headers["cache-control"].startswith("public")
+
+
+def test_errors_personal_reads_and_admin_are_not_stored(client):
+    assert client.get("/api/projects/missing").headers["cache-control"] == "no-store"
+    assert client.get("/api/payment/history/a@example.com").headers["cache-control"] == "no-store"
+    assert client.get("/api/admin/projects").headers["cache-control"] == "no-store"
+    response = client.post("/api/admin/projects", json={
+        "title": "P", "slug": "p", "description": "d", "full_description": "f",
+    })
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_clients_pinned_to_primary_are_not_shared(client):
+    response = client.get("/api/courses", headers={"X-Read-Primary": "1"})
+    assert response.headers["cache-control"] == "private, no-cache"
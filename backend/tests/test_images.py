@@ -0,0 +1,82 @@
+"""
+Tests for responsive image variants and srcsets
+"""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from app import crud, images
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(images.settings, "IMAGE_WORKERS", 0)
+    return tmp_path
+
+
+def make_template(client):
+    return client.post("/api/admin/project-templates", json={
+        "title": "T", "category": "iot", "description": "d", "time_duration": "1w", "tech_stack": ["C"],
+    }).json()["id"]
+
+
+def test_target_widths():
+    assert images.target_widths(4000, [320, 640, 1024]) == [320, 640, 1024]
+    assert images.target_widths(800, [320, 640, 1024]) == [320, 640, 800]
+    assert images.target_widths(200, [320, 640]) == [200]
+    assert images.target_widths(800, []) == []
+
+
+def test_srcsets_follow_blob_variants(client, db_session, workdir, monkeypatch):
+    monkeypatch.setattr(images.settings, "IMAGE_VARIANTS_ENABLED", False)
+    template_id = make_template(client)
+    url = client.post(
+        f"/api/admin/project-templates/{template_id}/upload-image", files={"file": ("shot.png", b"\x89PNG not really")},
+    ).json()["url"]
+    key = url.removeprefix("/uploads/")
+    digest = crud.get_blob(db_session, key).sha256
+    variants = []
+    for width in (320, 640):
+        for image_format in ("avif", "webp"):
+            variant_key = images.variant_key(digest, width, image_format)
+            Path("uploads", variant_key).parent.mkdir(parents=True, exist_ok=True)
+            Path("uploads", variant_key).write_bytes(b"x")
+            variants.append({"key": variant_key, "width": width, "format": image_format, "size": 1})
+    crud.set_blob_variants(db_session, key, variants)
+
+    updated = client.put(f"/api/admin/project-templates/{template_id}", json={"demo_images": [url, "/examples/old.jpg"]}).json()
+    base = f"/uploads/variants/{digest[:2]}/{digest[2:4]}/{digest}"
+    assert updated["demo_image_srcsets"] == {url: {
+        "image/avif": f"{base}-320w.avif 320w, {base}-640w.avif 640w",
+        "image/webp": f"{base}-320w.webp 320w, {base}-640w.webp 640w",
+    }}
+    assert client.get("/api/project-templates").json()[0]["demo_image_srcsets"] == updated["demo_image_srcsets"]
+
+    # The variants go with the original's last reference
+    client.delete(f"/api/admin/project-templates/{template_id}")
+    assert not Path("uploads", key).exists()
+    assert not any(Path("uploads", variant["key"]).exists() for variant in variants)
+
+
+def test_product_image_variants_are_generated_in_the_background(client, workdir, monkeypatch):
+    Image = pytest.importorskip("PIL.Image")
+    monkeypatch.setattr(images.settings, "IMAGE_VARIANT_FORMATS", "webp")
+    monkeypatch.setattr(images.settings, "IMAGE_VARIANT_WIDTHS", "320,640")
+    if images.supported_formats() != ["webp"]:
+        pytest.skip("Pillow was built without WebP")
+    buffer = io.BytesIO()
+    Image.new("RGB", (1000, 500), "teal").save(buffer, "PNG")
+
+    # TestClient returns once the background task has run
+    url = client.post("/api/admin/product/upload-image", files={"file": ("hero.png", buffer.getvalue())}).json()["url"]
+    product = client.put("/api/admin/product", json={
+        "name": "P", "description": "d", "features": [], "specs": {}, "image": url,
+    }).json()
+    candidates = product["image_srcset"]["image/webp"].split(", ")
+    assert [candidate.split(" ")[1] for candidate in candidates] == ["320w", "640w"]
+    with Image.open(Path(candidates[0].split(" ")[0].lstrip("/"))) as variant:
+        assert (variant.format, variant.size) == ("WEBP", (320, 160))
+    assert client.get("/api/product").json()[0]["image_srcset"] == product["image_srcset"]
@@ -0,0 +1,60 @@
+"""
+Tests that every crud list query is served by an index (EXPLAIN QUERY PLAN)
+"""
+
+import pytest
+from datetime import datetime
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app import crud
+from app.pagination import encode_cursor
+
+CURSOR = encode_cursor("next", datetime(2024, 1, 1), 10)
+
+LIST_QUERIES = [
+    (crud.get_applications, {}),
+    (crud.get_project_requests, {}),
+    (crud.get_project_requests, {"status": "pending"}),
+    (crud.get_project_requests, {"email": "a@test.com"}),
+    (crud.get_contacts, {}),
+    (crud.get_contacts, {"status": "new"}),
+    (crud.get_course_purchases, {"status": "pending"}),
+    (crud.get_product_inquiries, {"status": "new"}),
+    (crud.get_payments, {}),
+    (crud.get_payments, {"user_email": "a@test.com"}),
+    (crud.get_payments, {"status": "completed"}),
+    (crud.get_notifications, {"recipient_email": "a@test.com"}),
+    (crud.get_notifications, {"is_sent": False}),
+]
+
+
+def query_plan(db_session: Session, fn, kwargs):
+    """Capture the SQL a crud function runs and return its query plan"""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        fn(db_session, **kwargs)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = captured[-1]
+    raw = db_session.connection().connection.driver_connection
+    rows = raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [row[-1] for row in rows]
+
+
+@pytest.mark.parametrize("cursor", [None, CURSOR])
+@pytest.mark.parametrize("fn,kwargs", LIST_QUERIES, ids=lambda v: getattr(v, "__name__", str(v)))
+def test_list_query_uses_index(db_session: Session, fn, kwargs, cursor):
+    plan = query_plan(db_session, fn, {**kwargs, "cursor": cursor})
+    assert any("USING INDEX" in step or "USING COVERING INDEX" in step for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+    if kwargs or cursor:
+        # A filter or cursor must seek into the index, not walk all of it
+        assert all(step.startswith("SEARCH") for step in plan), plan
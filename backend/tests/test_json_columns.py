@@ -0,0 +1,65 @@
+"""
+Tests for the native JSON catalog columns
+"""
+
+from sqlmodel import Session
+
+from app import crud
+from app.schemas import ProjectCreate, ProjectTemplateCreate, ProjectTemplateUpdate
+
+
+def make_template(db_session: Session, title: str, tech_stack: list):
+    return crud.create_project_template(db_session, ProjectTemplateCreate(
+        title=title, category="iot", description="d", time_duration="2 weeks", tech_stack=tech_stack
+    ))
+
+
+def test_json_fields_round_trip_as_python_values(db_session: Session):
+    project = crud.create_project(db_session, ProjectCreate(
+        title="P", slug="p", description="d", full_description="f", tags=["iot"], features=["fast"]
+    ))
+    db_session.expire_all()
+    loaded = crud.get_project_by_slug(db_session, "p")
+    assert loaded.id == project.id
+    assert loaded.tags == ["iot"]
+    assert loaded.features == ["fast"]
+
+
+def test_update_keeps_json_list(db_session: Session):
+    template = make_template(db_session, "T", ["Python"])
+    updated = crud.update_project_template(db_session, template.id, ProjectTemplateUpdate(tech_stack=["Python", "Rust"]))
+    assert updated.tech_stack == ["Python", "Rust"]
+
+
+def test_filter_templates_by_tech(db_session: Session):
+    make_template(db_session, "Sensor node", ["C", "LoRaWAN"])
+    make_template(db_session, "Dashboard", ["Python", "React"])
+    make_template(db_session, "Vision", ["Python", "PyTorch"])
+
+    titles = {t.title for t in crud.get_project_templates(db_session, tech="Python")}
+    assert titles == {"Dashboard", "Vision"}
+    # Containment matches whole elements, not substrings of the stored text
+    assert crud.get_project_templates(db_session, tech="Py") == []
+
+
+def test_public_templates_tech_query(client):
+    client.post("/api/admin/project-templates", json={
+        "title": "Dashboard", "category": "web", "description": "d",
+        "time_duration": "1 week", "tech_stack": ["React"],
+    })
+    response = client.get("/api/project-templates", params={"tech": "React"})
+    assert response.status_code == 200
+    assert [t["tech_stack"] for t in response.json()] == [["React"]]
+
+
+def test_postgres_containment_compiles_to_jsonb_operator():
+    from unittest.mock import MagicMock
+    from sqlalchemy.dialects import postgresql
+    from app.models import ProjectTemplate
+
+    db = MagicMock()
+    db.get_bind.return_value.dialect.name = "postgresql"
+    clause = crud.json_array_contains(db, ProjectTemplate.tech_stack, "Python")
+    sql = str(clause.compile(dialect=postgresql.dialect()))
+    assert "@>" in sql
+    assert "LIKE" not in sql
@@ -0,0 +1,76 @@
+"""
+Tests for the materialized public catalog responses
+"""
+
+from sqlalchemy import event
+
+from app import cache
+from app.cache import catalog_cache
+
+
+def test_admin_write_rebuilds_default_page(client, db_session):
+    client.post("/api/admin/projects", json={
+        "title": "P", "slug": "p", "description": "d", "full_description": "f", "tags": ["iot"],
+    })
+    found, entry = catalog_cache.get((cache.PROJECTS, 0, 100, None))
+    assert found
+    assert entry.payload[0]["tags"] == ["iot"]
+
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = client.get("/api/projects")
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert statements == []
+    assert response.content == entry.body
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()[0]["slug"] == "p"
+
+
+def test_stored_body_matches_response_model(client):
+    client.post("/api/admin/project-templates", json={
+        "title": "T", "category": "iot", "description": "d", "time_duration": "1w", "tech_stack": ["C"],
+    })
+    template = client.get("/api/project-templates").json()[0]
+    # Serialized through ProjectTemplateRead: no fields outside the schema
+    assert set(template) == {
+        "id", "title", "category", "description", "tech_stack", "price", "time_duration", "requirements",
+        "demo_images", "demo_video", "is_active", "created_at", "updated_at", "demo_image_srcsets",
+    }
+
+
+def test_home_bundle_combines_default_pages(client):
+    client.post("/api/admin/courses", json={
+        "title": "C", "description": "d", "level": "beginner", "duration": "4w",
+    })
+    client.put("/api/admin/content", json={"hero_title": "Build things"})
+    response = client.get("/api/bundle/home")
+    bundle = response.json()
+    assert set(bundle) == {"mission", "content", "projects", "courses", "internships", "product"}
+    assert bundle["mission"] is None
+    assert bundle["content"]["hero_title"] == "Build things"
+    assert bundle["courses"] == client.get("/api/courses").json()
+    assert bundle["courses"][0]["title"] == "C"
+
+    etag = response.headers["etag"]
+    assert client.get("/api/bundle/home", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_home_bundle_is_rebuilt_when_a_part_changes(client):
+    etag = client.get("/api/bundle/home").headers["etag"]
+    client.post("/api/admin/projects", json={
+        "title": "P", "slug": "p", "description": "d", "full_description": "f",
+    })
+    found, entry = catalog_cache.get((cache.HOME,))
+    assert found
+    assert entry.payload["projects"][0]["slug"] == "p"
+    response = client.get("/api/bundle/home", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.content == entry.body
@@ -0,0 +1,100 @@
+"""
+Tests for keyset (cursor) pagination
+"""
+
+from datetime import datetime, timedelta
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.crud import get_contacts
+from app.models import Contact
+from app.pagination import encode_cursor
+
+
+def add_contacts(db_session: Session, count: int, start: datetime):
+    for i in range(count):
+        db_session.add(Contact(
+            name=f"c{i}", email=f"c{i}@test.com", phone="1", message="m",
+            created_at=start + timedelta(minutes=i)
+        ))
+    db_session.commit()
+
+
+def test_cursor_pages_are_stable_under_inserts(db_session: Session):
+    """New rows arriving mid-scroll do not shift later pages"""
+    start = datetime(2024, 1, 1)
+    add_contacts(db_session, 5, start)
+
+    first = get_contacts(db_session, limit=2)
+    assert [c.name for c in first] == ["c4", "c3"]
+
+    # A newer submission arrives while the admin is paging
+    db_session.add(Contact(name="new", email="n@test.com", phone="1", message="m",
+                           created_at=start + timedelta(hours=1)))
+    db_session.commit()
+
+    cursor = encode_cursor("next", first[-1].created_at, first[-1].id)
+    second = get_contacts(db_session, limit=2, cursor=cursor)
+    assert [c.name for c in second] == ["c2", "c1"]
+
+    back = get_contacts(db_session, limit=2, cursor=encode_cursor("prev", second[0].created_at, second[0].id))
+    assert [c.name for c in back] == ["c4", "c3"]
+
+
+def test_cursor_breaks_created_at_ties_by_id(db_session: Session):
+    """Rows sharing a timestamp are neither skipped nor duplicated"""
+    same = datetime(2024, 1, 1)
+    for i in range(3):
+        db_session.add(Contact(name=f"t{i}", email="t@test.com", phone="1", message="m", created_at=same))
+    db_session.commit()
+
+    first = get_contacts(db_session, limit=2)
+    rest = get_contacts(db_session, limit=2, cursor=encode_cursor("next", same, first[-1].id))
+    assert sorted(c.name for c in first + rest) == ["t0", "t1", "t2"]
+
+
+def test_list_endpoint_exposes_cursor_headers(client, db_session: Session):
+    add_contacts(db_session, 3, datetime(2024, 1, 1))
+
+    response = client.get("/api/admin/contacts", params={"limit": 2})
+    assert [c["name"] for c in response.json()] == ["c2", "c1"]
+    next_cursor = response.headers["X-Next-Cursor"]
+    assert "X-Prev-Cursor" not in response.headers
+
+    response = client.get("/api/admin/contacts", params={"limit": 2, "cursor": next_cursor})
+    assert [c["name"] for c in response.json()] == ["c0"]
+    assert "X-Next-Cursor" not in response.headers
+    assert "X-Prev-Cursor" in response.headers
+
+    assert client.get("/api/admin/contacts", params={"cursor": "garbage"}).status_code == 400
+
+
+def test_total_count_header_exact_and_estimated(client, db_session: Session):
+    add_contacts(db_session, 3, datetime(2024, 1, 1))
+    db_session.add(Contact(name="r", email="r@test.com", phone="1", message="m", status="read"))
+    db_session.commit()
+
+    response = client.get("/api/admin/contacts", params={"limit": 1, "status": "new"})
+    assert response.headers["X-Total-Count"] == "3"
+    assert "X-Total-Count-Estimated" not in response.headers
+
+    # Without planner statistics the estimate falls back to an exact count
+    response = client.get("/api/admin/contacts", params={"count": "estimate"})
+    assert response.headers["X-Total-Count"] == "4"
+    assert "X-Total-Count-Estimated" not in response.headers
+
+    db_session.exec(text("ANALYZE"))
+    response = client.get("/api/admin/contacts", params={"count": "estimate"})
+    assert response.headers["X-Total-Count"] == "4"
+    assert response.headers["X-Total-Count-Estimated"] == "true"
+
+    response = client.get("/api/admin/contacts", params={"count": "none"})
+    assert "X-Total-Count" not in response.headers
+
+
+def test_filtered_count_is_index_only(db_session: Session):
+    from app.pagination import count_rows
+    from tests.test_indexes import query_plan
+
+    plan = query_plan(db_session, lambda db: count_rows(db, Contact, status="new"), {})
+    assert plan == ["SEARCH contact USING COVERING INDEX ix_contact_status_created_at_id (status=?)"]
@@ -0,0 +1,151 @@
+"""
+Tests for resumable (tus-style) uploads
+"""
+
+import os
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app import resumable
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(resumable.settings, "UPLOAD_SESSION_DIR", str(tmp_path / "sessions"))
+    return tmp_path
+
+
+def make_template(client):
+    return client.post("/api/admin/project-templates", json={
+        "title": "T", "category": "iot", "description": "d", "time_duration": "1w", "tech_stack": ["C"],
+    }).json()["id"]
+
+
+def patch(client, location, offset, data):
+    return client.patch(location, content=data, headers={
+        "Upload-Offset": str(offset), "Content-Type": "application/offset+octet-stream",
+    })
+
+
+def test_video_upload_resumes_and_attaches_to_template(client, workdir):
+    template_id = make_template(client)
+    video = os.urandom(300_000)
+    response = client.post("/api/admin/uploads", json={
+        "target": "template-video", "target_id": template_id, "filename": "demo.mp4", "length": len(video),
+    })
+    assert response.status_code == 201
+    location = response.headers["location"]
+
+    assert patch(client, location, 0, video[:100_000]).headers["upload-offset"] == "100000"
+    # A retried chunk from a stale offset is refused; HEAD says where to carry on
+    assert patch(client, location, 0, video[:100_000]).status_code == 409
+    assert client.head(location).headers["upload-offset"] == "100000"
+    assert client.post(f"{location}/finalize").status_code == 409
+
+    assert patch(client, location, 100_000, video[100_000:]).headers["upload-offset"] == str(len(video))
+    url = client.post(f"{location}/finalize").json()["url"]
+    assert (workdir / url.lstrip("/")).read_bytes() == video
+    assert client.get(f"/api/project-templates/{template_id}").json()["demo_video"] == url
+    assert client.head(location).status_code == 404
+
+
+def test_project_file_upload_creates_record(client, workdir):
+    request_id = client.post("/api/project-request", data={
+        "name": "A", "email": "a@example.com", "phone": "1", "college_company": "C", "custom_description": "d",
+    }).json()["id"]
+    location = client.post("/api/admin/uploads", json={
+        "target": "project-file", "target_id": request_id, "filename": "../report.pdf", "length": 5,
+        "file_type": "report",
+    }).headers["location"]
+    patch(client, location, 0, b"%PDF-")
+    body = client.post(f"{location}/finalize").json()
+    assert body["file"]["file_type"] == "report"
+    assert body["url"].startswith("uploads/blobs/") and body["url"].endswith(".pdf")
+
+
+def test_upload_validation(client, workdir):
+    template_id = make_template(client)
+    create = lambda **kwargs: client.post("/api/admin/uploads", json={
+        "target": "template-video", "target_id": template_id, "filename": "demo.mp4", "length": 10, **kwargs,
+    })
+    assert create(filename="demo.exe").status_code == 400
+    assert create(length=101 * 1024 * 1024).status_code == 400
+    assert create(target_id=999).status_code == 404
+    location = create().headers["location"]
+    assert patch(client, location, 0, b"x" * 11).status_code == 413
+    assert client.patch(location, content=b"x", headers={"Upload-Offset": "0", "Content-Type": "text/plain"}).status_code == 415
+
+
+def test_idle_sessions_are_purged(workdir):
+    session = resumable.create("project-file", 1, "a.pdf", 10)
+    assert resumable.purge_idle(max_idle=3600) == 0
+    old = time.time() - 7200
+    for path in (workdir / "sessions").iterdir():
+        os.utime(path, (old, old))
+    assert resumable.purge_idle(max_idle=3600) == 1
+    assert list((workdir / "sessions").iterdir()) == []
+    with pytest.raises(HTTPException) as exc:
+        resumable.get(session["id"])
+    assert exc.value.status_code == 404
+
+
+def test_patch_is_refused_while_another_worker_holds_the_upload(client, workdir):
+    import fcntl
+
+    template_id = make_template(client)
+    location = client.post("/api/admin/uploads", json={
+        "target": "template-video", "target_id": template_id, "filename": "demo.mp4", "length": 10,
+    }).headers["location"]
+    part_path = workdir / "sessions" / f"{location.rsplit('/', 1)[1]}.part"
+    # A separate open file description conflicts with the handler's flock as another process would
+    with open(part_path, "ab") as other_worker:
+        fcntl.flock(other_worker.fileno(), fcntl.LOCK_EX)
+        assert patch(client, location, 0, b"x" * 5).status_code == 409
+        assert client.post(f"{location}/finalize").status_code == 409
+    assert patch(client, location, 0, b"x" * 5).headers["upload-offset"] == "5"
+
+
+def test_stale_staging_files_are_purged(workdir):
+    from app import blobs
+
+    stale, fresh = blobs.staging_path(), blobs.staging_path()
+    stale_dir = blobs.staging_path()
+    stale.write_bytes(b"abandoned")
+    fresh.write_bytes(b"in flight")
+    stale_dir.mkdir()
+    (stale_dir / "render.webp").write_bytes(b"RIFF")
+    old = time.time() - 7200
+    for path in (stale, stale_dir):
+        os.utime(path, (old, old))
+    assert resumable.purge_idle(max_idle=3600) == 2
+    assert not stale.exists() and not stale_dir.exists()
+    assert fresh.exists()
+
+
+def test_disconnect_reports_the_kept_offset(client, workdir):
+    import asyncio
+    from starlette.requests import Request
+    from app.api.admin import append_upload
+
+    template_id = make_template(client)
+    location = client.post("/api/admin/uploads", json={
+        "target": "template-video", "target_id": template_id, "filename": "demo.mp4", "length": 10,
+    }).headers["location"]
+    messages = iter([
+        {"type": "http.request", "body": b"x" * 4, "more_body": True},
+        {"type": "http.disconnect"},
+    ])
+
+    async def receive():
+        return next(messages)
+
+    request = Request({
+        "type": "http", "method": "PATCH", "path": location,
+        "headers": [(b"content-type", b"application/offset+octet-stream")],
+    }, receive)
+    response = asyncio.run(append_upload(location.rsplit("/", 1)[1], request, upload_offset=0, current_admin=None))
+    assert response.status_code == 204
+    assert response.headers["upload-offset"] == "4"
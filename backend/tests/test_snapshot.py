@@ -0,0 +1,72 @@
+"""
+Tests for the static catalog snapshot exporter
+"""
+
+import json
+
+from app import snapshot
+from app.snapshot import current_version, export_snapshot, list_versions, read_manifest
+
+
+def seed(client):
+    client.post("/api/admin/projects", json={
+        "title": "P", "slug": "rubber-tapping", "description": "d", "full_description": "f",
+    })
+    client.post("/api/admin/projects", json={
+        "title": "Sneaky", "slug": "../escape", "description": "d", "full_description": "f",
+    })
+    response = client.post("/api/admin/project-templates", json={
+        "title": "T", "category": "iot", "description": "d", "time_duration": "1w", "tech_stack": ["C"],
+    })
+    return response.json()["id"]
+
+
+def test_export_matches_api_responses(client, db_session, tmp_path):
+    template_id = seed(client)
+    manifest = export_snapshot(db_session, root=tmp_path)
+
+    current = tmp_path / "current"
+    assert current_version(tmp_path) == manifest["version"]
+    for path in ("projects", "projects/rubber-tapping", f"project-templates/{template_id}",
+                 "project-templates/categories/list", "bundle/home"):
+        assert json.loads((current / f"{path}.json").read_bytes()) == client.get(f"/api/{path}").json()
+    assert not (current / "escape.json").exists()
+    assert not (tmp_path / "escape.json").exists()
+    assert sorted(path.name for path in (current / "projects").glob("*.json")) == ["rubber-tapping.json"]
+    assert "/api/mission" not in manifest["files"]
+    assert read_manifest(tmp_path) == manifest
+
+
+def test_current_pointer_moves_and_old_versions_are_pruned(db_session, tmp_path):
+    versions = [export_snapshot(db_session, root=tmp_path, keep=2)["version"] for _ in range(3)]
+    assert list_versions(tmp_path) == versions[1:]
+    assert current_version(tmp_path) == versions[-1]
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_admin_job_publishes_snapshot(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot.settings, "SNAPSHOT_DIR", str(tmp_path))
+    response = client.post("/api/admin/snapshots")
+    assert response.status_code == 201
+    assert client.get("/api/admin/snapshots").json() == {
+        "current": response.json()["version"], "versions": [response.json()["version"]],
+    }
+
+
+def test_slugs_needing_quoting_are_served_by_the_mount(client, db_session, tmp_path):
+    from urllib.parse import quote
+    from fastapi.testclient import TestClient
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+    from app.compression import PrecompressedStaticFiles
+
+    slug = "50% off? #1 deal"
+    client.post("/api/admin/projects", json={"title": "P", "slug": slug, "description": "d", "full_description": "f"})
+    manifest = export_snapshot(db_session, root=tmp_path)
+
+    path = f"projects/{quote(slug)}"
+    assert manifest["files"][f"/api/{path}"]["file"] == f"projects/{slug}.json"
+    mount = Starlette(routes=[Mount("/snapshots", PrecompressedStaticFiles(directory=tmp_path))])
+    response = TestClient(mount).get(f"/snapshots/current/{path}.json")
+    assert response.status_code == 200
+    assert response.json() == client.get(f"/api/{path}").json()
@@ -0,0 +1,127 @@
+"""
+Tests for storage backends and presigned direct uploads
+"""
+
+import hashlib
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlmodel import select
+
+from app import storage
+from app.models import Blob, ProjectFile
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def make_request(client):
+    return client.post("/api/project-request", data={
+        "name": "A", "email": "a@example.com", "phone": "1", "college_company": "C", "custom_description": "d",
+    }).json()["id"]
+
+
+def presign(client, request_id, data, filename="source.zip"):
+    return client.post(f"/api/admin/project-requests/{request_id}/files/presign", json={
+        "filename": filename, "size": len(data), "sha256": hashlib.sha256(data).hexdigest(),
+        "content_type": "application/zip",
+    })
+
+
+def put(client, upload, data):
+    return client.request(upload["method"], upload["url"], content=data, headers=upload["headers"])
+
+
+def test_direct_upload_round_trip(client, db_session, workdir):
+    request_id = make_request(client)
+    data = os.urandom(50_000)
+    digest = hashlib.sha256(data).hexdigest()
+
+    presigned = presign(client, request_id, data).json()
+    assert presigned["key"] == f"blobs/{digest[:2]}/{digest[2:4]}/{digest}.zip"
+    assert presigned["exists"] is False
+    assert put(client, presigned["upload"], data).status_code == 201
+
+    response = client.post(f"/api/admin/project-requests/{request_id}/files/complete", json={
+        "key": presigned["key"], "file_type": "source_code",
+    })
+    assert response.status_code == 200
+    file = response.json()
+    assert file["file_url"] == f"uploads/{presigned['key']}"
+    assert Path(file["file_url"]).read_bytes() == data
+    assert db_session.exec(select(Blob)).one().ref_count == 1
+
+    download = client.get(f"/api/project-files/{file['id']}/download", follow_redirects=False)
+    assert download.status_code == 307
+    fetched = client.get(download.headers["location"])
+    assert fetched.content == data
+    assert fetched.headers["content-disposition"].startswith('attachment; filename="source_code-')
+
+    # Same bytes again: nothing to upload, one more reference
+    again = presign(client, request_id, data, filename="copy.zip").json()
+    assert again["exists"] is True and again["upload"] is None
+    client.post(f"/api/admin/project-requests/{request_id}/files/complete", json={"key": again["key"]})
+    assert db_session.exec(select(Blob)).one().ref_count == 2
+    assert len(db_session.exec(select(ProjectFile)).all()) == 2
+
+
+def test_presigned_put_only_accepts_the_signed_bytes(client, workdir):
+    request_id = make_request(client)
+    data = b"PK\x03\x04 archive"
+    upload = presign(client, request_id, data).json()["upload"]
+
+    assert put(client, upload, b"PK\x03\x04 archivX").status_code == 400
+    assert put(client, upload, data + b"!").status_code == 413
+    assert put(client, {**upload, "url": upload["url"].replace("signature=", "signature=0")}, data).status_code == 403
+    assert not any(path.is_file() for path in (workdir / "uploads").rglob("*"))
+
+    response = client.post(f"/api/admin/project-requests/{request_id}/files/complete", json={
+        "key": presign(client, request_id, data).json()["key"],
+    })
+    assert response.status_code == 409
+
+
+def test_complete_rejects_keys_outside_the_blob_store(client, workdir):
+    request_id = make_request(client)
+    response = client.post(f"/api/admin/project-requests/{request_id}/files/complete", json={"key": "../app.db"})
+    assert response.status_code == 400
+
+
+def test_expired_presigned_url_is_refused(client, workdir):
+    local = storage.LocalStorage()
+    (workdir / "uploads").mkdir()
+    (workdir / "uploads" / "a.txt").write_text("hi")
+    assert client.get(local.presigned_get("a.txt", expires=60)).text == "hi"
+    assert client.get(local.presigned_get("a.txt", expires=-1)).status_code == 403
+
+
+@pytest.mark.skipif(
+    storage.boto3 is None or not os.getenv("S3_ENDPOINT_URL"),
+    reason="needs boto3 and an S3-compatible endpoint (e.g. MinIO) in S3_ENDPOINT_URL",
+)
+def test_s3_presigned_round_trip(tmp_path):
+    import httpx
+
+    s3 = storage.S3Storage(
+        bucket=os.getenv("S3_BUCKET", "aelvynor-test"),
+        endpoint_url=os.environ["S3_ENDPOINT_URL"],
+        region=os.getenv("S3_REGION", "us-east-1"),
+        access_key_id=os.getenv("S3_ACCESS_KEY_ID"),
+        secret_access_key=os.getenv("S3_SECRET_ACCESS_KEY"),
+    )
+    data = os.urandom(10_000)
+    digest = hashlib.sha256(data).hexdigest()
+    key = f"test/{uuid.uuid4().hex}.bin"
+
+    upload = s3.presigned_put(key, digest, len(data), "application/octet-stream", 60)
+    assert httpx.put(upload["url"], content=b"tampered", headers=upload["headers"]).status_code >= 400
+    assert httpx.put(upload["url"], content=data, headers=upload["headers"]).status_code == 200
+    assert s3.size(key) == len(data)
+    assert httpx.get(s3.presigned_get(key, 60, "x.bin")).content == data
+    s3.delete(key)
+    assert not s3.exists(key)
@@ -0,0 +1,82 @@
+"""
+Tests for streaming uploads and the request body limit
+"""
+
+import io
+
+import pytest
+from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.testclient import TestClient
+
+from app.uploads import RequestSizeLimitMiddleware, save_upload
+
+
+class RecordingFile(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        return super().read(size)
+
+
+@pytest.mark.asyncio
+async def test_save_upload_streams_in_chunks(tmp_path):
+    source = RecordingFile(b"x" * 10_000)
+    written = await save_upload(UploadFile(source, filename="a.bin"), tmp_path / "a.bin", max_size=20_000, chunk_size=1024)
+    assert written == 10_000
+    assert (tmp_path / "a.bin").read_bytes() == b"x" * 10_000
+    assert max(source.reads) == 1024
+
+
+@pytest.mark.asyncio
+async def test_save_upload_stops_at_the_limit(tmp_path):
+    source = RecordingFile(b"x" * (3 * 1024 * 1024))
+    with pytest.raises(HTTPException) as error:
+        await save_upload(UploadFile(source, filename="a.bin"), tmp_path / "a.bin", max_size=1024 * 1024, chunk_size=64 * 1024)
+    assert error.value.detail == "File too large (max 1MB)"
+    assert sum(source.reads) <= 1024 * 1024 + 64 * 1024
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_request_body_limit():
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    client = TestClient(RequestSizeLimitMiddleware(app, max_size=4096))
+    assert client.post("/upload", files={"file": ("a.txt", b"x" * 1000)}).json() == {"size": 1000}
+
+    response = client.post("/upload", files={"file": ("a.txt", b"x" * 10_000)})
+    assert response.status_code == 413
+
+    def chunked():
+        yield b"x" * 3000
+        yield b"x" * 3000
+
+    response = client.post("/upload", content=chunked(), headers={"Content-Type": "multipart/form-data; boundary=b"})
+    assert response.status_code == 413
+
+
+def test_template_upload_rejects_oversized_file(client, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    template_id = client.post("/api/admin/project-templates", json={
+        "title": "T", "category": "iot", "description": "d", "time_duration": "1w", "tech_stack": ["C"],
+    }).json()["id"]
+    response = client.post(
+        f"/api/admin/project-templates/{template_id}/upload-image",
+        files={"file": ("shot.png", b"\x89PNG" + b"0" * (11 * 1024 * 1024))},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "File too large (max 10MB)"
+    assert list((tmp_path / "upload-sessions/.incoming").iterdir()) == []
+
+    response = client.post(
+        f"/api/admin/project-templates/{template_id}/upload-image",
+        files={"file": ("shot.png", b"\x89PNG" + b"0" * 1000)},
+    )
+    assert response.status_code == 200
+    assert (tmp_path / response.json()["url"].lstrip("/")).stat().st_size == 1004
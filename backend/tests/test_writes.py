@@ -0,0 +1,66 @@
+"""
+Tests for the single round-trip INSERT/UPDATE ... RETURNING write helpers
+"""
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app import crud
+from app.schemas import ContactCreate, CourseCreate, PaymentCreate, PaymentUpdate, ProjectCreate
+
+
+def count_statements(db_session: Session, fn, *args):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        result = fn(db_session, *args)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return result, statements
+
+
+def test_create_is_one_statement(db_session: Session):
+    contact, statements = count_statements(
+        db_session, crud.create_contact,
+        ContactCreate(name="A", email="a@test.com", phone="1", message="hi")
+    )
+    assert len(statements) == 1
+    assert "RETURNING" in statements[0]
+    assert contact.id is not None
+    assert contact.status == "new"
+    assert contact.created_at is not None
+
+
+def test_update_is_one_statement(db_session: Session):
+    payment = crud.create_payment(db_session, PaymentCreate(user_email="a@test.com", amount=10, purpose="course"))
+
+    updated, statements = count_statements(
+        db_session, crud.update_payment, payment.id, PaymentUpdate(status="completed")
+    )
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE")
+    assert updated.status == "completed"
+    assert updated.amount == 10
+    assert updated.updated_at >= payment.updated_at
+    assert crud.get_payment_by_id(db_session, payment.id).status == "completed"
+
+
+def test_update_missing_row_returns_none(db_session: Session):
+    assert crud.update_course(db_session, 999, CourseCreate(title="t", description="d", level="l", duration="1w")) is None
+
+
+def test_update_project_keeps_image_when_not_given(db_session: Session):
+    project = crud.create_project(db_session, ProjectCreate(
+        title="P", slug="p", description="d", full_description="f", tags=["a"], image="/img.jpg"
+    ))
+    updated = crud.update_project(db_session, project.id, ProjectCreate(
+        title="P2", slug="p", description="d", full_description="f", tags=["b"]
+    ))
+    assert updated.title == "P2"
+    assert updated.image == "/img.jpg"
+    assert updated.tags == ["b"]